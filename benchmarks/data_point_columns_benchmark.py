@@ -0,0 +1,52 @@
+from array import array
+from timeit import Timer
+
+from benchmarks.data_points_encoder_benchmark import (NUMBER_SENSORS,
+                                                      create_configuration)
+from knot_protocol.domain.boundary.output.DTO.data_point import \
+    DataPointFactory
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import \
+    DataPointColumnsFactory
+from knot_protocol.domain.boundary.output.DTO.publishing_data_dto import \
+    PublishingData
+from knot_protocol.infrastructure.adapter.output.DTO.data_points_encoder import \
+    DataPointsEncoder
+
+DEVICE_ID = "1964a231a4d14173"
+TIMESTAMP = "2023-01-21 12:15:00.123456"
+DATA_POINTS = [100, 1000, 10000]
+
+
+def time_per_call(function) -> float:
+    timer = Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    encoder = DataPointsEncoder(config=create_configuration())
+    print(f"{'data points':>12} {'data points (us)':>17} {'columns (us)':>13} {'speedup':>8}")
+    for number_data_points in DATA_POINTS:
+        sensor_ids = array("i", [index % NUMBER_SENSORS + 1 for index in range(number_data_points)])
+        values = array("d", [index * 1.25 for index in range(number_data_points)])
+
+        def publish_data_points():
+            data_points = [
+                DataPointFactory.create(sensor_id=sensor_id, value=value, timestamp=TIMESTAMP)
+                for sensor_id, value in zip(sensor_ids, values)]
+            return encoder.dumps(PublishingData(id=DEVICE_ID, data=data_points))
+
+        def publish_columns():
+            columns = DataPointColumnsFactory.create(sensor_ids=sensor_ids, values=values, timestamps=TIMESTAMP)
+            return encoder.encode_columns(DEVICE_ID, columns)
+
+        assert publish_data_points() == publish_columns()
+        data_points_time = time_per_call(publish_data_points)
+        columns_time = time_per_call(publish_columns)
+        print(
+            f"{number_data_points:>12} {data_points_time * 1e6:>17.1f} "
+            f"{columns_time * 1e6:>13.1f} {data_points_time / columns_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from time import perf_counter
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.knot_amqp_options import \
+    KNoTValueType
+from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO
+from knot_protocol.domain.usecase.data_point_validator import (
+    DataPointValidator, ValidationMode)
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DataPointSchema
+
+NUMBER_SENSORS = 20
+NUMBER_DATA_POINTS = 100000
+ITERATIONS = 5
+
+
+def create_config():
+    return [
+        ConfigurationDTO(
+            sensor_id=sensor_id,
+            schema=SchemaDTO(value_type=KNoTValueType.FLOAT.value, unit=0, type_id=65521, name="temperature"),
+            event=None)
+        for sensor_id in range(1, NUMBER_SENSORS + 1)]
+
+
+def create_data_points():
+    return [
+        DataPointDTO(sensor_id=index % NUMBER_SENSORS + 1, value=index * 1.25, timestamp="2023-01-21 12:15:00.123456")
+        for index in range(NUMBER_DATA_POINTS)]
+
+
+def measure(function):
+    start_time = perf_counter()
+    for _ in range(ITERATIONS):
+        function()
+    return (perf_counter() - start_time) / ITERATIONS
+
+
+def main():
+    config = create_config()
+    data_points = create_data_points()
+    data_point_schema = DataPointSchema(many=True)
+    serialized_data_points = data_point_schema.dump(data_points)
+    print(f"{'validation':>32} {'time (ms)':>10}")
+    for name, function in [
+            ("DataPointSchema.validate", lambda: data_point_schema.validate(serialized_data_points)),
+            ("DataPointSchema dump + validate",
+             lambda: data_point_schema.validate(data_point_schema.dump(data_points))),
+            ("DataPointValidator strict", lambda: DataPointValidator(config=config).validate(data_points)),
+            ("DataPointValidator coerce",
+             lambda: DataPointValidator(config=config, mode=ValidationMode.coerce).validate(data_points))]:
+        print(f"{name:>32} {measure(function) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
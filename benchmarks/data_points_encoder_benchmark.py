@@ -0,0 +1,60 @@
+from timeit import Timer
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.event import Event
+from knot_protocol.domain.boundary.output.DTO.publishing_data_dto import \
+    PublishingData
+from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO
+from knot_protocol.infrastructure.adapter.output.DTO.data_points_encoder import \
+    DataPointsEncoder
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DataPointsSchema
+
+DATA_POINTS = [1, 10, 1000]
+NUMBER_SENSORS = 20
+
+
+def create_configuration():
+    return [
+        ConfigurationDTO(
+            sensor_id=sensor_id,
+            schema=SchemaDTO(value_type=2, unit=0, type_id=65521, name="temperature"),
+            event=Event(change=True, time_seconds=5, lower_threshold=1.6, upper_threshold=89.2))
+        for sensor_id in range(1, NUMBER_SENSORS + 1)]
+
+
+def create_data(number_data_points: int) -> PublishingData:
+    return PublishingData(
+        id="1964a231a4d14173",
+        data=[
+            DataPointDTO(
+                sensor_id=index % NUMBER_SENSORS + 1,
+                value=index * 1.25,
+                timestamp="2023-01-21 12:15:00.123456")
+            for index in range(number_data_points)])
+
+
+def time_per_call(function, data) -> float:
+    timer = Timer(lambda: function(data))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    schema = DataPointsSchema()
+    encoder = DataPointsEncoder(config=create_configuration())
+    print(f"{'data points':>12} {'marshmallow (us)':>18} {'encoder (us)':>14} {'speedup':>8}")
+    for number_data_points in DATA_POINTS:
+        data = create_data(number_data_points)
+        assert encoder.dumps(data) == schema.dumps(data).encode("utf-8")
+        marshmallow_time = time_per_call(lambda value: str(schema.dumps(value)), data)
+        encoder_time = time_per_call(encoder.dumps, data)
+        print(
+            f"{number_data_points:>12} {marshmallow_time * 1e6:>18.1f} "
+            f"{encoder_time * 1e6:>14.1f} {marshmallow_time / encoder_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import yaml
+
+from knot_protocol.infrastructure.adapter.output.repositories.device_codecs import (
+    CODECS, msgpack, read_file, write_file)
+
+NUMBER_SENSORS = 500
+ITERATIONS = 20
+
+
+def create_device_content():
+    return {
+        "id": "1964a231a4d14173",
+        "name": "benchmark_thing",
+        "state": "disconnected",
+        "error": "",
+        "token": "5b67ce6b-ef21-7013-3115-2d6297e1bd2b",
+        "config": [{
+            "sensorId": sensor_id,
+            "schema": {"typeId": 65521, "unit": 0, "valueType": 2, "name": "temperature"},
+            "event": {"change": True, "timeSec": 5, "lowerThreshold": 1.6, "upperThreshold": 89.2}}
+            for sensor_id in range(1, NUMBER_SENSORS + 1)]}
+
+
+def measure(function):
+    start_time = perf_counter()
+    for _ in range(ITERATIONS):
+        function()
+    return (perf_counter() - start_time) / ITERATIONS
+
+
+def load_pure_python_yaml(filepath):
+    with open(filepath, "r", encoding="utf-8") as file_reader:
+        return yaml.safe_load(file_reader)
+
+
+def main():
+    content = create_device_content()
+    print(f"{'format':>18} {'load (ms)':>10}")
+    with TemporaryDirectory() as directory:
+        yaml_filepath = str(Path(directory) / "device.yaml")
+        write_file(yaml_filepath, content)
+        print(f"{'yaml (safe_load)':>18} {measure(lambda: load_pure_python_yaml(yaml_filepath)) * 1000:>10.2f}")
+        for extension in [".yaml", ".json", ".msgpack"]:
+            if extension == ".msgpack" and msgpack is None:
+                continue
+            filepath = str(Path(directory) / f"device{extension}")
+            write_file(filepath, content)
+            name = f"{extension[1:]} ({type(CODECS[extension]).__name__})"
+            print(f"{name:>18} {measure(lambda: read_file(filepath)) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
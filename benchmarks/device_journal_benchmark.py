@@ -0,0 +1,43 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.device_repository_benchmark import create_devices
+from knot_protocol.domain.usecase.states import (AUTHENTICATED_STATE,
+                                                 READY_STATE,
+                                                 REGISTERED_STATE)
+from knot_protocol.infrastructure.adapter.output.repositories.device_file_repository import \
+    DeviceFileRepository
+from knot_protocol.infrastructure.adapter.output.repositories.journaled_device_repository import \
+    JournaledDeviceRepository
+
+NUMBER_SENSORS = 100
+NUMBER_TRANSITIONS = 3000
+STATES = [REGISTERED_STATE, AUTHENTICATED_STATE, READY_STATE]
+
+
+def measure(repository, device, persist):
+    start_time = perf_counter()
+    for index in range(NUMBER_TRANSITIONS):
+        device.state = STATES[index % len(STATES)]
+        persist(repository, device)
+    return (perf_counter() - start_time) / NUMBER_TRANSITIONS
+
+
+def main():
+    device, = create_devices(1, number_sensors=NUMBER_SENSORS)
+    print(f"{'repository':>28} {'per transition (us)':>20}")
+    with TemporaryDirectory() as directory:
+        for name, repository, persist in [
+                ("DeviceFileRepository.save", DeviceFileRepository(filepath=str(Path(directory) / "device.yaml")),
+                 DeviceFileRepository.save),
+                ("JournaledDeviceRepository", JournaledDeviceRepository(filepath=str(Path(directory) / "journal.yaml")),
+                 JournaledDeviceRepository.record)]:
+            elapsed_time = measure(repository, device, persist)
+            print(f"{name:>28} {elapsed_time * 1e6:>20.1f}")
+            if isinstance(repository, JournaledDeviceRepository):
+                repository.close()
+
+
+if __name__ == "__main__":
+    main()
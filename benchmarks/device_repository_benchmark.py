@@ -0,0 +1,76 @@
+import gc
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DeviceSchema
+from knot_protocol.infrastructure.adapter.output.repositories.device_file_repository import \
+    DeviceFileRepository
+from knot_protocol.infrastructure.adapter.output.repositories.sqlite_device_repository import \
+    SQLiteDeviceRepository
+
+NUMBER_DEVICES = [10000, 50000, 100000]
+NUMBER_SENSORS = 4
+
+
+def create_devices(number_devices, number_sensors=NUMBER_SENSORS):
+    schema = DeviceSchema()
+    return [
+        schema.load({
+            "id": f"{device_index:016x}",
+            "name": f"thing_{device_index:08d}",
+            "state": "disconnected",
+            "error": "",
+            "token": "5b67ce6b-ef21-7013-3115-2d6297e1bd2b",
+            "config": [{
+                "sensorId": sensor_id,
+                "schema": {"typeId": 65521, "unit": 0, "valueType": 2, "name": "temperature"},
+                "event": {"change": True, "timeSec": 5, "lowerThreshold": 1.6, "upperThreshold": 89.2}}
+                for sensor_id in range(1, number_sensors + 1)]})
+        for device_index in range(number_devices)]
+
+
+def measure(function):
+    gc.collect()
+    start_time = perf_counter()
+    devices = function()
+    elapsed_time = perf_counter() - start_time
+    return len(devices), elapsed_time
+
+
+def load_yaml_files(directory):
+    return [DeviceFileRepository(filepath=str(filepath)).load() for filepath in sorted(directory.glob("*.yaml"))]
+
+
+def load_sqlite(filepath):
+    repository = SQLiteDeviceRepository(filepath=filepath)
+    devices = repository.load_all()
+    repository.close()
+    return devices
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or NUMBER_DEVICES
+    print(f"{'devices':>8} {'yaml files (s)':>15} {'sqlite (s)':>11} {'speedup':>8}")
+    for number_devices in sizes:
+        devices = create_devices(number_devices)
+        with TemporaryDirectory() as directory:
+            yaml_directory = Path(directory) / "yaml"
+            yaml_directory.mkdir()
+            for device in devices:
+                DeviceFileRepository(filepath=str(yaml_directory / f"{device.device_id}.yaml")).save(device)
+            sqlite_filepath = str(Path(directory) / "devices.db")
+            repository = SQLiteDeviceRepository(filepath=sqlite_filepath)
+            repository.save_many(devices)
+            repository.close()
+            del devices
+            yaml_devices, yaml_time = measure(lambda: load_yaml_files(yaml_directory))
+            sqlite_devices, sqlite_time = measure(lambda: load_sqlite(sqlite_filepath))
+            assert yaml_devices == sqlite_devices == number_devices
+        print(f"{number_devices:>8} {yaml_time:>15.2f} {sqlite_time:>11.2f} {yaml_time / sqlite_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
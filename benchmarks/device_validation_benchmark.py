@@ -0,0 +1,48 @@
+from time import perf_counter
+
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DeviceSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_validation_cache import (
+    DEVICE_SCHEMA, DeviceValidationCache)
+
+NUMBER_DEVICES = 5000
+NUMBER_SENSORS = 20
+
+
+def create_contents():
+    return [
+        {
+            "id": f"{device_index:016x}",
+            "name": f"thing_{device_index:08d}",
+            "state": "disconnected",
+            "error": "",
+            "token": "5b67ce6b-ef21-7013-3115-2d6297e1bd2b",
+            "config": [{
+                "sensorId": sensor_id,
+                "schema": {"typeId": 65521, "unit": 0, "valueType": 2, "name": "temperature"},
+                "event": {"change": True, "timeSec": 5, "lowerThreshold": 1.6, "upperThreshold": 89.2}}
+                for sensor_id in range(1, NUMBER_SENSORS + 1)]}
+        for device_index in range(NUMBER_DEVICES)]
+
+
+def measure(contents, load):
+    start_time = perf_counter()
+    for content in contents:
+        load(content)
+    return perf_counter() - start_time
+
+
+def main():
+    contents = create_contents()
+    validation_cache = DeviceValidationCache(max_size=NUMBER_DEVICES)
+    print(f"{'load':>30} {'time (s)':>9}")
+    for name, load in [
+            ("DeviceSchema() per device", lambda content: DeviceSchema().load(content)),
+            ("shared DeviceSchema", DEVICE_SCHEMA.load),
+            ("validation cache (changed)", validation_cache.load),
+            ("validation cache (unchanged)", validation_cache.load)]:
+        print(f"{name:>30} {measure(contents, load):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Union
+
+from knot_protocol.domain.boundary.output.DTO.data_point import \
+    DataPointFactory
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationFactory
+from knot_protocol.domain.boundary.output.DTO.event import EventFactory
+from knot_protocol.domain.boundary.output.DTO.schema import SchemaFactory
+from knot_protocol.domain.entities.device_entity import DeviceEntity
+from knot_protocol.domain.usecase.states import DISCONNECTED_STATE
+
+NUMBER_DEVICES = 10000
+NUMBER_SENSORS = 20
+NUMBER_DATA_POINTS = 1000000
+
+
+# Baseline: the DTOs as they were before slots and interning.
+@dataclass(frozen=True)
+class PlainSchemaDTO:
+    value_type: int
+    unit: int
+    type_id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PlainEvent:
+    change: bool
+    time_seconds: int
+    lower_threshold: Union[float, int]
+    upper_threshold: Union[float, int]
+
+
+@dataclass(frozen=True)
+class PlainConfigurationDTO:
+    sensor_id: int
+    schema: PlainSchemaDTO
+    event: PlainEvent
+
+
+@dataclass(frozen=True)
+class PlainDataPointDTO:
+    sensor_id: int
+    value: Union[float, int]
+    timestamp: Union[str, float, int]
+
+
+def create_plain_devices():
+    return [
+        DeviceEntity(
+            device_id=f"{device_index:016x}",
+            name=f"thing_{device_index}",
+            config=[
+                PlainConfigurationDTO(
+                    sensor_id=sensor_id,
+                    schema=PlainSchemaDTO(value_type=2, unit=0, type_id=65521, name="temperature"),
+                    event=PlainEvent(
+                        change=True, time_seconds=5, lower_threshold=1.6, upper_threshold=89.2))
+                for sensor_id in range(1, NUMBER_SENSORS + 1)],
+            state=DISCONNECTED_STATE)
+        for device_index in range(NUMBER_DEVICES)]
+
+
+def create_plain_data_points():
+    return [
+        PlainDataPointDTO(
+            sensor_id=index % NUMBER_SENSORS + 1,
+            value=index * 1.25,
+            timestamp="2023-01-21 12:15:00.123456")
+        for index in range(NUMBER_DATA_POINTS)]
+
+
+def create_devices():
+    return [
+        DeviceEntity(
+            device_id=f"{device_index:016x}",
+            name=f"thing_{device_index}",
+            config=[
+                ConfigurationFactory.create(
+                    sensor_id=sensor_id,
+                    schema=SchemaFactory.create(value_type=2, unit=0, type_id=65521, name="temperature"),
+                    event=EventFactory.create(
+                        change=True, time_seconds=5, lower_threshold=1.6, upper_threshold=89.2))
+                for sensor_id in range(1, NUMBER_SENSORS + 1)],
+            state=DISCONNECTED_STATE)
+        for device_index in range(NUMBER_DEVICES)]
+
+
+def create_data_points():
+    return [
+        DataPointFactory.create(
+            sensor_id=index % NUMBER_SENSORS + 1,
+            value=index * 1.25,
+            timestamp="2023-01-21 12:15:00.123456")
+        for index in range(NUMBER_DATA_POINTS)]
+
+
+def measure(function):
+    gc.collect()
+    start_time = perf_counter()
+    objects = function()
+    elapsed_time = perf_counter() - start_time
+    del objects
+    gc.collect()
+    tracemalloc.start()
+    objects = function()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated, elapsed_time
+
+
+def main():
+    print(f"{'workload':>30} {'before (MiB)':>13} {'after (MiB)':>12} {'before (s)':>11} {'after (s)':>10}")
+    for name, before_function, after_function in [
+            (f"{NUMBER_DEVICES} devices x {NUMBER_SENSORS} sensors", create_plain_devices, create_devices),
+            (f"{NUMBER_DATA_POINTS} data points", create_plain_data_points, create_data_points)]:
+        before_allocated, before_time = measure(before_function)
+        after_allocated, after_time = measure(after_function)
+        print(
+            f"{name:>30} {before_allocated / 2 ** 20:>13.1f} {after_allocated / 2 ** 20:>12.1f}"
+            f" {before_time:>11.2f} {after_time:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import json
+from time import perf_counter
+
+from pika.spec import Basic
+
+from knot_protocol.infrastructure.adapter.input.rpc_client import (
+    AMQPRPCClient, AMQPRPCSubscriber)
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    AMQPSubscriber, AuthCallback, RegisterCallback)
+from knot_protocol.infrastructure.utils.knot_amqp_options import \
+    KNoTRoutingKey
+from knot_protocol.infrastructure.utils.logger import logger_factory
+
+NUMBER_OPERATIONS = 2000
+ROUND_TRIP_TIME = 0.002
+ACK_BATCH_SIZES = [1, 16]
+DEVICE_ID = "1964a231a4d14173"
+TOKEN = "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
+
+
+class SimulatedBrokerConnection:
+    def __init__(self, channel) -> None:
+        self.channel = channel
+        self.is_open = True
+        self.is_closed = False
+
+    def process_data_events(self, time_limit=0):
+        self.channel.deliver()
+
+
+class SimulatedBrokerChannel:
+    def __init__(self, round_trip_time: float = ROUND_TRIP_TIME) -> None:
+        self.is_open = True
+        self.connection = SimulatedBrokerConnection(self)
+        self.round_trip_time = round_trip_time
+        self.round_trips = 0
+        self.ack_frames = 0
+        self.messages = []
+        self.consumers = {}
+        self.__delivery_tag = 0
+
+    @property
+    def network_time(self) -> float:
+        return self.round_trips * self.round_trip_time
+
+    def publish(self, routing_key, body):
+        self.messages.append((routing_key, body))
+
+    def queue_declare(self, queue, auto_delete=False):
+        self.round_trips += 1
+
+    def queue_bind(self, queue, exchange, routing_key=None):
+        self.round_trips += 1
+
+    def queue_delete(self, queue, if_unused=False, if_empty=False):
+        self.round_trips += 1
+
+    def basic_consume(self, queue, on_message_callback):
+        self.round_trips += 1
+        consumer_tag = f"consumer_{len(self.consumers)}"
+        self.consumers[consumer_tag] = on_message_callback
+        return consumer_tag
+
+    def basic_cancel(self, consumer_tag):
+        self.round_trips += 1
+        self.consumers.pop(consumer_tag)
+
+    def consume(self, queue, inactivity_timeout=None):
+        self.round_trips += 1
+        while self.messages:
+            yield self.__next_message()
+        yield None, None, None
+
+    def cancel(self):
+        self.round_trips += 1
+
+    def deliver(self):
+        while self.messages:
+            method, properties, body = self.__next_message()
+            for callback in list(self.consumers.values()):
+                callback(self, method, properties, body)
+
+    def basic_ack(self, delivery_tag=0, multiple=False):
+        self.ack_frames += 1
+
+    def basic_nack(self, delivery_tag=0, multiple=False, requeue=True):
+        self.ack_frames += 1
+
+    def __next_message(self):
+        self.__delivery_tag += 1
+        routing_key, body = self.messages.pop(0)
+        return Basic.Deliver(delivery_tag=self.__delivery_tag, routing_key=routing_key), None, body
+
+
+def auth_subscriber(channel):
+    callback = AuthCallback()
+    callback.device_id = DEVICE_ID
+    return AMQPSubscriber(
+        channel=channel,
+        queue_name=f"device_auth_queue_{DEVICE_ID}",
+        logger=logger_factory(),
+        callback=callback,
+        routing_key="device-auth-rpc",
+        timeout=1)
+
+
+def authenticate(channel, long_lived):
+    subscriber = auth_subscriber(channel)
+    if long_lived:
+        subscriber.start_consuming()
+    response = json.dumps({"id": DEVICE_ID, "error": None}).encode("utf-8")
+    for _ in range(NUMBER_OPERATIONS):
+        with subscriber:
+            channel.publish("device-auth-rpc", response)
+            subscriber.subscribe()
+    if long_lived:
+        subscriber.stop_consuming()
+
+
+def register(channel, ack_batch_size):
+    client = AMQPRPCClient(channel=channel, logger=logger_factory(), ack_batch_size=ack_batch_size)
+    client.start()
+    subscribers = []
+    for index in range(NUMBER_OPERATIONS):
+        callback = RegisterCallback(token="")
+        callback.device_id = f"{index:016x}"
+        subscribers.append(AMQPRPCSubscriber(
+            client=client,
+            logger=logger_factory(),
+            callback=callback,
+            routing_key=KNoTRoutingKey.registered_device.value,
+            timeout=1))
+    for subscriber in subscribers:
+        response = {"id": subscriber.callback.device_id, "name": "thing", "token": TOKEN, "error": None}
+        channel.publish(KNoTRoutingKey.registered_device.value, json.dumps(response).encode("utf-8"))
+    for subscriber in subscribers:
+        with subscriber:
+            subscriber.subscribe()
+    client.stop()
+    assert all(subscriber.callback.token == TOKEN for subscriber in subscribers)
+
+
+def main():
+    scenarios = [
+        ("consumer per operation", lambda channel: authenticate(channel, long_lived=False)),
+        ("long-lived consumer", lambda channel: authenticate(channel, long_lived=True))]
+    scenarios.extend(
+        (f"rpc client, {ack_batch_size} acks/batch", lambda channel, size=ack_batch_size: register(channel, size))
+        for ack_batch_size in ACK_BATCH_SIZES)
+    print(f"round trip time: {ROUND_TRIP_TIME * 1e3:.1f} ms, operations: {NUMBER_OPERATIONS}")
+    print(f"{'scenario':>26} {'round trips/op':>15} {'acks/op':>8} {'network (ms/op)':>16} {'cpu (us/op)':>12}")
+    for name, scenario in scenarios:
+        channel = SimulatedBrokerChannel()
+        start_time = perf_counter()
+        scenario(channel)
+        cpu_time = perf_counter() - start_time
+        print(
+            f"{name:>26} {channel.round_trips / NUMBER_OPERATIONS:>15.3f} "
+            f"{channel.ack_frames / NUMBER_OPERATIONS:>8.3f} "
+            f"{channel.network_time / NUMBER_OPERATIONS * 1e3:>16.3f} "
+            f"{cpu_time / NUMBER_OPERATIONS * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any
+
+from knot_protocol.domain.boundary.input.subscriber import Subscriber
+from knot_protocol.domain.boundary.output.publisher import Publisher
+from knot_protocol.domain.entities.device_factory import DeviceFactory
+from knot_protocol.infrastructure.adapter.output.DTO.device_auth_request_DTO import \
+    DeviceAuthRequestSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_registration_request_DTO import \
+    DeviceRegistrationRequestSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DataPointsSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_unregistration_request_dto import \
+    DeviceUnregistrationRequestDTO
+from knot_protocol.infrastructure.adapter.output.DTO.update_config_schema import \
+    UpdateConfigRequestSchema
+
+NUMBER_DEVICES = [1000, 10000, 50000]
+
+
+class NullPublisher(Publisher):
+    def publish(self):
+        return True
+
+
+class NullSubscriber(Subscriber):
+    def subscribe(self):
+        return
+
+    def unsubscribe(self):
+        return
+
+
+# Baseline: the state graph that used to be built for every device.
+@dataclass
+class PerDeviceCommonOperation:
+    device: Any
+    unregister_subscriber: Any
+    unregister_publisher: Any
+    unregister_serializer: Any
+    unregister_state: Any
+    register_subscriber: Any
+    register_publisher: Any
+    register_serializer: Any
+    register_state: Any
+
+
+@dataclass
+class PerDeviceDisconnectedState:
+    authenticate_subscriber: Any
+    authenticate_publisher: Any
+    registered_state: Any
+    authenticated: Any
+    authenticate_serializer: Any
+    common_operation: Any
+    device: Any = None
+
+
+@dataclass
+class PerDeviceRegisteredState:
+    publisher: Any
+    subscriber: Any
+    request_serializer: Any
+    authenticated: Any
+    common_operation: Any
+    device: Any = None
+
+
+@dataclass
+class PerDeviceUnregisteredState:
+    common_operation: Any
+    device: Any = None
+
+
+@dataclass
+class PerDeviceAuthenticatedState:
+    publisher: Any
+    subscriber: Any
+    request_serializer: Any
+    updated_schema_state: Any
+    common_operation: Any
+    device: Any = None
+
+
+@dataclass
+class PerDeviceUpdatedSchemaState:
+    ready_state: Any
+    common_operation: Any
+    device: Any = None
+
+
+@dataclass
+class PerDeviceReadyState:
+    publisher: Any
+    publisher_serializer: Any
+    common_operation: Any
+    device: Any = None
+
+
+def per_device_state_machine(device, adapters: dict):
+    common_operation = PerDeviceCommonOperation(
+        device=device,
+        unregister_subscriber=adapters["unregister_subscriber"],
+        unregister_publisher=adapters["unregister_publisher"],
+        unregister_serializer=adapters["unregister_serializer"],
+        unregister_state=None,
+        register_subscriber=adapters["register_subscriber"],
+        register_publisher=adapters["register_publisher"],
+        register_serializer=adapters["register_serializer"],
+        register_state=None)
+    ready_state = PerDeviceReadyState(
+        publisher=adapters["data_publisher"],
+        publisher_serializer=adapters["publisher_serializer"],
+        common_operation=common_operation)
+    updated_schema_state = PerDeviceUpdatedSchemaState(
+        ready_state=ready_state,
+        common_operation=common_operation)
+    authenticated_state = PerDeviceAuthenticatedState(
+        publisher=adapters["update_config_publisher"],
+        subscriber=adapters["update_config_subscriber"],
+        request_serializer=adapters["update_config_serializer"],
+        updated_schema_state=updated_schema_state,
+        common_operation=common_operation)
+    registered_state = PerDeviceRegisteredState(
+        publisher=adapters["auth_publisher"],
+        subscriber=adapters["auth_subscriber"],
+        request_serializer=adapters["device_auth_serializer"],
+        authenticated=authenticated_state,
+        common_operation=common_operation)
+    common_operation.unregister_state = PerDeviceUnregisteredState(
+        common_operation=common_operation)
+    return PerDeviceDisconnectedState(
+        authenticate_subscriber=adapters["auth_subscriber"],
+        authenticate_publisher=adapters["auth_publisher"],
+        registered_state=registered_state,
+        authenticated=authenticated_state,
+        authenticate_serializer=adapters["device_auth_serializer"],
+        common_operation=common_operation,
+        device=device)
+
+
+def create_adapters():
+    publisher = NullPublisher()
+    subscriber = NullSubscriber()
+    return {
+        "register_subscriber": subscriber,
+        "auth_subscriber": subscriber,
+        "update_config_subscriber": subscriber,
+        "unregister_subscriber": subscriber,
+        "register_publisher": publisher,
+        "auth_publisher": publisher,
+        "update_config_publisher": publisher,
+        "data_publisher": publisher,
+        "unregister_publisher": publisher,
+        "unregister_serializer": DeviceUnregistrationRequestDTO(),
+        "register_serializer": DeviceRegistrationRequestSchema(),
+        "update_config_serializer": UpdateConfigRequestSchema(),
+        "device_auth_serializer": DeviceAuthRequestSchema(),
+        "publisher_serializer": DataPointsSchema()}
+
+
+def create_devices(number_devices: int, adapters: dict):
+    return [
+        DeviceFactory.create(
+            device_id=f"{index:016x}",
+            name=f"thing_{index}",
+            schema=[],
+            amqp_generator=None,
+            **adapters)
+        for index in range(number_devices)]
+
+
+def create_per_device_state_machines(number_devices: int, adapters: dict):
+    devices = create_devices(number_devices, adapters)
+    for device in devices:
+        device.adapters = None
+        device.state = per_device_state_machine(device, adapters)
+    return devices
+
+
+def bytes_per_device(create, number_devices: int) -> float:
+    adapters = create_adapters()
+    gc.collect()
+    tracemalloc.start()
+    devices = create(number_devices, adapters)
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del devices
+    return allocated / number_devices
+
+
+def main():
+    print(f"{'devices':>8} {'before':>8} {'after':>8}  (bytes per device)")
+    for number_devices in NUMBER_DEVICES:
+        before = bytes_per_device(create_per_device_state_machines, number_devices)
+        after = bytes_per_device(create_devices, number_devices)
+        print(f"{number_devices:>8} {before:>8.0f} {after:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
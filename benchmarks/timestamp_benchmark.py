@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from time import perf_counter
+
+from knot_protocol.infrastructure.adapter.output.DTO.timestamp_formatter import \
+    TimestampFormatter
+
+NUMBER_TIMESTAMPS = 200000
+READINGS_PER_SECOND = 1000
+START_TIME = 1674303300.0
+
+
+def measure(function, timestamps):
+    start_time = perf_counter()
+    for timestamp in timestamps:
+        function(timestamp)
+    return (perf_counter() - start_time) / len(timestamps)
+
+
+def main():
+    timestamps = [START_TIME + index / READINGS_PER_SECOND for index in range(NUMBER_TIMESTAMPS)]
+    formatter = TimestampFormatter()
+    assert all(
+        formatter.format(timestamp) == str(datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None))
+        for timestamp in timestamps[:READINGS_PER_SECOND])
+    print(f"{'formatting':>32} {'per timestamp (ns)':>19}")
+    for name, function in [
+            ("str(datetime.utcnow())", lambda _: str(datetime.utcnow())),
+            ("str(datetime.fromtimestamp(t))",
+             lambda timestamp: str(datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None))),
+            ("TimestampFormatter.format(t)", formatter.format)]:
+        print(f"{name:>32} {measure(function, timestamps) * 1e9:>19.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,24 @@
 from knot_protocol.infrastructure.adapter.output.repositories.device_file_repository import \
     DeviceFileRepository
+from knot_protocol.infrastructure.adapter.output.repositories.sqlite_outbox import SQLiteOutbox
+from knot_protocol.infrastructure.adapter.output.repositories.sqlite_device_repository import \
+    SQLiteDeviceRepository
+from knot_protocol.infrastructure.adapter.output.repositories.journaled_device_repository import \
+    JournaledDeviceRepository
+from knot_protocol.infrastructure.adapter.output.DTO.device_validation_cache import \
+    DeviceValidationCache
+from knot_protocol.infrastructure.adapter.output.outbox_publisher import OutboxPublisher
 from knot_protocol.domain.entities.device_factory import DeviceFactory
 from knot_protocol.domain.entities.device_entity import DeviceEntity
 from knot_protocol.domain.boundary.output.DTO.schema import SchemaFactory
 from knot_protocol.domain.boundary.output.DTO.event import EventFactory
 from knot_protocol.domain.boundary.output.DTO.data_point import DataPointFactory
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import DataPointColumnsFactory
+from knot_protocol.domain.usecase.data_point_buffer import DataPointBuffer
+from knot_protocol.domain.usecase.emission_filter import EmissionFilter
+from knot_protocol.domain.usecase.data_point_validator import DataPointValidator, ValidationMode
+from knot_protocol.domain.usecase.onboarding import OnboardingDriver
+from knot_protocol.domain.usecase.knot_thing import DeviceStatus, KNoTThingManager
 from knot_protocol.domain.boundary.output.DTO.device_configuration import ConfigurationFactory
 from knot_protocol.domain.boundary.output.DTO.knot_amqp_options import KNoTValueType
 from knot_protocol.infrastructure.adapter.output.DTO.device_registration_request_DTO import \
@@ -13,8 +27,18 @@ from knot_protocol.infrastructure.adapter.output.DTO.device_auth_request_DTO imp
     DeviceAuthRequestSchema
 from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
     DataPointsSchema
+from knot_protocol.infrastructure.adapter.output.DTO.data_points_encoder import \
+    DataPointsEncoder
 from knot_protocol.infrastructure.adapter.output.DTO.update_config_schema import \
     UpdateConfigRequestSchema
 from knot_protocol.infrastructure.adapter.output.DTO.device_unregistration_request_dto import DeviceUnregistrationRequestDTO
-from knot_protocol.infrastructure.adapter.input.amqp_setup import amqp_data_management_setup
+from knot_protocol.infrastructure.adapter.input.amqp_setup import (
+    amqp_data_management_setup, amqp_publisher_channel_factory, amqp_rpc_client_factory)
+from knot_protocol.infrastructure.adapter.input.rpc_client import AMQPRPCClient
+from knot_protocol.infrastructure.adapter.input.control_consumer import AMQPControlConsumer
+from knot_protocol.infrastructure.adapter.output.background_publisher import (
+    BackgroundPublisher, OverflowPolicy)
+from knot_protocol.infrastructure.adapter.input.amqp_connection_pool import AMQPConnectionPool
+from knot_protocol.infrastructure.adapter.input.amqp_connection_supervisor import AMQPConnectionSupervisor
+from knot_protocol.infrastructure.adapter.input.async_amqp_setup import amqp_async_data_management_setup
 from knot_protocol.infrastructure.utils.logger import logger_factory
\ No newline at end of file
@@ -2,11 +2,11 @@ from dataclasses import dataclass
 from typing import Union
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataPointDTO:
     sensor_id: int
     value: Union[float, int]
-    timestamp: str
+    timestamp: Union[str, float, int]
 
 
 class DataPointFactory:
@@ -15,7 +15,7 @@ class DataPointFactory:
         cls,
         sensor_id: int,
         value: Union[float, int],
-        timestamp: str) -> DataPointDTO:
+        timestamp: Union[str, float, int]) -> DataPointDTO:
         return DataPointDTO(
             sensor_id=sensor_id,
             value=value,
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Any, List, Sequence, Union
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.exceptions.device_exception import \
+    InvalidDataPointException
+
+
+def to_list(column: Any) -> List[Any]:
+    if hasattr(column, "tolist"):
+        return column.tolist()
+    return list(column)
+
+
+@dataclass(frozen=True, slots=True)
+class DataPointColumns:
+    sensor_ids: List[int]
+    values: List[Union[float, int]]
+    timestamps: List[Union[str, float, int]]
+
+    def __len__(self) -> int:
+        return len(self.sensor_ids)
+
+    def select(self, indexes: List[int]) -> "DataPointColumns":
+        return DataPointColumns(
+            sensor_ids=[self.sensor_ids[index] for index in indexes],
+            values=[self.values[index] for index in indexes],
+            timestamps=[self.timestamps[index] for index in indexes])
+
+    def extend(self, columns: "DataPointColumns") -> None:
+        self.sensor_ids.extend(columns.sensor_ids)
+        self.values.extend(columns.values)
+        self.timestamps.extend(columns.timestamps)
+
+    def to_data_points(self) -> List[DataPointDTO]:
+        return [
+            DataPointDTO(sensor_id=sensor_id, value=value, timestamp=timestamp)
+            for sensor_id, value, timestamp in zip(self.sensor_ids, self.values, self.timestamps)]
+
+
+class DataPointColumnsFactory:
+    @classmethod
+    def from_data_points(cls, data_points: List[DataPointDTO]) -> DataPointColumns:
+        return DataPointColumns(
+            sensor_ids=[data_point.sensor_id for data_point in data_points],
+            values=[data_point.value for data_point in data_points],
+            timestamps=[data_point.timestamp for data_point in data_points])
+
+    @classmethod
+    def create(
+            cls,
+            sensor_ids: Sequence[int],
+            values: Sequence[Union[float, int]],
+            timestamps: Union[str, float, int, Sequence[Union[str, float, int]]]) -> DataPointColumns:
+        sensor_ids = to_list(sensor_ids)
+        values = to_list(values)
+        if isinstance(timestamps, (str, float, int)):
+            timestamps = [timestamps] * len(sensor_ids)
+        else:
+            timestamps = to_list(timestamps)
+        if not len(sensor_ids) == len(values) == len(timestamps):
+            raise InvalidDataPointException(
+                f"Columns have different lengths: {len(sensor_ids)} sensor ids, "
+                f"{len(values)} values and {len(timestamps)} timestamps.")
+        return DataPointColumns(sensor_ids=sensor_ids, values=values, timestamps=timestamps)
@@ -3,7 +3,7 @@ from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO
 from knot_protocol.domain.boundary.output.DTO.event import Event
 
 
-@dataclass(frozen=True, eq=False)
+@dataclass(frozen=True, eq=False, slots=True)
 class ConfigurationDTO:
     sensor_id: int
     schema: SchemaDTO
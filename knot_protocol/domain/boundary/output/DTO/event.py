@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from typing import Union
+from typing import Tuple, Union
+from weakref import WeakValueDictionary
 
 @dataclass(frozen=True)
 class Event:
+    __slots__ = ("change", "time_seconds", "lower_threshold", "upper_threshold", "__weakref__")
     change: bool
     time_seconds: int
     lower_threshold: Union[float, int]
@@ -10,6 +12,14 @@ class Event:
 
 
 class EventFactory:
+    __interned: "WeakValueDictionary[Tuple[bool, int, Union[float, int], Union[float, int]], Event]" = \
+        WeakValueDictionary()
+
+    @classmethod
+    def intern(cls, event: Event) -> Event:
+        key = (event.change, event.time_seconds, event.lower_threshold, event.upper_threshold)
+        return cls.__interned.setdefault(key, event)
+
     @classmethod
     def create(
             cls,
@@ -17,8 +27,8 @@ class EventFactory:
             time_seconds: int,
             lower_threshold: Union[float, int],
             upper_threshold: Union[float, int]) -> Event:
-        return Event(
+        return cls.intern(Event(
             change=change,
             time_seconds=time_seconds,
             lower_threshold=lower_threshold,
-            upper_threshold=upper_threshold)
\ No newline at end of file
+            upper_threshold=upper_threshold))
\ No newline at end of file
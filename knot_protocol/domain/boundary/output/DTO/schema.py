@@ -1,8 +1,11 @@
 from dataclasses import dataclass
+from typing import Tuple
+from weakref import WeakValueDictionary
 
 
 @dataclass(frozen=True)
 class SchemaDTO:
+    __slots__ = ("value_type", "unit", "type_id", "name", "__weakref__")
     value_type: int
     unit: int
     type_id: int
@@ -10,6 +13,13 @@ class SchemaDTO:
 
 
 class SchemaFactory:
+    __interned: "WeakValueDictionary[Tuple[int, int, int, str], SchemaDTO]" = WeakValueDictionary()
+
+    @classmethod
+    def intern(cls, schema: SchemaDTO) -> SchemaDTO:
+        key = (schema.value_type, schema.unit, schema.type_id, schema.name)
+        return cls.__interned.setdefault(key, schema)
+
     @classmethod
     def create(
             cls,
@@ -17,8 +27,8 @@ class SchemaFactory:
             unit: int,
             type_id: int,
             name: str) -> SchemaDTO:
-        return SchemaDTO(
+        return cls.intern(SchemaDTO(
             name=name,
             value_type=value_type,
             type_id=type_id,
-            unit=unit)
+            unit=unit))
@@ -10,3 +10,6 @@ class DevicePersistenceGateway(ABC):
     @abstractmethod
     def load(self) -> DeviceEntity:
         ...
+
+    def record(self, device: DeviceEntity) -> None:
+        self.save(device)
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
+
+
+class Outbox(ABC):
+    @abstractmethod
+    def append(self, message: Union[str, bytes]) -> None:
+        ...
+
+    @abstractmethod
+    def peek(self, limit: int) -> List[Tuple[int, bytes]]:
+        ...
+
+    @abstractmethod
+    def remove(self, message_id: int) -> None:
+        ...
+
+    @abstractmethod
+    def set_aside(self, message_id: int) -> None:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
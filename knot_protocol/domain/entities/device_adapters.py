@@ -0,0 +1,36 @@
+from dataclasses import dataclass, fields
+from typing import Any, List
+
+from marshmallow import Schema
+
+from knot_protocol.domain.boundary.input.subscriber import Subscriber
+from knot_protocol.domain.boundary.output.publisher import Publisher
+
+
+@dataclass
+class DeviceAdapters:
+    register_subscriber: Subscriber = None
+    register_publisher: Publisher = None
+    register_serializer: Schema = None
+    auth_subscriber: Subscriber = None
+    auth_publisher: Publisher = None
+    device_auth_serializer: Schema = None
+    update_config_subscriber: Subscriber = None
+    update_config_publisher: Publisher = None
+    update_config_serializer: Schema = None
+    data_publisher: Publisher = None
+    publisher_serializer: Schema = None
+    unregister_subscriber: Subscriber = None
+    unregister_publisher: Publisher = None
+    unregister_serializer: Schema = None
+
+    @property
+    def shared_connections(self) -> List[Any]:
+        shared_connections = []
+        for adapter_field in fields(self):
+            adapter = getattr(self, adapter_field.name)
+            for candidate in (adapter, getattr(adapter, "supervisor", None)):
+                shared_connection = getattr(candidate, "shared_connection", None)
+                if shared_connection is not None:
+                    shared_connections.append(shared_connection)
+        return shared_connections
@@ -1,33 +1,54 @@
+import asyncio
+import inspect
 import uuid
 from dataclasses import dataclass
-from re import search
-from time import sleep
-from typing import List, Any
+from re import compile as compile_pattern
+from typing import TYPE_CHECKING, Any, ClassVar, List, Sequence, Union
 
 from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import \
+    DataPointColumnsFactory
 from knot_protocol.domain.boundary.output.DTO.device_configuration import ConfigurationDTO
+from knot_protocol.domain.entities.device_adapters import DeviceAdapters
+from knot_protocol.domain.usecase.data_point_buffer import DataPointBuffer
+from knot_protocol.domain.usecase.data_point_validator import DataPointValidator
+from knot_protocol.domain.usecase.emission_filter import EmissionFilter
+from knot_protocol.domain.usecase.onboarding import OnboardingDriver
 from knot_protocol.domain.usecase.state import State
-from knot_protocol.domain.usecase.states import (AuthenticatedState,
-                                                        ReadyState,
-                                                        RegisteredState,
-                                                        UpdatedSchemaState)
 from knot_protocol.infrastructure.utils.knot_amqp_options import KNoTPatterns
 from knot_protocol.infrastructure.utils.logger import logger_factory
 
+if TYPE_CHECKING:
+    from knot_protocol.domain.boundary.output.device_persistence_gateway import \
+        DevicePersistenceGateway
+
 logger = logger_factory()
 
+TOKEN_PATTERN = compile_pattern(KNoTPatterns.TOKEN.value)
+
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DeviceEntity:
     device_id: str
     name: str
     config: List[ConfigurationDTO]
     state: State
     amqp_generator: Any = None
+    adapters: DeviceAdapters = None
     data: List[DataPointDTO] = None
     error: str = ""
     token: str = ""
-    __id_length: int = 16
+    publishing_buffer: DataPointBuffer = None
+    emission_filter: EmissionFilter = None
+    data_point_validator: DataPointValidator = None
+    onboarding_driver: OnboardingDriver = None
+    time_to_ready: float = None
+    config_hash: str = None
+    last_auth_time: float = None
+    published_messages: int = 0
+    published_data_points: int = 0
+    repository: "DevicePersistenceGateway" = None
+    __id_length: ClassVar[int] = 16
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, DeviceEntity):
@@ -46,49 +67,94 @@ class DeviceEntity:
     def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
         self.stop()
 
+    async def __aenter__(self) -> None:
+        await self.start_async()
+
+    async def __aexit__(self, exception_type, exception_value, exception_traceback) -> None:
+        await self.stop_async()
+
     def transition_to_state(self, state: State):
         self.state = state
-        self.state.set_device(self)
+        if self.repository is None:
+            return
+        try:
+            self.repository.record(self)
+        except Exception as e:
+            logger.error(f"Device {self.device_id} transition was not persisted: {e!r}")
 
     def register(self) -> None:
-        self.state.register()
+        self.state.register(self)
 
     def unregister(self) -> None:
-        self.state.unregister()
+        self.state.unregister(self)
 
     def authenticate(self) -> None:
-        self.state.authenticate()
+        self.state.authenticate(self)
 
     def update_schema(self) -> None:
-        self.state.update_schema()
+        self.state.update_schema(self)
 
     def publish_data(self) -> None:
-        self.state.publish_data()
+        self.state.publish_data(self)
+
+    def publish_columns(
+            self,
+            sensor_ids: Sequence[int],
+            values: Sequence[Union[float, int]],
+            timestamps: Union[str, float, int, Sequence[Union[str, float, int]]]) -> None:
+        columns = DataPointColumnsFactory.create(sensor_ids=sensor_ids, values=values, timestamps=timestamps)
+        self.state.publish_columns(self, columns)
+
+    def flush(self) -> None:
+        self.state.flush(self)
+
+    def flush_expired(self) -> None:
+        self.state.flush_expired(self)
 
     def start(self) -> None:
-        print("started")
-        while not isinstance(self.state, ReadyState):
-            try:
-                self.register()
-            except Exception as e:
-                logger.error(str(e))
-            if isinstance(self.state, RegisteredState):
-                logger.info("Registered!")
-                self.authenticate()
-            if isinstance(self.state, AuthenticatedState):
-                logger.info("Authenticated!")
-                self.update_schema()
-            if isinstance(self.state, UpdatedSchemaState):
-                logger.info("Updated schema!")
-                self.publish_data()
-            sleep(1)
+        onboarding_driver = self.onboarding_driver or OnboardingDriver()
+        self.time_to_ready = onboarding_driver.run(self).time_to_ready
 
     def stop(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(str(e))
         try:
             next(self.amqp_generator)
         except StopIteration:
             print("Stopping device.")
 
+    async def start_async(self) -> None:
+        if not inspect.isasyncgen(self.amqp_generator):
+            await asyncio.to_thread(self.start)
+            return
+        onboarding_driver = self.onboarding_driver or OnboardingDriver()
+        self.time_to_ready = (await onboarding_driver.run_async(self)).time_to_ready
+
+    async def publish_data_async(self) -> None:
+        data_publisher = self.adapters.data_publisher
+        wait_for_capacity = getattr(data_publisher, "wait_for_capacity", None)
+        if wait_for_capacity is not None:
+            await wait_for_capacity()
+        self.publish_data()
+        wait_for_confirms = getattr(data_publisher, "wait_for_confirms", None)
+        if wait_for_confirms is not None:
+            await wait_for_confirms()
+
+    async def stop_async(self) -> None:
+        if not inspect.isasyncgen(self.amqp_generator):
+            await asyncio.to_thread(self.stop)
+            return
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(str(e))
+        try:
+            await self.amqp_generator.__anext__()
+        except StopAsyncIteration:
+            print("Stopping device.")
+
     def is_valid_device_id(self) -> bool:
         if len(self.device_id) != 16:
             return False
@@ -101,8 +167,7 @@ class DeviceEntity:
     def is_valid_token(self) -> bool:
         if self.token is None:
             return False
-        token_regular_expression = search(
-            KNoTPatterns.TOKEN.value, self.token)
+        token_regular_expression = TOKEN_PATTERN.search(self.token)
         return self.token != "" and token_regular_expression
 
     @classmethod
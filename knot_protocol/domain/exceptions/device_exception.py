@@ -56,3 +56,31 @@ class DeviceNotFoundException(Exception):
 
 class UnauthorizedException(Exception):
     ...
+
+
+class UnroutableMessageException(Exception):
+    ...
+
+
+class ConnectionPoolExhaustedException(Exception):
+    ...
+
+
+class RPCTimeoutException(Exception):
+    ...
+
+
+class OnboardingTimeoutException(Exception):
+    ...
+
+
+class InvalidDataPointException(Exception):
+    ...
+
+
+class PublisherBacklogFullException(Exception):
+    ...
+
+
+class MessageNackedException(Exception):
+    ...
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import List, Optional
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import (
+    DataPointColumns, DataPointColumnsFactory)
+
+# Length of '{"sensorId": , "value": , "timestamp": ""}, ' in the serialized payload.
+DATA_POINT_OVERHEAD_BYTES: int = 44
+# Length of a numeric timestamp formatted as "YYYY-MM-DD HH:MM:SS.ffffff".
+FORMATTED_TIMESTAMP_BYTES: int = 26
+
+
+def estimate_reading_size(sensor_id: int, value, timestamp) -> int:
+    return (
+        DATA_POINT_OVERHEAD_BYTES
+        + len(str(sensor_id))
+        + len(str(value))
+        + (len(timestamp) if isinstance(timestamp, str) else FORMATTED_TIMESTAMP_BYTES))
+
+
+def estimate_data_point_size(data_point: DataPointDTO) -> int:
+    return estimate_reading_size(data_point.sensor_id, data_point.value, data_point.timestamp)
+
+
+@dataclass
+class DataPointBuffer:
+    max_count: int = 100
+    max_bytes: int = 64 * 1024
+    max_age_seconds: float = 1.0
+    data: List[DataPointDTO] = field(default_factory=list)
+    columns: DataPointColumns = None
+    size: int = 0
+    first_data_point_time: float = None
+
+    def __len__(self) -> int:
+        return len(self.data) + (len(self.columns) if self.columns is not None else 0)
+
+    def append(self, data_points: List[DataPointDTO]) -> None:
+        if not data_points:
+            return
+        if self.first_data_point_time is None:
+            self.first_data_point_time = monotonic()
+        for data_point in data_points:
+            self.data.append(data_point)
+            self.size += estimate_data_point_size(data_point)
+
+    def append_columns(self, columns: DataPointColumns) -> None:
+        if not columns:
+            return
+        if self.first_data_point_time is None:
+            self.first_data_point_time = monotonic()
+        if self.columns is None:
+            self.columns = DataPointColumns(sensor_ids=[], values=[], timestamps=[])
+        self.columns.extend(columns)
+        self.size += sum(map(estimate_reading_size, columns.sensor_ids, columns.values, columns.timestamps))
+
+    def to_columns(self) -> DataPointColumns:
+        columns = DataPointColumnsFactory.from_data_points(self.data)
+        if self.columns is not None:
+            columns.extend(self.columns)
+        return columns
+
+    def is_full(self, now: float = None) -> bool:
+        if not self:
+            return False
+        if len(self) >= self.max_count or self.size >= self.max_bytes:
+            return True
+        now = monotonic() if now is None else now
+        return now - self.first_data_point_time >= self.max_age_seconds
+
+    def expires_in(self, now: float = None) -> Optional[float]:
+        if not self:
+            return None
+        now = monotonic() if now is None else now
+        return max(0.0, self.first_data_point_time + self.max_age_seconds - now)
+
+    def drain(self) -> List[DataPointDTO]:
+        data = self.data
+        self.data = []
+        self.columns = None
+        self.size = 0
+        self.first_data_point_time = None
+        return data
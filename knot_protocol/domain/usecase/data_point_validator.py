@@ -0,0 +1,138 @@
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import \
+    DataPointColumns
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.knot_amqp_options import \
+    KNoTValueType
+from knot_protocol.domain.exceptions.device_exception import \
+    InvalidDataPointException
+
+BOOLEAN_STRINGS: Dict[str, bool] = {"true": True, "false": False, "1": True, "0": False}
+INVALID_VALUE = object()
+
+
+class ValidationMode(Enum):
+    strict = "strict"
+    drop_invalid = "drop_invalid"
+    coerce = "coerce"
+
+
+def coerce_int(value: Any) -> int:
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value} is not an integer.")
+    return int(value)
+
+
+def coerce_float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f"{value} is not a number.")
+    return float(value)
+
+
+def coerce_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return BOOLEAN_STRINGS[value.strip().lower()]
+    if value in (0, 1):
+        return bool(value)
+    raise ValueError(f"{value} is not a boolean.")
+
+
+def coerce_str(value: Any) -> str:
+    return str(value)
+
+
+VALUE_TYPES: Dict[int, Tuple[FrozenSet[type], Callable[[Any], Any]]] = {
+    KNoTValueType.INT.value: (frozenset({int}), coerce_int),
+    KNoTValueType.FLOAT.value: (frozenset({int, float}), coerce_float),
+    KNoTValueType.BOOL.value: (frozenset({bool}), coerce_bool),
+    KNoTValueType.STRING.value: (frozenset({str}), coerce_str),
+}
+
+
+class DataPointValidator:
+    def __init__(self, config: List[ConfigurationDTO], mode: ValidationMode = ValidationMode.strict) -> None:
+        self.mode = mode
+        self.dropped = 0
+        self.coerced = 0
+        self.__sensors: Dict[int, Tuple[FrozenSet[type], Callable[[Any], Any]]] = {
+            configuration.sensor_id: VALUE_TYPES[configuration.schema.value_type]
+            for configuration in config}
+
+    def validate(self, data_points: List[DataPointDTO]) -> List[DataPointDTO]:
+        sensors = self.__sensors
+        for index, data_point in enumerate(data_points):
+            sensor = sensors.get(data_point.sensor_id)
+            if sensor is None or type(data_point.value) not in sensor[0]:
+                return data_points[:index] + self.__validate_slow(data_points[index:])
+        return data_points
+
+    def validate_columns(self, columns: DataPointColumns) -> DataPointColumns:
+        sensors = self.__sensors
+        for sensor_id, value in zip(columns.sensor_ids, columns.values):
+            sensor = sensors.get(sensor_id)
+            if sensor is None or type(value) not in sensor[0]:
+                break
+        else:
+            return columns
+        valid_indexes = []
+        values = list(columns.values)
+        for index, (sensor_id, value) in enumerate(zip(columns.sensor_ids, columns.values)):
+            sensor = sensors.get(sensor_id)
+            if sensor is None:
+                self.__reject(f"Sensor {sensor_id} is not configured.")
+                continue
+            value_types, coerce = sensor
+            if type(value) in value_types:
+                valid_indexes.append(index)
+                continue
+            value = self.__coerce(sensor_id, value, coerce)
+            if value is INVALID_VALUE:
+                continue
+            values[index] = value
+            valid_indexes.append(index)
+        columns = DataPointColumns(sensor_ids=columns.sensor_ids, values=values, timestamps=columns.timestamps)
+        if len(valid_indexes) == len(columns):
+            return columns
+        return columns.select(valid_indexes)
+
+    def __validate_slow(self, data_points: List[DataPointDTO]) -> List[DataPointDTO]:
+        sensors = self.__sensors
+        valid_data_points = []
+        for data_point in data_points:
+            sensor = sensors.get(data_point.sensor_id)
+            if sensor is None:
+                self.__reject(f"Sensor {data_point.sensor_id} is not configured.")
+                continue
+            value_types, coerce = sensor
+            if type(data_point.value) in value_types:
+                valid_data_points.append(data_point)
+                continue
+            value = self.__coerce(data_point.sensor_id, data_point.value, coerce)
+            if value is INVALID_VALUE:
+                continue
+            valid_data_points.append(DataPointDTO(
+                sensor_id=data_point.sensor_id,
+                value=value,
+                timestamp=data_point.timestamp))
+        return valid_data_points
+
+    def __coerce(self, sensor_id: int, value: Any, coerce: Callable[[Any], Any]) -> Any:
+        if self.mode is not ValidationMode.coerce:
+            self.__reject(f"Invalid value {value!r} for sensor {sensor_id}.")
+            return INVALID_VALUE
+        try:
+            coerced_value = coerce(value)
+        except (KeyError, TypeError, ValueError):
+            self.__reject(f"Invalid value {value!r} for sensor {sensor_id}.")
+            return INVALID_VALUE
+        self.coerced += 1
+        return coerced_value
+
+    def __reject(self, message: str) -> None:
+        if self.mode is ValidationMode.strict:
+            raise InvalidDataPointException(message)
+        self.dropped += 1
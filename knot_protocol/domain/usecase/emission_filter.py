@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Dict, List
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import \
+    DataPointColumns
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.event import Event
+
+BELOW_LOWER_THRESHOLD: int = -1
+INSIDE_THRESHOLDS: int = 0
+ABOVE_UPPER_THRESHOLD: int = 1
+
+
+@dataclass
+class SensorEmissionState:
+    event: Event
+    last_value: Any = None
+    last_emission_time: float = None
+    last_zone: int = INSIDE_THRESHOLDS
+
+    def should_emit(self, value: Any, now: float) -> bool:
+        zone = self.__zone(value)
+        emit = (
+            self.last_emission_time is None
+            or (self.event.change and value != self.last_value)
+            or (self.event.time_seconds and now - self.last_emission_time >= self.event.time_seconds)
+            or (zone != INSIDE_THRESHOLDS and zone != self.last_zone))
+        self.last_zone = zone
+        if emit:
+            self.last_value = value
+            self.last_emission_time = now
+        return emit
+
+    def __zone(self, value: Any) -> int:
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return INSIDE_THRESHOLDS
+        if self.event.lower_threshold is not None and value < self.event.lower_threshold:
+            return BELOW_LOWER_THRESHOLD
+        if self.event.upper_threshold is not None and value > self.event.upper_threshold:
+            return ABOVE_UPPER_THRESHOLD
+        return INSIDE_THRESHOLDS
+
+
+class EmissionFilter:
+    def __init__(self, config: List[ConfigurationDTO]) -> None:
+        self.__sensors: Dict[int, SensorEmissionState] = {
+            configuration.sensor_id: SensorEmissionState(event=configuration.event)
+            for configuration in config}
+
+    def filter(self, data_points: List[DataPointDTO], now: float = None) -> List[DataPointDTO]:
+        now = monotonic() if now is None else now
+        sensors = self.__sensors
+        return [
+            data_point for data_point in data_points
+            if data_point.sensor_id not in sensors
+            or sensors[data_point.sensor_id].should_emit(data_point.value, now)]
+
+    def filter_columns(self, columns: DataPointColumns, now: float = None) -> DataPointColumns:
+        now = monotonic() if now is None else now
+        sensors = self.__sensors
+        indexes = [
+            index for index, (sensor_id, value) in enumerate(zip(columns.sensor_ids, columns.values))
+            if sensor_id not in sensors or sensors[sensor_id].should_emit(value, now)]
+        if len(indexes) == len(columns):
+            return columns
+        return columns.select(indexes)
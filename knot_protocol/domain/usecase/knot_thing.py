@@ -1,16 +1,227 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from heapq import heappop, heappush
+from itertools import count
+from threading import Event
+from time import monotonic
+from typing import Any, Callable, Dict, List, Set
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
 from knot_protocol.domain.entities.device_entity import DeviceEntity
-from knot_protocol.domain.usecase.states import PublishingState
+from knot_protocol.infrastructure.utils.logger import logger_factory
+
+logger = logger_factory()
+
+DEFAULT_MAX_CONCURRENCY: int = 16
+
+
+class DeviceStatus(Enum):
+    pending = "pending"
+    onboarding = "onboarding"
+    ready = "ready"
+    failed = "failed"
+    stopped = "stopped"
+
+
+@dataclass
+class DeviceReport:
+    device_id: str
+    status: DeviceStatus = DeviceStatus.pending
+    time_to_ready: float = None
+    published_messages: int = 0
+    published_data_points: int = 0
+    error: str = ""
+
+
+@dataclass(order=True)
+class PublishingTask:
+    next_time: float
+    sequence: int
+    device: DeviceEntity = field(compare=False)
+    interval: float = field(compare=False)
+    read_data: Callable[[DeviceEntity], List[DataPointDTO]] = field(compare=False)
+    flush: bool = field(default=False, compare=False)
 
 
 class KNoTThingManager:
     def __init__(
             self,
-            device: DeviceEntity,) -> None:
-        self.__device = device
+            devices: List[DeviceEntity],
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            clock: Callable[[], float] = monotonic,
+            wait: Callable[[float], Any] = None) -> None:
+        self.devices = devices
+        self.max_concurrency = max_concurrency
+        self.__reports: Dict[int, DeviceReport] = {
+            id(device): DeviceReport(device_id=device.device_id) for device in devices}
+        self.__tasks: List[PublishingTask] = []
+        self.__flushing: Set[int] = set()
+        self.__sequence = count()
+        self.__stopped = Event()
+        self.__clock = clock
+        self.__wait = wait or self.__stopped.wait
+        self.__running_time = 0.0
+
+    @property
+    def reports(self) -> Dict[str, DeviceReport]:
+        return {report.device_id: report for report in self.__reports.values()}
+
+    def status(self) -> Dict[str, DeviceStatus]:
+        return {report.device_id: report.status for report in self.__reports.values()}
+
+    def throughput(self) -> float:
+        if not self.__running_time:
+            return 0.0
+        published_data_points = sum(report.published_data_points for report in self.__reports.values())
+        return published_data_points / self.__running_time
+
+    def onboard(self) -> Dict[str, DeviceStatus]:
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="knot-onboarding") as executor:
+            wait([executor.submit(self.__onboard_group, group) for group in self.__onboarding_groups()])
+        return self.status()
+
+    def schedule(
+            self,
+            device: DeviceEntity,
+            interval: float,
+            read_data: Callable[[DeviceEntity], List[DataPointDTO]]) -> None:
+        heappush(self.__tasks, PublishingTask(
+            next_time=self.__clock(),
+            sequence=next(self.__sequence),
+            device=device,
+            interval=interval,
+            read_data=read_data))
+
+    def run(self, duration: float = None) -> None:
+        self.__stopped.clear()
+        start_time = self.__clock()
+        end_time = None if duration is None else start_time + duration
+        while self.__tasks and not self.__stopped.is_set():
+            task = self.__tasks[0]
+            if end_time is not None and task.next_time >= end_time:
+                self.__wait(max(0.0, end_time - self.__clock()))
+                break
+            delay = task.next_time - self.__clock()
+            if delay > 0:
+                self.__wait(delay)
+                continue
+            heappop(self.__tasks)
+            if task.flush:
+                self.__flush_expired(task.device)
+                continue
+            self.__publish(task)
+            self.__schedule_flush(task.device)
+            task.next_time = max(task.next_time + task.interval, self.__clock())
+            task.sequence = next(self.__sequence)
+            heappush(self.__tasks, task)
+        self.__running_time += self.__clock() - start_time
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        for device in self.devices:
+            report = self.__reports[id(device)]
+            if report.status is not DeviceStatus.ready:
+                continue
+            try:
+                device.stop()
+            except Exception as exception:
+                logger.error(f"Device {device.device_id} did not stop: {exception!r}")
+            self.__record_published(report, device)
+            report.status = DeviceStatus.stopped
+
+    def __onboarding_groups(self) -> List[List[DeviceEntity]]:
+        groups: List[List[DeviceEntity]] = []
+        groups_by_connection: Dict[int, List[DeviceEntity]] = {}
+        for device in self.devices:
+            adapters = getattr(device, "adapters", None)
+            shared_connections = [] if adapters is None else adapters.shared_connections
+            group = None
+            for shared_connection in shared_connections:
+                other_group = groups_by_connection.get(id(shared_connection))
+                if other_group is None or other_group is group:
+                    continue
+                if group is None:
+                    group = other_group
+                    continue
+                group.extend(other_group)
+                other_group.clear()
+                for key, value in groups_by_connection.items():
+                    if value is other_group:
+                        groups_by_connection[key] = group
+            if group is None:
+                group = []
+                groups.append(group)
+            group.append(device)
+            for shared_connection in shared_connections:
+                groups_by_connection[id(shared_connection)] = group
+        return [group for group in groups if group]
+
+    def __onboard_group(self, devices: List[DeviceEntity]) -> None:
+        for device in devices:
+            self.__onboard(device)
+
+    def __onboard(self, device: DeviceEntity) -> None:
+        report = self.__reports[id(device)]
+        report.status = DeviceStatus.onboarding
+        try:
+            device.start()
+        except Exception as exception:
+            report.device_id = device.device_id
+            report.status = DeviceStatus.failed
+            report.error = repr(exception)
+            logger.error(f"Device {device.device_id} onboarding failed: {exception!r}")
+            return
+        report.device_id = device.device_id
+        report.time_to_ready = device.time_to_ready
+        report.status = DeviceStatus.ready
+
+    def __schedule_flush(self, device: DeviceEntity) -> None:
+        publishing_buffer = getattr(device, "publishing_buffer", None)
+        if publishing_buffer is None or id(device) in self.__flushing:
+            return
+        expires_in = publishing_buffer.expires_in()
+        if expires_in is None:
+            return
+        self.__flushing.add(id(device))
+        heappush(self.__tasks, PublishingTask(
+            next_time=self.__clock() + expires_in,
+            sequence=next(self.__sequence),
+            device=device,
+            interval=0.0,
+            read_data=None,
+            flush=True))
+
+    def __flush_expired(self, device: DeviceEntity) -> None:
+        self.__flushing.discard(id(device))
+        report = self.__reports[id(device)]
+        try:
+            device.flush_expired()
+        except Exception as exception:
+            report.error = repr(exception)
+            logger.error(f"Device {device.device_id} flush failed: {exception!r}")
+            return
+        finally:
+            self.__record_published(report, device)
+        self.__schedule_flush(device)
 
-    def start(self) -> None:
-        self.__turn_on_device()
+    def __publish(self, task: PublishingTask) -> None:
+        report = self.__reports[id(task.device)]
+        if report.status is not DeviceStatus.ready:
+            return
+        try:
+            data = task.read_data(task.device)
+            if not data:
+                return
+            task.device.data = data
+            task.device.publish_data()
+        except Exception as exception:
+            report.error = repr(exception)
+            logger.error(f"Device {task.device.device_id} publishing failed: {exception!r}")
+        finally:
+            self.__record_published(report, task.device)
 
-    def __turn_on_device(self) -> None:
-        while not isinstance(self.__device.state, PublishingState):
-            self.__device.stateg_handle()
+    @staticmethod
+    def __record_published(report: DeviceReport, device: DeviceEntity) -> None:
+        report.published_messages = device.published_messages
+        report.published_data_points = device.published_data_points
@@ -0,0 +1,151 @@
+import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from random import random
+from time import monotonic, sleep
+from typing import Awaitable, Callable, Dict, Iterator, Optional
+
+from knot_protocol.domain.exceptions.device_exception import \
+    OnboardingTimeoutException
+from knot_protocol.domain.usecase.states import (AUTHENTICATION,
+                                                 REGISTRATION, SCHEMA_UPDATE,
+                                                 AuthenticatedState,
+                                                 DeviceExchange,
+                                                 DisconnectedState, ReadyState,
+                                                 RegisteredState,
+                                                 UnregisteredState,
+                                                 UpdatedSchemaState)
+from knot_protocol.infrastructure.utils.logger import logger_factory
+
+logger = logger_factory()
+
+ONBOARDING_STEPS: Dict[type, str] = {
+    DisconnectedState: "register",
+    UnregisteredState: "register",
+    RegisteredState: "authenticate",
+    AuthenticatedState: "update_schema",
+    UpdatedSchemaState: "publish_data",
+}
+ONBOARDING_EXCHANGES: Dict[type, DeviceExchange] = {
+    DisconnectedState: REGISTRATION,
+    UnregisteredState: REGISTRATION,
+    RegisteredState: AUTHENTICATION,
+    AuthenticatedState: SCHEMA_UPDATE,
+}
+DEFAULT_BASE_RETRY_DELAY: float = 0.1
+DEFAULT_MAX_RETRY_DELAY: float = 10.0
+
+
+@dataclass
+class OnboardingReport:
+    time_to_ready: float = None
+    attempts: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class OnboardingProgress:
+    start_time: float
+    step_start_time: float
+    failures: int = 0
+    report: OnboardingReport = field(default_factory=OnboardingReport)
+
+
+@dataclass
+class OnboardingAttempt:
+    step: str
+    exchange: Optional[DeviceExchange]
+    remaining_time: Optional[float]
+    retry_delay: Optional[float] = None
+
+
+class OnboardingDriver:
+    def __init__(
+            self,
+            step_deadlines: Dict[str, float] = None,
+            base_retry_delay: float = DEFAULT_BASE_RETRY_DELAY,
+            max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+            clock: Callable[[], float] = monotonic,
+            wait: Callable[[float], None] = sleep,
+            jitter: Callable[[], float] = random,
+            wait_async: Callable[[float], Awaitable[None]] = asyncio.sleep) -> None:
+        self.step_deadlines = step_deadlines or {}
+        self.base_retry_delay = base_retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.__clock = clock
+        self.__wait = wait
+        self.__jitter = jitter
+        self.__wait_async = wait_async
+
+    def run(self, device) -> OnboardingReport:
+        progress = self.__start()
+        while not isinstance(device.state, ReadyState):
+            with self.__attempt(device, progress) as attempt:
+                if attempt.exchange is None:
+                    getattr(device, attempt.step)()
+                else:
+                    attempt.exchange.run(device, timeout=attempt.remaining_time)
+            if attempt.retry_delay is not None:
+                self.__wait(attempt.retry_delay)
+        return self.__finish(device, progress)
+
+    async def run_async(self, device) -> OnboardingReport:
+        progress = self.__start()
+        while not isinstance(device.state, ReadyState):
+            with self.__attempt(device, progress) as attempt:
+                if attempt.exchange is None:
+                    getattr(device, attempt.step)()
+                else:
+                    await attempt.exchange.run_async(device, timeout=attempt.remaining_time)
+            if attempt.retry_delay is not None:
+                await self.__wait_async(attempt.retry_delay)
+        return self.__finish(device, progress)
+
+    def __start(self) -> OnboardingProgress:
+        start_time = self.__clock()
+        return OnboardingProgress(start_time=start_time, step_start_time=start_time)
+
+    @contextmanager
+    def __attempt(self, device, progress: OnboardingProgress) -> Iterator[OnboardingAttempt]:
+        state = device.state
+        step = ONBOARDING_STEPS[type(state)]
+        attempt = OnboardingAttempt(
+            step=step,
+            exchange=ONBOARDING_EXCHANGES.get(type(state)),
+            remaining_time=self.__remaining_time(step, progress.step_start_time))
+        progress.report.attempts[step] = progress.report.attempts.get(step, 0) + 1
+        try:
+            yield attempt
+        except Exception as exception:
+            logger.error(f"{step} failed: {exception!r}")
+        if device.state is not state:
+            logger.info(f"{step} finished, device is {device.state!r}")
+            progress.step_start_time = self.__clock()
+            progress.failures = 0
+            return
+        progress.failures += 1
+        attempt.retry_delay = self.__next_retry_delay(step, progress.step_start_time, progress.failures)
+
+    def __finish(self, device, progress: OnboardingProgress) -> OnboardingReport:
+        report = progress.report
+        report.time_to_ready = self.__clock() - progress.start_time
+        logger.info(f"Device {device.device_id} ready in {report.time_to_ready:.3f} seconds")
+        return report
+
+    def retry_delay(self, failures: int) -> float:
+        return min(self.max_retry_delay, self.base_retry_delay * 2 ** (failures - 1)) * self.__jitter()
+
+    def __next_retry_delay(self, step: str, step_start_time: float, failures: int) -> float:
+        retry_delay = self.retry_delay(failures)
+        remaining_time = self.__remaining_time(step, step_start_time)
+        if remaining_time is None:
+            return retry_delay
+        return min(retry_delay, remaining_time)
+
+    def __remaining_time(self, step: str, step_start_time: float) -> Optional[float]:
+        deadline = self.step_deadlines.get(step)
+        if deadline is None:
+            return None
+        remaining_time = deadline - (self.__clock() - step_start_time)
+        if remaining_time <= 0:
+            raise OnboardingTimeoutException(f"{step} did not finish within {deadline} seconds.")
+        return remaining_time
@@ -1,32 +1,34 @@
 from abc import ABC, abstractmethod
 
+from knot_protocol.domain.exceptions.device_exception import NotReadyException
 
-class State(ABC):
-    def __init__(self, device = None) -> None:
-        self.device = device
 
+class State(ABC):
     @abstractmethod
-    def register(self) -> None:
+    def register(self, device) -> None:
         ...
 
     @abstractmethod
-    def unregister(self) -> None:
+    def unregister(self, device) -> None:
         ...
 
     @abstractmethod
-    def authenticate(self) -> None:
+    def authenticate(self, device) -> None:
         ...
 
     @abstractmethod
-    def update_schema(self) -> None:
+    def update_schema(self, device) -> None:
         ...
 
     @abstractmethod
-    def publish_data(self) -> None:
+    def publish_data(self, device) -> None:
         ...
 
-    def get_device(self):
-        return self.device
+    def publish_columns(self, device, columns) -> None:
+        raise NotReadyException()
+
+    def flush(self, device) -> None:
+        return
 
-    def set_device(self, device):
-        self.device = device
+    def flush_expired(self, device) -> None:
+        return
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
-
-from marshmallow import Schema
+from contextlib import contextmanager
+from hashlib import sha256
+from time import time
+from typing import Optional, Tuple
 
 from knot_protocol.domain.boundary.input.subscriber import Subscriber
 from knot_protocol.domain.boundary.output.DTO.authentication_request_dto import \
@@ -24,257 +24,352 @@ from knot_protocol.domain.exceptions.device_exception import (
 from knot_protocol.domain.usecase.state import State
 
 
+def content_hash(content) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return sha256(content).hexdigest()
+
+
+@contextmanager
+def bounded_timeout(subscriber: Subscriber, timeout: Optional[float]):
+    previous_timeout = getattr(subscriber, "timeout", None)
+    if timeout is None or previous_timeout is None:
+        yield
+        return
+    subscriber.timeout = min(float(previous_timeout), timeout)
+    try:
+        yield
+    finally:
+        subscriber.timeout = previous_timeout
+
+
+class DeviceExchange(ABC):
+    @abstractmethod
+    def request(self, device) -> Optional[Tuple[Publisher, Subscriber]]:
+        ...
+
+    @abstractmethod
+    def complete(self, device, subscriber: Optional[Subscriber]) -> None:
+        ...
+
+    def run(self, device, timeout: float = None) -> None:
+        exchange = self.request(device)
+        if exchange is None:
+            self.complete(device, None)
+            return
+        publisher, subscriber = exchange
+        with bounded_timeout(subscriber, timeout), subscriber:
+            publisher.publish()
+            subscriber.callback.device_id = device.device_id
+            subscriber.subscribe()
+        self.complete(device, subscriber)
+
+    async def run_async(self, device, timeout: float = None) -> None:
+        exchange = self.request(device)
+        if exchange is None:
+            self.complete(device, None)
+            return
+        publisher, subscriber = exchange
+        with bounded_timeout(subscriber, timeout):
+            async with subscriber:
+                subscriber.callback.device_id = device.device_id
+                await publisher.publish_async()
+                await subscriber.subscribe_async()
+        self.complete(device, subscriber)
+
+
+class RegistrationExchange(DeviceExchange):
+    def request(self, device) -> Optional[Tuple[Publisher, Subscriber]]:
+        adapters = device.adapters
+        if not device.is_valid_device_id():
+            device.device_id = device.create_id()
+        if device.is_valid_token():
+            return None
+        registration_request = RegistrationRequest(device.device_id, device.name)
+        adapters.register_publisher.content = str(adapters.register_serializer.dumps(registration_request))
+        return adapters.register_publisher, adapters.register_subscriber
+
+    def complete(self, device, subscriber: Optional[Subscriber]) -> None:
+        if subscriber is not None:
+            if not subscriber.callback.token:
+                return
+            device.token = subscriber.callback.token
+        device.transition_to_state(REGISTERED_STATE)
+
+
+class UnregistrationExchange(DeviceExchange):
+    def request(self, device) -> Optional[Tuple[Publisher, Subscriber]]:
+        adapters = device.adapters
+        unregistration_request = UnregistrationRequest(
+            id=device.device_id,
+            name=device.name)
+        adapters.unregister_publisher.content =\
+            str(adapters.unregister_serializer.dumps(unregistration_request))
+        return adapters.unregister_publisher, adapters.unregister_subscriber
+
+    def complete(self, device, subscriber: Optional[Subscriber]) -> None:
+        device.token = None
+        device.transition_to_state(UNREGISTERED_STATE)
+
+
+class AuthenticationExchange(DeviceExchange):
+    def request(self, device) -> Optional[Tuple[Publisher, Subscriber]]:
+        adapters = device.adapters
+        authentication_request = AuthenticationRequestDTO(device.device_id, device.token)
+        adapters.auth_publisher.content = str(adapters.device_auth_serializer.dumps(authentication_request))
+        return adapters.auth_publisher, adapters.auth_subscriber
+
+    def complete(self, device, subscriber: Optional[Subscriber]) -> None:
+        device.last_auth_time = time()
+        device.transition_to_state(AUTHENTICATED_STATE)
+
+
+class SchemaUpdateExchange(DeviceExchange):
+    def request(self, device) -> Optional[Tuple[Publisher, Subscriber]]:
+        adapters = device.adapters
+        serialized_request = self.__serialize(device)
+        if device.config_hash == content_hash(serialized_request):
+            return None
+        adapters.update_config_publisher.content = str(serialized_request)
+        adapters.update_config_subscriber.callback.acknowledged = False
+        return adapters.update_config_publisher, adapters.update_config_subscriber
+
+    def complete(self, device, subscriber: Optional[Subscriber]) -> None:
+        if subscriber is not None:
+            if subscriber.callback.config:
+                device.config = subscriber.callback.config
+            if subscriber.callback.acknowledged:
+                device.config_hash = content_hash(self.__serialize(device))
+        device.transition_to_state(UPDATED_SCHEMA_STATE)
+
+    def __serialize(self, device):
+        config_request = UpdateConfigRequest(id=device.device_id, config=device.config)
+        return device.adapters.update_config_serializer.dumps(config_request)
+
+
+REGISTRATION = RegistrationExchange()
+UNREGISTRATION = UnregistrationExchange()
+AUTHENTICATION = AuthenticationExchange()
+SCHEMA_UPDATE = SchemaUpdateExchange()
+
+
 class CommonOperation(ABC):
     @abstractmethod
-    def unregister(self):
+    def unregister(self, device):
         ...
-    
+
     @abstractmethod
-    def register(self):
+    def register(self, device):
         ...
 
 
-@dataclass
 class CommonStateOperation(CommonOperation):
-    device: Any
-    unregister_subscriber: Subscriber
-    unregister_publisher: Publisher
-    unregister_serializer: Schema
-    unregister_state: State
-    register_subscriber: Subscriber
-    register_publisher: Publisher
-    register_serializer: Schema
-    register_state: State
-
-    def unregister(self):
-        unregistration_request = UnregistrationRequest(
-            id=self.device.device_id,
-            name=self.device.name)
-        self.unregister_publisher.content =\
-            str(self.unregister_serializer.dumps(unregistration_request))
-        with self.unregister_subscriber:
-            self.unregister_publisher.publish()
-            self.unregister_subscriber.callback.device_id = self.device.device_id
-            self.unregister_subscriber.subscribe()
-        self.device.token = None
-        self.device.transition_to_state(self.unregister_state)
-    
-    def register(self):
-        if not self.device.is_valid_device_id():
-            self.device.device_id = self.device.create_id()
-        if not self.device.is_valid_token():
-            registration_request = RegistrationRequest(self.device.device_id, self.device.name)
-            self.register_publisher.content = str(self.register_serializer.dumps(registration_request))
-            with self.register_subscriber:
-                self.register_publisher.publish()
-                self.register_subscriber.callback.device_id = self.device.device_id
-                self.register_subscriber.subscribe()
-                token = self.register_subscriber.callback.token
-            if token:
-                self.device.token = token
-                self.device.transition_to_state(self.register_state)
-            return
-        self.device.transition_to_state(self.register_state)
+    def unregister(self, device):
+        UNREGISTRATION.run(device)
+
+    def register(self, device):
+        REGISTRATION.run(device)
+
+
+def authenticate(device) -> None:
+    AUTHENTICATION.run(device)
 
 
-@dataclass
 class DisconnectedState(State):
-    authenticate_subscriber: Subscriber
-    authenticate_publisher: Publisher
-    registered_state: State
-    authenticated: State
-    authenticate_serializer: Schema
-    common_operation: CommonStateOperation
-
-    def register(self) -> None:
-        self.common_operation.device = self.device
-        self.common_operation.register_state = self.registered_state
-        self.common_operation.register()
-
-    def unregister(self) -> None:
-        self.common_operation.device = self.device
-        self.common_operation.unregister()
-
-    def authenticate(self) -> None:
-        device = self.get_device()
+    def register(self, device) -> None:
+        COMMON_OPERATION.register(device)
+
+    def unregister(self, device) -> None:
+        COMMON_OPERATION.unregister(device)
+
+    def authenticate(self, device) -> None:
         if not device.is_valid_token():
             return
         if not device.is_valid_device_id():
             return
-        authentication_request = AuthenticationRequestDTO(device.device_id, device.token)
-        self.authenticate_publisher.content = str(self.authenticate_serializer.dumps(authentication_request))
-        with self.authenticate_subscriber:
-            self.authenticate_publisher.publish()
-            self.authenticate_subscriber.callback.device_id = device.device_id
-            self.authenticate_subscriber.subscribe()
-        device.transition_to_state(self.authenticated)
-        self.set_device(device)
-
-    def update_schema(self) -> None:
+        authenticate(device)
+
+    def update_schema(self, device) -> None:
         raise NotAuthenticatedException()
 
-    def publish_data(self) -> None:
+    def publish_data(self, device) -> None:
         raise NotAuthenticatedException()
 
     def __repr__(self) -> str:
         return "disconnected"
 
 
-@dataclass
 class RegisteredState(State):
-    publisher: Publisher
-    subscriber: Subscriber
-    request_serializer: Schema
-    authenticated: State
-    common_operation: CommonStateOperation
-
-    def register(self) -> None:
+    def register(self, device) -> None:
         raise AlreadyRegisteredDeviceException()
 
-    def unregister(self) -> None:
-        self.common_operation.device = self.device
-        self.common_operation.unregister()
+    def unregister(self, device) -> None:
+        COMMON_OPERATION.unregister(device)
 
-    def authenticate(self) -> None:
-        device = self.get_device()
-        authentication_request = AuthenticationRequestDTO(device.device_id, device.token)
-        self.publisher.content = str(self.request_serializer.dumps(authentication_request))
-        with self.subscriber:
-            self.publisher.publish()
-            self.subscriber.callback.device_id = device.device_id
-            self.subscriber.subscribe()
-        device.transition_to_state(self.authenticated)
-        self.set_device(device)
-
-    def update_schema(self) -> None:
+    def authenticate(self, device) -> None:
+        authenticate(device)
+
+    def update_schema(self, device) -> None:
         raise NotAuthenticatedException()
 
-    def publish_data(self) -> None:
+    def publish_data(self, device) -> None:
         raise NotAuthenticatedException()
 
     def __repr__(self) -> str:
         return "registered"
 
 
-@dataclass
 class UnregisteredState(State):
-    common_operation: CommonStateOperation
-
-    def register(self) -> None:
-        self.common_operation.device = self.device
-        self.common_operation.register()
+    def register(self, device) -> None:
+        COMMON_OPERATION.register(device)
 
-    def unregister(self) -> None:
+    def unregister(self, device) -> None:
         raise AlreadyUnregisteredDeviceException()
 
-    def authenticate(self) -> None:
+    def authenticate(self, device) -> None:
         raise NotRegisteredException()
 
-    def update_schema(self) -> None:
+    def update_schema(self, device) -> None:
         raise NotRegisteredException()
 
-    def publish_data(self) -> None:
+    def publish_data(self, device) -> None:
         raise NotRegisteredException()
 
     def __repr__(self) -> str:
         return "unregistered"
 
 
-@dataclass
 class AuthenticatedState(State):
-    publisher: Publisher
-    subscriber: Subscriber
-    request_serializer: Schema
-    updated_schema_state: State
-    common_operation: CommonStateOperation
-
-    def register(self) -> None:
+    def register(self, device) -> None:
         raise AlreadyRegisteredDeviceException()
 
-    def unregister(self) -> None:
-        self.common_operation.device = self.device
-        self.common_operation.unregister()
+    def unregister(self, device) -> None:
+        COMMON_OPERATION.unregister(device)
 
-    def authenticate(self) -> None:
+    def authenticate(self, device) -> None:
         raise AlreadyAuthenticatedException()
 
-    def update_schema(self) -> None:
-        device = self.get_device()
-        config_request = UpdateConfigRequest(id=device.device_id, config=device.config)
-        self.publisher.content = str(self.request_serializer.dumps(config_request))
-        with self.subscriber:
-            self.publisher.publish()
-            self.subscriber.callback.device_id = device.device_id
-            self.subscriber.subscribe()
-            config = self.subscriber.callback.config
-        if config:
-            device.config = config
-        device.transition_to_state(self.updated_schema_state)
-        self.set_device(device)
-
-    def publish_data(self) -> None:
+    def update_schema(self, device) -> None:
+        SCHEMA_UPDATE.run(device)
+
+    def publish_data(self, device) -> None:
         raise NotReadyException()
 
     def __repr__(self) -> str:
         return "authenticated"
 
 
-@dataclass
 class UpdatedSchemaState(State):
-    ready_state: State
-    common_operation: CommonStateOperation
-
-    def register(self) -> None:
+    def register(self, device) -> None:
         raise AlreadyRegisteredDeviceException()
 
-    def unregister(self) -> None:
-        self.common_operation.device = self.device
-        self.common_operation.unregister()
+    def unregister(self, device) -> None:
+        COMMON_OPERATION.unregister(device)
 
-    def authenticate(self) -> None:
+    def authenticate(self, device) -> None:
         raise AlreadyAuthenticatedException()
 
-    def update_schema(self) -> None:
+    def update_schema(self, device) -> None:
         raise AlreadyUpdatedSchema()
 
-    def publish_data(self) -> None:
-        device = self.get_device()
-        device.transition_to_state(self.ready_state)
+    def publish_data(self, device) -> None:
+        device.transition_to_state(READY_STATE)
         if device.data:
             device.publish_data()
-        self.set_device(device)
+
+    def publish_columns(self, device, columns) -> None:
+        device.transition_to_state(READY_STATE)
+        device.state.publish_columns(device, columns)
 
     def __repr__(self) -> str:
         return "updatedSchema"
 
 
-@dataclass
 class ReadyState(State):
-    publisher: Publisher
-    publisher_serializer: Schema
-    common_operation: CommonStateOperation
-
-    def register(self) -> None:
+    def register(self, device) -> None:
         raise AlreadyReady()
 
-    def unregister(self) -> None:
-        self.common_operation.device = self.device
-        self.common_operation.unregister()
+    def unregister(self, device) -> None:
+        COMMON_OPERATION.unregister(device)
 
-    def authenticate(self) -> None:
+    def authenticate(self, device) -> None:
         raise AlreadyReady()
 
-    def update_schema(self) -> None:
+    def update_schema(self, device) -> None:
         raise AlreadyReady()
 
-    def publish_data(self) -> None:
-        device = self.get_device()
-        if device.data:
-            data = PublishingData(id=device.device_id, data=device.data)
-            serialized_data = str(self.publisher_serializer.dumps(data))
-            self.publisher.content = serialized_data
-            self.publisher.publish()
-        self.set_device(device)
+    def publish_data(self, device) -> None:
+        data = device.data
+        if data and device.data_point_validator is not None:
+            data = device.data_point_validator.validate(data)
+        if data and device.emission_filter is not None:
+            data = device.emission_filter.filter(data)
+        if data:
+            if device.publishing_buffer is None:
+                self.__publish(device, data)
+            else:
+                device.publishing_buffer.append(data)
+        if device.publishing_buffer is not None and device.publishing_buffer.is_full():
+            self.flush(device)
+
+    def publish_columns(self, device, columns) -> None:
+        if columns and device.data_point_validator is not None:
+            columns = device.data_point_validator.validate_columns(columns)
+        if columns and device.emission_filter is not None:
+            columns = device.emission_filter.filter_columns(columns)
+        if not columns:
+            return
+        if device.publishing_buffer is None:
+            self.__publish_columns(device, columns)
+            return
+        device.publishing_buffer.append_columns(columns)
+        if device.publishing_buffer.is_full():
+            self.flush(device)
+
+    def flush(self, device) -> None:
+        publishing_buffer = device.publishing_buffer
+        if not publishing_buffer:
+            return
+        if publishing_buffer.columns is None:
+            self.__publish(device, publishing_buffer.data)
+        else:
+            self.__publish_columns(device, publishing_buffer.to_columns())
+        publishing_buffer.drain()
+
+    def flush_expired(self, device) -> None:
+        if device.publishing_buffer is not None and device.publishing_buffer.is_full():
+            self.flush(device)
+
+    def __publish(self, device, data_points) -> None:
+        adapters = device.adapters
+        data = PublishingData(id=device.device_id, data=data_points)
+        adapters.data_publisher.content = adapters.publisher_serializer.dumps(data)
+        self.__count_published(device, adapters.data_publisher.publish(), len(data_points))
+
+    def __publish_columns(self, device, columns) -> None:
+        adapters = device.adapters
+        encode_columns = getattr(adapters.publisher_serializer, "encode_columns", None)
+        if encode_columns is None:
+            self.__publish(device, columns.to_data_points())
+            return
+        adapters.data_publisher.content = encode_columns(device.device_id, columns)
+        self.__count_published(device, adapters.data_publisher.publish(), len(columns))
+
+    @staticmethod
+    def __count_published(device, published, number_data_points: int) -> None:
+        if published is False:
+            return
+        device.published_messages += 1
+        device.published_data_points += number_data_points
 
     def __repr__(self) -> str:
         return "readyToSendData"
+
+
+COMMON_OPERATION = CommonStateOperation()
+DISCONNECTED_STATE = DisconnectedState()
+REGISTERED_STATE = RegisteredState()
+UNREGISTERED_STATE = UnregisteredState()
+AUTHENTICATED_STATE = AuthenticatedState()
+UPDATED_SCHEMA_STATE = UpdatedSchemaState()
+READY_STATE = ReadyState()
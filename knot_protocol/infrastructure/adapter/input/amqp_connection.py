@@ -1,6 +1,9 @@
-from pika import BlockingConnection
+from os import environ
+
+from pika import BlockingConnection, URLParameters
 from pika.connection import Parameters
 from pika.channel import Channel
+from pika.exceptions import AMQPError
 from dataclasses import dataclass
 
 
@@ -42,8 +45,8 @@ class AMQPQueue:
         self.__name = name
         self.__channel = channel
 
-    def declare(self) -> None:
-        self.__channel.queue_declare(self.__name)
+    def declare(self, auto_delete: bool = False) -> None:
+        self.__channel.queue_declare(self.__name, auto_delete=auto_delete)
 
     def bind(self, exchange_name: str, routing_key) -> None:
         self.__channel.queue_bind(self.__name, exchange_name, routing_key=routing_key)
@@ -51,3 +54,21 @@ class AMQPQueue:
     @property
     def name(self) -> str:
         return self.__name
+
+
+def close_connection(connection: BlockingConnection) -> None:
+    if connection is None or connection.is_closed:
+        return
+    try:
+        connection.close()
+    except AMQPError:
+        return
+
+
+def reconnect_channel(channel: Channel, publisher_confirms: bool = False) -> Channel:
+    close_connection(channel.connection)
+    connection = AMQPConnection(URLParameters(environ.get("AMQP_URL"))).create()
+    new_channel = AMQPChannel(connection=connection).create()
+    if publisher_confirms:
+        new_channel.confirm_delivery()
+    return new_channel
@@ -0,0 +1,173 @@
+from dataclasses import dataclass, field
+from os import environ
+from threading import Lock
+from typing import Callable, Dict, List
+
+from pika import BlockingConnection, URLParameters
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exchange_type import ExchangeType
+
+from knot_protocol.domain.exceptions.device_exception import \
+    ConnectionPoolExhaustedException
+from knot_protocol.infrastructure.adapter.input.amqp_connection import (
+    AMQPChannel, AMQPConnection, AMQPExchange)
+from knot_protocol.infrastructure.utils.knot_amqp_options import KNoTExchange
+
+DEFAULT_MAX_CONNECTIONS: int = 4
+DEFAULT_MAX_CHANNELS_PER_CONNECTION: int = 512
+
+
+@dataclass
+class PooledConnection:
+    connection: BlockingConnection
+    leased_channels: int = 0
+
+
+@dataclass
+class ConnectionGroup:
+    name: str
+    connections: List[PooledConnection] = field(default_factory=list)
+
+
+class AMQPConnectionPool:
+    def __init__(
+            self,
+            connection_factory: Callable[[], BlockingConnection],
+            max_connections: int = DEFAULT_MAX_CONNECTIONS,
+            max_channels_per_connection: int = DEFAULT_MAX_CHANNELS_PER_CONNECTION,
+            prefetch_count: int = 1) -> None:
+        self.max_connections = max_connections
+        self.max_channels_per_connection = max_channels_per_connection
+        self.prefetch_count = prefetch_count
+        self.__connection_factory = connection_factory
+        self.__subscribers = ConnectionGroup(name="subscriber")
+        self.__publishers = ConnectionGroup(name="publisher")
+        self.__leases: Dict[int, PooledConnection] = {}
+        self.__exchanges_declared = False
+        self.__lock = Lock()
+
+    @classmethod
+    def from_environment(cls, **kwargs) -> "AMQPConnectionPool":
+        parameters = URLParameters(environ.get("AMQP_URL"))
+        return cls(connection_factory=AMQPConnection(parameters=parameters).create, **kwargs)
+
+    @property
+    def number_connections(self) -> int:
+        return len(self.__subscribers.connections) + len(self.__publishers.connections)
+
+    @property
+    def number_leased_channels(self) -> int:
+        return len(self.__leases)
+
+    def lease_subscriber_channel(self) -> BlockingChannel:
+        with self.__lock:
+            channel = self.__lease(self.__subscribers)
+            channel.basic_qos(prefetch_count=self.prefetch_count)
+            if not self.__exchanges_declared:
+                self.__declare_exchanges(channel)
+            return channel
+
+    def lease_publisher_channel(self) -> BlockingChannel:
+        with self.__lock:
+            channel = self.__lease(self.__publishers)
+            channel.confirm_delivery()
+            return channel
+
+    def release(self, channel: BlockingChannel) -> None:
+        with self.__lock:
+            pooled_connection = self.__leases.pop(id(channel), None)
+            if pooled_connection is None:
+                return
+            pooled_connection.leased_channels -= 1
+            if channel.is_open:
+                channel.close()
+
+    def close(self) -> None:
+        with self.__lock:
+            for group in (self.__subscribers, self.__publishers):
+                for pooled_connection in group.connections:
+                    if pooled_connection.connection.is_open:
+                        pooled_connection.connection.close()
+                group.connections.clear()
+            self.__leases.clear()
+
+    def __lease(self, group: ConnectionGroup) -> BlockingChannel:
+        group.connections = [
+            pooled_connection for pooled_connection in group.connections
+            if pooled_connection.connection.is_open]
+        available = [
+            pooled_connection for pooled_connection in group.connections
+            if pooled_connection.leased_channels < self.max_channels_per_connection]
+        if available:
+            pooled_connection = min(available, key=lambda candidate: candidate.leased_channels)
+        elif len(group.connections) < self.max_connections:
+            pooled_connection = PooledConnection(connection=self.__connection_factory())
+            group.connections.append(pooled_connection)
+        else:
+            raise ConnectionPoolExhaustedException(
+                f"All {group.name} connections have {self.max_channels_per_connection} leased channels.")
+        channel = AMQPChannel(connection=pooled_connection.connection).create()
+        pooled_connection.leased_channels += 1
+        self.__leases[id(channel)] = pooled_connection
+        return channel
+
+    def __declare_exchanges(self, channel: BlockingChannel) -> None:
+        AMQPExchange(
+            channel=channel,
+            exchange_name=KNoTExchange.device_exchange.value,
+            exchange_type=ExchangeType.direct).declare()
+        AMQPExchange(
+            channel=channel,
+            exchange_name=KNoTExchange.data_sent_exchange.value,
+            exchange_type=ExchangeType.fanout
+        ).declare()
+        self.__exchanges_declared = True
+
+
+class AMQPPooledLease:
+    def __init__(self, connection_pool: AMQPConnectionPool) -> None:
+        self.connection_pool = connection_pool
+        self.subscriber_channel = connection_pool.lease_subscriber_channel()
+        self.publisher_channel = connection_pool.lease_publisher_channel()
+        self.__subscribers: List = []
+        self.__publishers: List = []
+
+    @property
+    def shared_connection(self) -> AMQPConnectionPool:
+        return self.connection_pool
+
+    def attach_subscriber(self, subscriber) -> None:
+        self.__subscribers.append(subscriber)
+        subscriber.supervisor = self
+
+    def attach_publisher(self, publisher) -> None:
+        self.__publishers.append(publisher)
+        publisher.supervisor = self
+
+    def detach_publisher(self, publisher) -> None:
+        self.__publishers = [attached for attached in self.__publishers if attached is not publisher]
+        publisher.supervisor = None
+
+    def reconnect(self) -> None:
+        self.__release_channels()
+        self.subscriber_channel = self.connection_pool.lease_subscriber_channel()
+        self.publisher_channel = self.connection_pool.lease_publisher_channel()
+        for subscriber in self.__subscribers:
+            subscriber.rebind(self.subscriber_channel)
+        for publisher in self.__publishers:
+            publisher.rebind(self.publisher_channel)
+
+    def release(self) -> None:
+        self.__release_channels()
+        self.__subscribers.clear()
+        self.__publishers.clear()
+
+    def __release_channels(self) -> None:
+        self.connection_pool.release(self.subscriber_channel)
+        self.connection_pool.release(self.publisher_channel)
+
+
+def amqp_pooled_setup_generator(connection_pool: AMQPConnectionPool, lease: AMQPPooledLease = None):
+    lease = lease or AMQPPooledLease(connection_pool)
+    yield lease.subscriber_channel, lease.publisher_channel
+    lease.release()
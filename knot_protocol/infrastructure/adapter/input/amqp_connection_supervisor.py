@@ -0,0 +1,184 @@
+from logging import Logger
+from os import environ
+from time import monotonic
+from typing import Callable, List
+
+from pika import BlockingConnection, URLParameters
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import AMQPError
+from pika.exchange_type import ExchangeType
+
+from knot_protocol.infrastructure.adapter.input.amqp_connection import (
+    AMQPChannel, AMQPConnection, AMQPExchange, close_connection)
+from knot_protocol.infrastructure.adapter.input.control_consumer import \
+    AMQPControlConsumer
+from knot_protocol.infrastructure.utils.knot_amqp_options import KNoTExchange
+
+DEFAULT_PUMP_INTERVAL: float = 1.0
+
+
+class AMQPConnectionSupervisor:
+    """Heartbeats only flow while the owner calls pump() or sleep(): pika blocking
+    connections are not thread-safe, so the supervisor does not pump them on its own."""
+
+    def __init__(
+            self,
+            connection_factory: Callable[[], BlockingConnection],
+            logger: Logger,
+            prefetch_count: int = 1,
+            pump_interval: float = DEFAULT_PUMP_INTERVAL) -> None:
+        self.prefetch_count = prefetch_count
+        self.pump_interval = pump_interval
+        self.reconnections = 0
+        self.__connection_factory = connection_factory
+        self.__logger = logger
+        self.__subscriber_connection = None
+        self.__publisher_connection = None
+        self.__subscriber_channel = None
+        self.__publisher_channel = None
+        self.__subscribers: List = []
+        self.__publishers: List = []
+
+    @classmethod
+    def from_environment(cls, logger: Logger, **kwargs) -> "AMQPConnectionSupervisor":
+        parameters = URLParameters(environ.get("AMQP_URL"))
+        return cls(connection_factory=AMQPConnection(parameters=parameters).create, logger=logger, **kwargs)
+
+    @property
+    def subscriber_channel(self) -> BlockingChannel:
+        self.ensure_connected()
+        return self.__subscriber_channel
+
+    @property
+    def publisher_channel(self) -> BlockingChannel:
+        self.ensure_connected()
+        return self.__publisher_channel
+
+    @property
+    def shared_connection(self) -> "AMQPConnectionSupervisor":
+        return self
+
+    @property
+    def is_connected(self) -> bool:
+        return all(
+            connection is not None and connection.is_open
+            for connection in (self.__subscriber_connection, self.__publisher_connection))
+
+    def attach_subscriber(self, subscriber) -> None:
+        if not any(attached is subscriber for attached in self.__subscribers):
+            self.__subscribers.append(subscriber)
+        subscriber.supervisor = self
+
+    def attach_publisher(self, publisher) -> None:
+        if not any(attached is publisher for attached in self.__publishers):
+            self.__publishers.append(publisher)
+        publisher.supervisor = self
+
+    def detach_subscriber(self, subscriber) -> None:
+        self.__subscribers = [attached for attached in self.__subscribers if attached is not subscriber]
+        subscriber.supervisor = None
+
+    def detach_publisher(self, publisher) -> None:
+        self.__publishers = [attached for attached in self.__publishers if attached is not publisher]
+        publisher.supervisor = None
+
+    def ensure_connected(self) -> None:
+        if not self.is_connected:
+            self.reconnect()
+
+    def reconnect(self) -> None:
+        if self.__subscriber_connection is not None:
+            self.__logger.info("AMQP connection lost! Reconnecting...")
+            self.reconnections += 1
+        self.__close_connections()
+        self.__subscriber_connection = self.__connection_factory()
+        self.__publisher_connection = self.__connection_factory()
+        self.__subscriber_channel = AMQPChannel(connection=self.__subscriber_connection).create()
+        self.__subscriber_channel.basic_qos(prefetch_count=self.prefetch_count)
+        self.__publisher_channel = AMQPChannel(connection=self.__publisher_connection).create()
+        self.__publisher_channel.confirm_delivery()
+        self.__declare_topology()
+        for subscriber in self.__subscribers:
+            subscriber.rebind(self.__subscriber_channel)
+        for publisher in self.__publishers:
+            publisher.rebind(self.__publisher_channel)
+
+    def pump(self, time_limit: float = 0) -> None:
+        self.ensure_connected()
+        try:
+            self.__subscriber_connection.process_data_events(time_limit=time_limit)
+            self.__publisher_connection.process_data_events(time_limit=0)
+        except AMQPError as exception:
+            self.__logger.error(f"Heartbeat failed: {exception!r}")
+            self.reconnect()
+
+    def sleep(self, seconds: float) -> None:
+        deadline = monotonic() + seconds
+        remaining_time = seconds
+        while remaining_time > 0:
+            self.pump(time_limit=min(remaining_time, self.pump_interval))
+            remaining_time = deadline - monotonic()
+
+    def close(self) -> None:
+        self.__close_connections()
+        self.__subscriber_connection = None
+        self.__publisher_connection = None
+
+    def __close_connections(self) -> None:
+        close_connection(self.__subscriber_connection)
+        close_connection(self.__publisher_connection)
+
+    def __declare_topology(self) -> None:
+        AMQPExchange(
+            channel=self.__subscriber_channel,
+            exchange_name=KNoTExchange.device_exchange.value,
+            exchange_type=ExchangeType.direct).declare()
+        AMQPExchange(
+            channel=self.__subscriber_channel,
+            exchange_name=KNoTExchange.data_sent_exchange.value,
+            exchange_type=ExchangeType.fanout
+        ).declare()
+
+
+class AMQPSupervisedAttachment:
+    def __init__(self, supervisor: AMQPConnectionSupervisor, logger: Logger) -> None:
+        self.supervisor = supervisor
+        self.__logger = logger
+        self.__subscribers: List = []
+        self.__publishers: List = []
+
+    def attach_subscriber(self, subscriber) -> None:
+        self.__subscribers.append(subscriber)
+        self.supervisor.attach_subscriber(subscriber)
+
+    def attach_publisher(self, publisher) -> None:
+        self.__publishers.append(publisher)
+        self.supervisor.attach_publisher(publisher)
+
+    def release(self) -> None:
+        for subscriber in self.__subscribers:
+            self.supervisor.detach_subscriber(subscriber)
+            self.__stop_consuming(subscriber)
+        for publisher in self.__publishers:
+            self.supervisor.detach_publisher(publisher)
+        self.__subscribers.clear()
+        self.__publishers.clear()
+
+    def __stop_consuming(self, subscriber) -> None:
+        if not self.supervisor.is_connected:
+            return
+        try:
+            if isinstance(subscriber, AMQPControlConsumer):
+                subscriber.stop()
+            elif subscriber.is_long_lived:
+                subscriber.stop_consuming()
+        except AMQPError as exception:
+            self.__logger.error(f"Consumer did not stop: {exception!r}")
+
+
+def amqp_supervised_setup_generator(
+        supervisor: AMQPConnectionSupervisor,
+        attachment: AMQPSupervisedAttachment = None):
+    yield supervisor.subscriber_channel, supervisor.publisher_channel
+    if attachment is not None:
+        attachment.release()
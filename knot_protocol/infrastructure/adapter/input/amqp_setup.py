@@ -9,14 +9,31 @@ from knot_protocol.infrastructure.adapter.output.publisher import \
 from knot_protocol.infrastructure.utils.knot_amqp_options import (
     KNoTExchange, KNoTRoutingKey)
 from knot_protocol.infrastructure.adapter.input.amqp_connection import AMQPConnection, AMQPChannel, AMQPExchange
+from knot_protocol.infrastructure.adapter.input.amqp_connection_pool import (
+    AMQPConnectionPool, AMQPPooledLease, amqp_pooled_setup_generator)
+from knot_protocol.infrastructure.adapter.input.amqp_connection_supervisor import (
+    AMQPConnectionSupervisor, AMQPSupervisedAttachment,
+    amqp_supervised_setup_generator)
+from knot_protocol.infrastructure.adapter.input.control_consumer import (
+    AMQPControlConsumer, AMQPControlSubscriber)
+from knot_protocol.infrastructure.adapter.input.rpc_client import (
+    DEFAULT_ACK_BATCH_SIZE, AMQPRPCClient, AMQPRPCSubscriber)
+from knot_protocol.infrastructure.adapter.output.rpc_publisher import \
+    AMQPRPCPublisher
 
-def amqp_setup_generator():
+DEFAULT_PREFETCH_COUNT: int = 1
+
+
+def amqp_prefetch_count() -> int:
+    return int(environ.get("AMQP_PREFETCH_COUNT", DEFAULT_PREFETCH_COUNT))
+
+
+def amqp_setup_generator(prefetch_count: int = None):
     parameters = URLParameters(environ.get("AMQP_URL"))
     subscriber_connection = AMQPConnection(parameters=parameters).create()
     publisher_connection = AMQPConnection(parameters=parameters).create()
     subscriber_channel = AMQPChannel(connection=subscriber_connection).create()
-    BUFFER_LENGTH: int = 1
-    subscriber_channel.basic_qos(prefetch_count=BUFFER_LENGTH)
+    subscriber_channel.basic_qos(prefetch_count=prefetch_count or amqp_prefetch_count())
     publisher_channel = AMQPChannel(connection=publisher_connection).create()
     publisher_channel.confirm_delivery()
     AMQPExchange(
@@ -35,46 +52,120 @@ def amqp_setup_generator():
     publisher_connection.close()
 
 
-def amqp_data_management_setup(logger, knot_token, device_id):
-    amqp_generator = amqp_setup_generator()
+def amqp_publisher_channel_factory():
+    connection = AMQPConnection(parameters=URLParameters(environ.get("AMQP_URL"))).create()
+    channel = AMQPChannel(connection=connection).create()
+    channel.confirm_delivery()
+    return channel
+
+
+def amqp_rpc_client_factory(logger, channel=None, prefetch_count: int = None, ack_batch_size: int = DEFAULT_ACK_BATCH_SIZE):
+    if channel is None:
+        connection = AMQPConnection(parameters=URLParameters(environ.get("AMQP_URL"))).create()
+        channel = AMQPChannel(connection=connection).create()
+        channel.basic_qos(prefetch_count=prefetch_count or max(amqp_prefetch_count(), ack_batch_size))
+    AMQPExchange(
+        channel=channel,
+        exchange_name=KNoTExchange.device_exchange.value,
+        exchange_type=ExchangeType.direct).declare()
+    rpc_client = AMQPRPCClient(channel=channel, logger=logger, ack_batch_size=ack_batch_size)
+    rpc_client.start()
+    return rpc_client
+
+
+def amqp_reply_subscriber(
+        rpc_client, logger, callback, routing_key, queue_name, channel, persistent, control_consumer=None):
+    if rpc_client is not None:
+        return AMQPRPCSubscriber(
+            client=rpc_client,
+            logger=logger,
+            callback=callback,
+            routing_key=routing_key)
+    if control_consumer is not None:
+        return AMQPControlSubscriber(
+            consumer=control_consumer,
+            logger=logger,
+            callback=callback,
+            routing_key=routing_key)
+    return AMQPSubscriber(
+        channel=channel,
+        queue_name=queue_name,
+        logger=logger,
+        callback=callback,
+        routing_key=routing_key,
+        persistent=persistent)
+
+
+def amqp_data_management_setup(
+        logger,
+        knot_token,
+        device_id,
+        connection_pool: AMQPConnectionPool = None,
+        persistent_reply_queues: bool = False,
+        rpc_client: AMQPRPCClient = None,
+        supervisor: AMQPConnectionSupervisor = None,
+        prefetch_count: int = None,
+        multiplexed_control_queue: bool = False):
+    attachment = None
+    if supervisor is not None:
+        attachment = AMQPSupervisedAttachment(supervisor=supervisor, logger=logger)
+        amqp_generator = amqp_supervised_setup_generator(supervisor, attachment)
+    elif connection_pool is not None:
+        attachment = AMQPPooledLease(connection_pool)
+        amqp_generator = amqp_pooled_setup_generator(connection_pool, attachment)
+    else:
+        amqp_generator = amqp_setup_generator(prefetch_count=prefetch_count)
     subscriber_channel, publisher_channel = next(amqp_generator)
+    control_consumer = None
+    if multiplexed_control_queue and rpc_client is None:
+        control_consumer = AMQPControlConsumer(
+            channel=subscriber_channel,
+            queue_name=f"device_control_{device_id}",
+            logger=logger)
     register_callback = RegisterCallback(token="")
 
-    register_queue_name = f"device_registered_{device_id}"
-    register_subscriber = AMQPSubscriber(
-        channel=subscriber_channel,
-        queue_name=register_queue_name,
+    register_subscriber = amqp_reply_subscriber(
+        rpc_client=rpc_client,
         logger=logger,
         callback=register_callback,
-        routing_key=KNoTRoutingKey.registered_device.value)
+        routing_key=KNoTRoutingKey.registered_device.value,
+        queue_name=f"device_registered_{device_id}",
+        channel=subscriber_channel,
+        persistent=persistent_reply_queues,
+        control_consumer=control_consumer)
 
-    unregister_queue_name = f"device_unregistered_{device_id}"
     unregister_callback = UnregisterCallback()
-    unregister_subscriber = AMQPSubscriber(
-        channel=subscriber_channel,
-        callback=unregister_callback,
+    unregister_subscriber = amqp_reply_subscriber(
+        rpc_client=rpc_client,
         logger=logger,
-        queue_name=unregister_queue_name,
-        routing_key=KNoTRoutingKey.unregistered_device.value
-    )
+        callback=unregister_callback,
+        routing_key=KNoTRoutingKey.unregistered_device.value,
+        queue_name=f"device_unregistered_{device_id}",
+        channel=subscriber_channel,
+        persistent=persistent_reply_queues,
+        control_consumer=control_consumer)
 
-    auth_queue_name = f"device_auth_queue_{device_id}"
     auth_callback = AuthCallback()
-    auth_subscriber = AMQPSubscriber(
-        channel=subscriber_channel,
-        queue_name=auth_queue_name,
+    auth_subscriber = amqp_reply_subscriber(
+        rpc_client=rpc_client,
         logger=logger,
         callback=auth_callback,
-        routing_key="device-auth-rpc")
+        routing_key="device-auth-rpc" if rpc_client is None else rpc_client.reply_to,
+        queue_name=f"device_auth_queue_{device_id}",
+        channel=subscriber_channel,
+        persistent=persistent_reply_queues,
+        control_consumer=control_consumer)
 
-    update_schema_queue_name = f"device_schema_{device_id}"
     update_schema_callback = UpdateSchemaCallback(config=None)
-    update_config_subscriber = AMQPSubscriber(
-        channel=subscriber_channel,
-        queue_name=update_schema_queue_name,
+    update_config_subscriber = amqp_reply_subscriber(
+        rpc_client=rpc_client,
         logger=logger,
         callback=update_schema_callback,
-        routing_key=KNoTRoutingKey.updated_schema.value)
+        routing_key=KNoTRoutingKey.updated_schema.value,
+        queue_name=f"device_schema_{device_id}",
+        channel=subscriber_channel,
+        persistent=persistent_reply_queues,
+        control_consumer=control_consumer)
 
     persistent_message_code = 2
     amqp_properties = BasicProperties(
@@ -101,12 +192,21 @@ def amqp_data_management_setup(logger, knot_token, device_id):
         reply_to="device-auth-rpc",
         correlation_id="auth_correlation_id",
         delivery_mode=persistent_message_code)
-    auth_publisher = AMQPPublisher(
-        channel=publisher_channel,
-        exchange_name="device",
-        routing_key="device.auth",
-        properties=auth_properties,
-        logger=logger)
+    if rpc_client is None:
+        auth_publisher = AMQPPublisher(
+            channel=publisher_channel,
+            exchange_name="device",
+            routing_key="device.auth",
+            properties=auth_properties,
+            logger=logger)
+    else:
+        auth_publisher = AMQPRPCPublisher(
+            channel=publisher_channel,
+            exchange_name="device",
+            routing_key="device.auth",
+            properties=auth_properties,
+            logger=logger,
+            reply_subscriber=auth_subscriber)
 
     update_config_publisher = AMQPPublisher(
         channel=publisher_channel,
@@ -124,6 +224,26 @@ def amqp_data_management_setup(logger, knot_token, device_id):
         logger=logger
     )
 
+    if control_consumer is not None:
+        control_consumer.start()
+
+    if rpc_client is not None and supervisor is not None:
+        supervisor.attach_subscriber(rpc_client)
+
+    if attachment is not None:
+        if control_consumer is not None:
+            attachment.attach_subscriber(control_consumer)
+        for subscriber in (register_subscriber, unregister_subscriber, auth_subscriber, update_config_subscriber):
+            if isinstance(subscriber, AMQPSubscriber):
+                attachment.attach_subscriber(subscriber)
+        for publisher in (
+                register_publisher,
+                unregister_publisher,
+                auth_publisher,
+                update_config_publisher,
+                data_publisher):
+            attachment.attach_publisher(publisher)
+
     return (
         register_subscriber,
         auth_subscriber,
@@ -0,0 +1,103 @@
+import asyncio
+from dataclasses import dataclass
+
+from pika.adapters.asyncio_connection import AsyncioConnection
+from pika.channel import Channel
+from pika.connection import Parameters
+from pika.exceptions import AMQPConnectionError
+
+
+async def channel_rpc(method, **kwargs):
+    future = asyncio.get_running_loop().create_future()
+
+    def on_done(frame=None):
+        if not future.done():
+            future.set_result(frame)
+
+    method(callback=on_done, **kwargs)
+    return await future
+
+
+@dataclass
+class AsyncAMQPConnection:
+    parameters: Parameters
+
+    async def create(self) -> AsyncioConnection:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_open(connection):
+            future.set_result(connection)
+
+        def on_open_error(connection, error):
+            if isinstance(error, BaseException):
+                future.set_exception(error)
+            else:
+                future.set_exception(AMQPConnectionError(error))
+
+        AsyncioConnection(
+            self.parameters,
+            on_open_callback=on_open,
+            on_open_error_callback=on_open_error,
+            custom_ioloop=loop)
+        return await future
+
+
+@dataclass
+class AsyncAMQPChannel:
+    connection: AsyncioConnection
+
+    async def create(self) -> Channel:
+        future = asyncio.get_running_loop().create_future()
+        self.connection.channel(on_open_callback=future.set_result)
+        return await future
+
+
+class AsyncAMQPExchange:
+    def __init__(
+            self,
+            exchange_name: str,
+            exchange_type: str,
+            channel: Channel) -> None:
+        self.__name = exchange_name
+        self.__type = exchange_type
+        self.__channel = channel
+
+    async def declare(self) -> None:
+        await channel_rpc(
+            self.__channel.exchange_declare,
+            exchange=self.__name,
+            exchange_type=self.__type,
+            durable=True,
+            auto_delete=False)
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+
+class AsyncAMQPQueue:
+    def __init__(self, name: str, channel: Channel) -> None:
+        self.__name = name
+        self.__channel = channel
+
+    async def declare(self) -> None:
+        await channel_rpc(self.__channel.queue_declare, queue=self.__name)
+
+    async def bind(self, exchange_name: str, routing_key: str) -> None:
+        await channel_rpc(
+            self.__channel.queue_bind,
+            queue=self.__name,
+            exchange=exchange_name,
+            routing_key=routing_key)
+
+    async def delete(self) -> None:
+        await channel_rpc(
+            self.__channel.queue_delete,
+            queue=self.__name,
+            if_unused=False,
+            if_empty=False)
+
+    @property
+    def name(self) -> str:
+        return self.__name
@@ -0,0 +1,143 @@
+import asyncio
+from os import environ
+
+from pika import BasicProperties, URLParameters
+from pika.exchange_type import ExchangeType
+
+from knot_protocol.infrastructure.adapter.input.amqp_setup import \
+    amqp_prefetch_count
+from knot_protocol.infrastructure.adapter.input.async_amqp_connection import (
+    AsyncAMQPChannel, AsyncAMQPConnection, AsyncAMQPExchange, channel_rpc)
+from knot_protocol.infrastructure.adapter.input.async_subscriber import \
+    AsyncAMQPSubscriber
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    AuthCallback, RegisterCallback, UnregisterCallback, UpdateSchemaCallback)
+from knot_protocol.infrastructure.adapter.output.async_publisher import \
+    AsyncAMQPPublisher
+from knot_protocol.infrastructure.adapter.output.pipelined_publisher import \
+    AMQPConfirmTracker
+from knot_protocol.infrastructure.utils.knot_amqp_options import (
+    KNoTExchange, KNoTRoutingKey)
+
+
+async def amqp_async_setup_generator(prefetch_count: int = None):
+    parameters = URLParameters(environ.get("AMQP_URL"))
+    subscriber_connection = await AsyncAMQPConnection(parameters=parameters).create()
+    publisher_connection = await AsyncAMQPConnection(parameters=parameters).create()
+    subscriber_channel = await AsyncAMQPChannel(connection=subscriber_connection).create()
+    await channel_rpc(subscriber_channel.basic_qos, prefetch_count=prefetch_count or amqp_prefetch_count())
+    publisher_channel = await AsyncAMQPChannel(connection=publisher_connection).create()
+    await AsyncAMQPExchange(
+        channel=subscriber_channel,
+        exchange_name=KNoTExchange.device_exchange.value,
+        exchange_type=ExchangeType.direct).declare()
+    await AsyncAMQPExchange(
+        channel=subscriber_channel,
+        exchange_name=KNoTExchange.data_sent_exchange.value,
+        exchange_type=ExchangeType.fanout
+    ).declare()
+    yield subscriber_channel, publisher_channel
+    subscriber_channel.close()
+    publisher_channel.close()
+    subscriber_connection.close()
+    publisher_connection.close()
+
+
+async def amqp_async_data_management_setup(logger, knot_token, device_id, prefetch_count: int = None):
+    loop = asyncio.get_running_loop()
+    amqp_generator = amqp_async_setup_generator(prefetch_count=prefetch_count)
+    subscriber_channel, publisher_channel = await amqp_generator.__anext__()
+    tracker = AMQPConfirmTracker(channel=publisher_channel, logger=logger)
+
+    register_subscriber = AsyncAMQPSubscriber(
+        channel=subscriber_channel,
+        queue_name=f"device_registered_{device_id}",
+        logger=logger,
+        callback=RegisterCallback(token=""),
+        routing_key=KNoTRoutingKey.registered_device.value,
+        loop=loop)
+
+    unregister_subscriber = AsyncAMQPSubscriber(
+        channel=subscriber_channel,
+        queue_name=f"device_unregistered_{device_id}",
+        logger=logger,
+        callback=UnregisterCallback(),
+        routing_key=KNoTRoutingKey.unregistered_device.value,
+        loop=loop)
+
+    auth_subscriber = AsyncAMQPSubscriber(
+        channel=subscriber_channel,
+        queue_name=f"device_auth_queue_{device_id}",
+        logger=logger,
+        callback=AuthCallback(),
+        routing_key="device-auth-rpc",
+        loop=loop)
+
+    update_config_subscriber = AsyncAMQPSubscriber(
+        channel=subscriber_channel,
+        queue_name=f"device_schema_{device_id}",
+        logger=logger,
+        callback=UpdateSchemaCallback(config=None),
+        routing_key=KNoTRoutingKey.updated_schema.value,
+        loop=loop)
+
+    persistent_message_code = 2
+    amqp_properties = BasicProperties(
+        headers={"Authorization": f"{knot_token}"},
+        delivery_mode=persistent_message_code)
+    register_publisher = AsyncAMQPPublisher(
+        tracker=tracker,
+        properties=amqp_properties,
+        exchange_name="device",
+        routing_key="device.register",
+        logger=logger,
+        loop=loop)
+
+    unregister_publisher = AsyncAMQPPublisher(
+        tracker=tracker,
+        properties=amqp_properties,
+        exchange_name="device",
+        routing_key="device.unregister",
+        logger=logger,
+        loop=loop)
+
+    auth_properties = BasicProperties(
+        headers={"Authorization": f"{knot_token}"},
+        reply_to="device-auth-rpc",
+        correlation_id="auth_correlation_id",
+        delivery_mode=persistent_message_code)
+    auth_publisher = AsyncAMQPPublisher(
+        tracker=tracker,
+        exchange_name="device",
+        routing_key="device.auth",
+        properties=auth_properties,
+        logger=logger,
+        loop=loop)
+
+    update_config_publisher = AsyncAMQPPublisher(
+        tracker=tracker,
+        exchange_name="device",
+        routing_key="device.config.sent",
+        properties=amqp_properties,
+        logger=logger,
+        loop=loop)
+
+    data_publisher = AsyncAMQPPublisher(
+        tracker=tracker,
+        exchange_name=KNoTExchange.data_sent_exchange.value,
+        routing_key="",
+        properties=amqp_properties,
+        logger=logger,
+        loop=loop)
+
+    return (
+        register_subscriber,
+        auth_subscriber,
+        update_config_subscriber,
+        register_publisher,
+        auth_publisher,
+        update_config_publisher,
+        data_publisher,
+        unregister_subscriber,
+        unregister_publisher,
+        amqp_generator)
@@ -0,0 +1,75 @@
+import asyncio
+from dataclasses import dataclass
+from logging import Logger
+from os import environ
+
+from pika.channel import Channel
+
+from knot_protocol.domain.boundary.input.subscriber import Subscriber
+from knot_protocol.infrastructure.adapter.input.async_amqp_connection import (
+    AsyncAMQPQueue, channel_rpc)
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    FIVE_MINUTES_IN_SECONDS, AMQPCallback)
+from knot_protocol.infrastructure.utils.knot_amqp_options import KNoTExchange
+from knot_protocol.infrastructure.utils.utils import run_on_event_loop
+
+
+@dataclass
+class AsyncAMQPSubscriber(Subscriber):
+    channel: Channel
+    queue_name: str
+    logger: Logger
+    callback: AMQPCallback
+    routing_key: str
+    loop: asyncio.AbstractEventLoop
+    timeout: int = environ.get("CONSUMER_TIMEOUT", FIVE_MINUTES_IN_SECONDS)
+
+    def __post_init__(self) -> None:
+        self.__consumer_tag = None
+
+    def __enter__(self) -> None:
+        run_on_event_loop(self.loop, self.__aenter__())
+
+    def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
+        run_on_event_loop(self.loop, self.__aexit__(exception_type, exception_value, exception_traceback))
+
+    async def __aenter__(self) -> None:
+        queue = AsyncAMQPQueue(channel=self.channel, name=self.queue_name)
+        await queue.declare()
+        await queue.bind(
+            exchange_name=KNoTExchange.device_exchange.value,
+            routing_key=self.routing_key)
+
+    async def __aexit__(self, exception_type, exception_value, exception_traceback) -> None:
+        await AsyncAMQPQueue(channel=self.channel, name=self.queue_name).delete()
+
+    def subscribe(self):
+        run_on_event_loop(self.loop, self.subscribe_async())
+
+    def unsubscribe(self):
+        self.loop.call_soon_threadsafe(self.__cancel_consumer)
+
+    def __cancel_consumer(self):
+        if self.__consumer_tag is None or not self.channel.is_open:
+            return
+        self.channel.basic_cancel(consumer_tag=self.__consumer_tag)
+        self.__consumer_tag = None
+
+    async def subscribe_async(self):
+        done = self.loop.create_future()
+
+        def on_message(channel, method, properties, body):
+            if self.callback.execute(channel, method, properties, body, self.queue_name) and not done.done():
+                done.set_result(None)
+
+        consumer_tag = self.channel.basic_consume(queue=self.queue_name, on_message_callback=on_message)
+        self.__consumer_tag = consumer_tag
+        try:
+            await asyncio.wait_for(done, timeout=float(self.timeout))
+        except asyncio.TimeoutError:
+            self.logger.error("Timeout!")
+        finally:
+            if self.__consumer_tag == consumer_tag:
+                self.__consumer_tag = None
+                if self.channel.is_open:
+                    await channel_rpc(self.channel.basic_cancel, consumer_tag=consumer_tag)
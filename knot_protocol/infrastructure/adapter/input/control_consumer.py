@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from logging import Logger
+from os import environ
+from time import monotonic
+from typing import Any, Dict, List, Set
+
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import ConnectionClosedByBroker
+from pika.spec import Basic, BasicProperties
+from tenacity import retry
+from tenacity.retry import retry_if_exception_type
+from tenacity.wait import wait_exponential
+
+from knot_protocol.domain.boundary.input.subscriber import Subscriber
+from knot_protocol.infrastructure.adapter.input.amqp_connection import (
+    AMQPQueue, reconnect_channel)
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    FIVE_MINUTES_IN_SECONDS, AMQPCallback)
+from knot_protocol.infrastructure.utils.knot_amqp_options import KNoTExchange
+
+
+class AMQPControlConsumer:
+    def __init__(self, channel: BlockingChannel, queue_name: str, logger: Logger) -> None:
+        self.channel = channel
+        self.queue_name = queue_name
+        self.supervisor: Any = None
+        self.__logger = logger
+        self.__queue = AMQPQueue(name=queue_name, channel=channel)
+        self.__callbacks: Dict[str, AMQPCallback] = {}
+        self.__bound: Set[str] = set()
+        self.__responded: Set[str] = set()
+        self.__consumer_tag = None
+
+    @property
+    def routing_keys(self) -> List[str]:
+        return list(self.__callbacks)
+
+    @property
+    def is_consuming(self) -> bool:
+        return self.__consumer_tag is not None
+
+    def register(self, routing_key: str, callback: AMQPCallback) -> None:
+        self.__callbacks[routing_key] = callback
+        if self.is_consuming:
+            self.__bind(routing_key)
+
+    def release(self, routing_key: str) -> None:
+        self.__callbacks.pop(routing_key, None)
+        self.__responded.discard(routing_key)
+        if not self.__callbacks:
+            self.stop()
+
+    def start(self) -> None:
+        if self.is_consuming:
+            return
+        self.__queue.declare(auto_delete=True)
+        for routing_key in self.__callbacks:
+            self.__bind(routing_key)
+        self.__consumer_tag = self.channel.basic_consume(
+            queue=self.queue_name,
+            on_message_callback=self.__on_message)
+
+    def stop(self) -> None:
+        if not self.is_consuming:
+            return
+        self.channel.basic_cancel(self.__consumer_tag)
+        self.__consumer_tag = None
+        self.channel.queue_delete(queue=self.queue_name, if_unused=False, if_empty=False)
+        self.__bound.clear()
+
+    def rebind(self, channel: BlockingChannel) -> None:
+        self.channel = channel
+        self.__queue = AMQPQueue(name=self.queue_name, channel=channel)
+        self.__bound.clear()
+        self.__consumer_tag = None
+        self.start()
+
+    def reconnect(self) -> None:
+        if self.supervisor is None:
+            self.rebind(reconnect_channel(self.channel))
+        else:
+            self.supervisor.reconnect()
+
+    def reset(self, routing_key: str) -> None:
+        self.__responded.discard(routing_key)
+
+    def wait(self, routing_key: str, timeout: float) -> bool:
+        self.start()
+        deadline = monotonic() + timeout
+        while routing_key not in self.__responded:
+            remaining_time = deadline - monotonic()
+            if remaining_time <= 0:
+                return False
+            self.channel.connection.process_data_events(time_limit=remaining_time)
+        return True
+
+    def __bind(self, routing_key: str) -> None:
+        if routing_key in self.__bound:
+            return
+        self.__queue.bind(exchange_name=KNoTExchange.device_exchange.value, routing_key=routing_key)
+        self.__bound.add(routing_key)
+
+    def __on_message(self, channel: BlockingChannel, method: Basic.Deliver, properties: BasicProperties, body: bytes):
+        callback = self.__callbacks.get(method.routing_key)
+        if callback is None:
+            self.__logger.error(f"Discarding response on unexpected routing key {method.routing_key}")
+            channel.basic_nack(delivery_tag=method.delivery_tag, multiple=False, requeue=False)
+            return
+        if callback.execute(channel, method, properties, body, self.queue_name):
+            self.__responded.add(method.routing_key)
+
+
+@dataclass
+class AMQPControlSubscriber(Subscriber):
+    consumer: AMQPControlConsumer
+    logger: Logger
+    callback: AMQPCallback
+    routing_key: str
+    timeout: int = environ.get("CONSUMER_TIMEOUT", FIVE_MINUTES_IN_SECONDS)
+
+    def __post_init__(self) -> None:
+        self.consumer.register(self.routing_key, self.callback)
+
+    def __enter__(self) -> None:
+        self.consumer.reset(self.routing_key)
+        self.consumer.start()
+
+    def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
+        return
+
+    @retry(
+        retry=retry_if_exception_type(ConnectionClosedByBroker),
+        wait=wait_exponential(multiplier=1, min=4, max=10))
+    def subscribe(self):
+        if self.consumer.channel.connection.is_closed:
+            self.logger.info("Subscriber connection closed! Reconnecting...")
+            self.consumer.reconnect()
+        if not self.consumer.wait(self.routing_key, timeout=float(self.timeout)):
+            self.logger.error("Timeout!")
+
+    def unsubscribe(self):
+        self.consumer.release(self.routing_key)
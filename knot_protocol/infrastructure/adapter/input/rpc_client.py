@@ -0,0 +1,235 @@
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from logging import Logger
+from os import environ
+from time import monotonic
+from typing import Any, Dict, Hashable, Set, Tuple
+from uuid import uuid4
+
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.spec import Basic, BasicProperties
+
+from knot_protocol.domain.boundary.input.subscriber import Subscriber
+from knot_protocol.domain.exceptions.device_exception import (
+    AlreadyRegisteredDeviceException, AuthenticationErrorException,
+    DeviceNotFoundException, RPCTimeoutException, UnauthorizedException,
+    UnregisteredException, UpdateConfigurationException)
+from knot_protocol.infrastructure.adapter.input.amqp_connection import (
+    AMQPQueue, reconnect_channel)
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    FIVE_MINUTES_IN_SECONDS, AMQPCallback)
+from knot_protocol.infrastructure.utils.knot_amqp_options import KNoTExchange
+from knot_protocol.infrastructure.utils.utils import json_parser
+
+DEFAULT_UNCLAIMED_RESPONSE_TTL: float = 30.0
+DEFAULT_ACK_BATCH_SIZE: int = 1
+
+
+def correlation_key(correlation_id: str) -> Tuple[str, str]:
+    return "correlation_id", correlation_id
+
+
+def device_key(routing_key: str, device_id: str) -> Tuple[str, str]:
+    return routing_key, device_id
+
+
+class AMQPRPCClient:
+    def __init__(
+            self,
+            channel: BlockingChannel,
+            logger: Logger,
+            unclaimed_response_ttl: float = DEFAULT_UNCLAIMED_RESPONSE_TTL,
+            ack_batch_size: int = DEFAULT_ACK_BATCH_SIZE) -> None:
+        if ack_batch_size < 1:
+            raise ValueError("ack_batch_size must be at least 1.")
+        self.channel = channel
+        self.supervisor: Any = None
+        self.reply_to = f"device-rpc-{uuid4().hex}"
+        self.unclaimed_response_ttl = unclaimed_response_ttl
+        self.ack_batch_size = ack_batch_size
+        self.__logger = logger
+        self.__queue = AMQPQueue(name=self.reply_to, channel=channel)
+        self.__routing_keys: Set[str] = set()
+        self.__pending: Dict[Hashable, Future] = {}
+        self.__unclaimed: "OrderedDict[Hashable, Tuple[float, bytes]]" = OrderedDict()
+        self.__consumer_tag = None
+        self.__last_delivery_tag = None
+        self.__unacked = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self.__pending)
+
+    def start(self) -> None:
+        if self.__consumer_tag is not None:
+            return
+        self.__queue.declare(auto_delete=True)
+        self.bind(self.reply_to)
+        self.__consumer_tag = self.channel.basic_consume(
+            queue=self.reply_to,
+            on_message_callback=self.__on_message)
+
+    def rebind(self, channel: BlockingChannel) -> None:
+        routing_keys = self.__routing_keys
+        self.channel = channel
+        self.__last_delivery_tag = None
+        self.__unacked = 0
+        self.__queue = AMQPQueue(name=self.reply_to, channel=channel)
+        self.__routing_keys = set()
+        self.__consumer_tag = None
+        self.start()
+        for routing_key in routing_keys:
+            self.bind(routing_key)
+
+    def reconnect(self) -> None:
+        if self.supervisor is None:
+            self.rebind(reconnect_channel(self.channel))
+        else:
+            self.supervisor.reconnect()
+
+    def stop(self) -> None:
+        if self.__consumer_tag is None:
+            return
+        self.flush_acks()
+        self.channel.basic_cancel(self.__consumer_tag)
+        self.__consumer_tag = None
+        for future in self.__pending.values():
+            future.cancel()
+        self.__pending.clear()
+
+    def bind(self, routing_key: str) -> None:
+        if routing_key in self.__routing_keys:
+            return
+        self.__queue.bind(exchange_name=KNoTExchange.device_exchange.value, routing_key=routing_key)
+        self.__routing_keys.add(routing_key)
+
+    def expect(self, key: Hashable) -> Future:
+        future = self.__pending.get(key)
+        if future is not None:
+            return future
+        future = Future()
+        unclaimed_response = self.__unclaimed.pop(key, None)
+        if unclaimed_response is None:
+            self.__pending[key] = future
+        else:
+            future.set_result(unclaimed_response[1])
+        return future
+
+    def discard(self, key: Hashable) -> None:
+        future = self.__pending.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def wait(self, key: Hashable, timeout: float) -> bytes:
+        future = self.expect(key)
+        deadline = monotonic() + timeout
+        while not future.done():
+            remaining_time = deadline - monotonic()
+            if remaining_time <= 0:
+                self.__pending.pop(key, None)
+                future.set_exception(RPCTimeoutException(f"No response for {key} after {timeout} seconds."))
+                break
+            self.flush_acks()
+            self.channel.connection.process_data_events(time_limit=remaining_time)
+        self.flush_acks()
+        return future.result()
+
+    def flush_acks(self) -> None:
+        if self.__last_delivery_tag is None:
+            return
+        self.channel.basic_ack(delivery_tag=self.__last_delivery_tag, multiple=self.__unacked > 1)
+        self.__last_delivery_tag = None
+        self.__unacked = 0
+
+    def __on_message(self, channel: BlockingChannel, method: Basic.Deliver, properties: BasicProperties, body: bytes):
+        self.__last_delivery_tag = method.delivery_tag
+        self.__unacked += 1
+        if self.__unacked >= self.ack_batch_size:
+            self.flush_acks()
+        key = self.__dispatch_key(method, properties, body)
+        if key is None:
+            return
+        future = self.__pending.pop(key, None)
+        if future is not None:
+            future.set_result(body)
+            return
+        self.__keep_unclaimed(key, body)
+
+    def __dispatch_key(self, method: Basic.Deliver, properties: BasicProperties, body: bytes):
+        if properties is not None and properties.correlation_id:
+            return correlation_key(properties.correlation_id)
+        try:
+            return device_key(method.routing_key, json_parser(body).get("id"))
+        except (ValueError, AttributeError):
+            self.__logger.error(f"Discarding malformed response on {method.routing_key}")
+            return None
+
+    def __keep_unclaimed(self, key: Hashable, body: bytes) -> None:
+        now = monotonic()
+        self.__unclaimed[key] = (now, body)
+        self.__unclaimed.move_to_end(key)
+        while self.__unclaimed:
+            oldest_key, (received_time, _) = next(iter(self.__unclaimed.items()))
+            if now - received_time < self.unclaimed_response_ttl:
+                break
+            del self.__unclaimed[oldest_key]
+
+
+@dataclass
+class AMQPRPCSubscriber(Subscriber):
+    client: AMQPRPCClient
+    logger: Logger
+    callback: AMQPCallback
+    routing_key: str
+    timeout: int = environ.get("CONSUMER_TIMEOUT", FIVE_MINUTES_IN_SECONDS)
+
+    def __post_init__(self) -> None:
+        self.correlation_id = None
+        self.client.bind(self.routing_key)
+
+    @property
+    def shared_connection(self) -> AMQPRPCClient:
+        return self.client
+
+    def __enter__(self) -> None:
+        self.correlation_id = None
+
+    def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
+        if exception_type is not None:
+            self.client.discard(self.__key())
+
+    def expect(self, correlation_id: str) -> None:
+        self.correlation_id = correlation_id
+        self.client.expect(self.__key())
+
+    def subscribe(self):
+        if self.client.channel.connection.is_closed:
+            self.logger.info("RPC client connection closed! Reconnecting...")
+            self.client.reconnect()
+        try:
+            body = self.client.wait(self.__key(), timeout=float(self.timeout))
+        except RPCTimeoutException:
+            self.logger.error("Timeout!")
+            return
+        except CancelledError:
+            self.logger.error("RPC client stopped while waiting for a response.")
+            return
+        try:
+            self.callback.handle(body)
+        except (
+            UnauthorizedException,
+            AlreadyRegisteredDeviceException,
+            DeviceNotFoundException,
+            AuthenticationErrorException,
+            UnregisteredException,
+            UpdateConfigurationException) as exception:
+            self.logger.error(f"Error: {exception}")
+
+    def unsubscribe(self):
+        self.client.discard(self.__key())
+
+    def __key(self) -> Hashable:
+        if self.correlation_id is not None:
+            return correlation_key(self.correlation_id)
+        return device_key(self.routing_key, self.callback.device_id)
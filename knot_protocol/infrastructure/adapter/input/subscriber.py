@@ -2,8 +2,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from os import environ
 from logging import Logger
+from time import monotonic
+from typing import Any
 
-from pika import URLParameters
 from pika.exceptions import ConnectionClosedByBroker
 from pika.channel import Channel
 from tenacity import retry
@@ -21,7 +22,7 @@ from knot_protocol.domain.exceptions.device_exception import (
     DeviceNotFoundException,
     UnauthorizedException)
 from knot_protocol.infrastructure.adapter.input.amqp_connection import (
-    AMQPChannel, AMQPConnection, AMQPQueue)
+    AMQPQueue, reconnect_channel)
 from knot_protocol.infrastructure.adapter.input.DTO.device_auth_response_DTO import \
     AuthDeviceResponseDTO
 from knot_protocol.infrastructure.adapter.input.DTO.device_configuration_response_DTO import \
@@ -46,33 +47,39 @@ def delete_queue(channel: Channel, queue_name: str):
 def message_handler(func):
     CHANNEL_INDEX: int = 1
     METHOD_INDEX: int = 2
-    def wrapper(*args):
+    def wrapper(*args) -> bool:
         channel = args[CHANNEL_INDEX]
         method = args[METHOD_INDEX]
-        if channel.is_open:
-            try:
-                func(*args)
-            except (
-                UnauthorizedException,
-                AlreadyRegisteredDeviceException,
-                DeviceNotFoundException,
-                AuthenticationErrorException) as exception:
-                channel.basic_ack(delivery_tag=method.delivery_tag, multiple=False)
-                channel.cancel()
-                logger.error(f"Error: {exception}")
-            except DifferentDeviceIdentifierException:
-                channel.basic_nack(delivery_tag=method.delivery_tag, multiple=False, requeue=False)
-            except Exception:
-                channel.basic_nack(delivery_tag=method.delivery_tag, multiple=False, requeue=True)
-            else:
-                channel.basic_ack(delivery_tag=method.delivery_tag, multiple=False)
-                channel.cancel()
+        if not channel.is_open:
+            return False
+        try:
+            func(*args)
+        except (
+            UnauthorizedException,
+            AlreadyRegisteredDeviceException,
+            DeviceNotFoundException,
+            AuthenticationErrorException) as exception:
+            channel.basic_ack(delivery_tag=method.delivery_tag, multiple=False)
+            logger.error(f"Error: {exception}")
+        except DifferentDeviceIdentifierException:
+            channel.basic_nack(delivery_tag=method.delivery_tag, multiple=False, requeue=False)
+            return False
+        except Exception:
+            channel.basic_nack(delivery_tag=method.delivery_tag, multiple=False, requeue=True)
+            return False
+        else:
+            channel.basic_ack(delivery_tag=method.delivery_tag, multiple=False)
+        return True
     return wrapper
 
 
 class AMQPCallback(ABC):
-    @abstractmethod
+    @message_handler
     def execute(self, channel, method, properties, body, queue_name):
+        self.handle(body)
+
+    @abstractmethod
+    def handle(self, body):
         ...
 
 
@@ -82,8 +89,7 @@ class RegisterCallback(AMQPCallback):
     consumer_tag: str = ""
     device_id: str = ""
 
-    @message_handler
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         dict_body = json_parser(body)
         response = DeviceRegistrationResponseDTO().load(dict_body)
         if response.id != self.device_id:
@@ -98,8 +104,7 @@ class UnregisterCallback(AMQPCallback):
     consumer_tag: str = ""
     device_id: str = ""
     
-    @message_handler
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         dict_body = json_parser(body)
         response = DeviceUnregistrationResponseDTO().load(dict_body)
         if response.id != self.device_id:
@@ -115,8 +120,7 @@ class AuthCallback(AMQPCallback):
     consumer_tag: str = ""
     device_id: str = ""
 
-    @message_handler
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         dict_body = json_parser(body)
         response = AuthDeviceResponseDTO().load(dict_body)
         if response.id != self.device_id:
@@ -132,9 +136,9 @@ class UpdateSchemaCallback(AMQPCallback):
     consumer_tag: str = ""
     config: SchemaDTO = None
     device_id: str = ""
+    acknowledged: bool = False
 
-    @message_handler
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         dict_body = json_parser(body)
         response = ConfigUpdateResponseSchema().load(dict_body)
         if response.id != self.device_id:
@@ -145,6 +149,7 @@ class UpdateSchemaCallback(AMQPCallback):
             raise UpdateConfigurationException(response.error)
         if response.changed:
             self.config = response.config
+        self.acknowledged = True
 
 
 @dataclass
@@ -155,22 +160,65 @@ class AMQPSubscriber(Subscriber):
     callback: AMQPCallback
     routing_key: str
     timeout: int = environ.get("CONSUMER_TIMEOUT", FIVE_MINUTES_IN_SECONDS)
+    persistent: bool = False
+    supervisor: Any = None
+
+    def __post_init__(self) -> None:
+        self.__declared = False
+        self.__consumer_tag = None
+        self.__responded = False
+        self.__consuming = False
 
     def __enter__(self) -> None:
-        self.__queue_setup()
+        self.__responded = False
+        if not self.__declared:
+            self.__queue_setup()
 
     def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
-        self.__queue_teardown()
+        if not self.is_long_lived:
+            self.__queue_teardown()
+
+    @property
+    def is_consuming(self) -> bool:
+        return self.__consuming
+
+    @property
+    def is_long_lived(self) -> bool:
+        return self.persistent or self.__consuming
+
+    def start_consuming(self) -> None:
+        self.__consuming = True
+        if not self.__declared:
+            self.__queue_setup()
+        if self.__consumer_tag is None:
+            self.__consumer_tag = self.channel.basic_consume(
+                queue=self.queue_name,
+                on_message_callback=self.__on_message)
+
+    def stop_consuming(self) -> None:
+        self.__consuming = False
+        if self.__consumer_tag is not None:
+            self.channel.basic_cancel(self.__consumer_tag)
+            self.__consumer_tag = None
+        if self.__declared:
+            self.__queue_teardown()
+
+    def rebind(self, channel: Channel) -> None:
+        self.channel = channel
+        self.__declared = False
+        self.__consumer_tag = None
 
     def __queue_setup(self):
         queue = AMQPQueue(channel=self.channel, name=self.queue_name)
-        queue.declare()
+        queue.declare(auto_delete=self.persistent)
         queue.bind(
             exchange_name=KNoTExchange.device_exchange.value,
             routing_key=self.routing_key)
-    
+        self.__declared = self.is_long_lived
+
     def __queue_teardown(self):
         self.channel.queue_delete(queue=self.queue_name, if_unused=False, if_empty=False)
+        self.__declared = False
 
     @retry(
         retry=retry_if_exception_type(ConnectionClosedByBroker),
@@ -178,12 +226,23 @@ class AMQPSubscriber(Subscriber):
     def subscribe(self):
         if self.channel.connection.is_closed:
             self.logger.info("Subscriber connection closed! Reconnecting...")
-            connection = AMQPConnection(URLParameters(environ.get("AMQP_URL"))).create()
-            self.channel = AMQPChannel(connection=connection).create()
-        self.__start()
+            if self.supervisor is None:
+                self.rebind(reconnect_channel(self.channel))
+            else:
+                self.supervisor.reconnect()
+            self.__queue_setup()
+        if self.is_long_lived:
+            self.__wait_for_response()
+        else:
+            self.__start()
 
     def unsubscribe(self):
-        self.channel.cancel()
+        if self.__consumer_tag is None:
+            self.channel.cancel()
+            return
+        self.channel.basic_cancel(self.__consumer_tag)
+        self.__consumer_tag = None
+        self.__queue_teardown()
 
     def __start(self):
         for method, properties, body in self.channel.consume(
@@ -192,7 +251,26 @@ class AMQPSubscriber(Subscriber):
             if self.__is_message_timeout(method, properties, body):
                 logger.error("Timeout!")
                 break
-            self.callback.execute(self.channel, method, properties, body, self.queue_name)
+            if self.callback.execute(self.channel, method, properties, body, self.queue_name):
+                break
+        self.channel.cancel()
+
+    def __wait_for_response(self):
+        if self.__consumer_tag is None:
+            self.__consumer_tag = self.channel.basic_consume(
+                queue=self.queue_name,
+                on_message_callback=self.__on_message)
+        deadline = monotonic() + float(self.timeout)
+        while not self.__responded:
+            remaining_time = deadline - monotonic()
+            if remaining_time <= 0:
+                logger.error("Timeout!")
+                return
+            self.channel.connection.process_data_events(time_limit=remaining_time)
+
+    def __on_message(self, channel, method, properties, body):
+        if self.callback.execute(channel, method, properties, body, self.queue_name):
+            self.__responded = True
 
     def __is_message_timeout(self, method, properties, body):
         return method is None and properties is None and body is None
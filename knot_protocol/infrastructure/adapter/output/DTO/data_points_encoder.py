@@ -0,0 +1,85 @@
+from json.encoder import encode_basestring_ascii
+from typing import Dict, List
+
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import \
+    DataPointColumns
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.publishing_data_dto import \
+    PublishingData
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DataPointsSchema
+from knot_protocol.infrastructure.adapter.output.DTO.timestamp_formatter import \
+    format_timestamp
+
+INFINITY = float("inf")
+
+
+def encode_number(value) -> str:
+    if value is None:
+        return "null"
+    value = float(value)
+    if value != value:
+        return "NaN"
+    if value == INFINITY:
+        return "Infinity"
+    if value == -INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def encode_string(value) -> str:
+    if value is None:
+        return "null"
+    return encode_basestring_ascii(str(value))
+
+
+def encode_sensor_prefix(sensor_id) -> str:
+    sensor_id = "null" if sensor_id is None else int(sensor_id)
+    return f'{{"sensorId": {sensor_id}, "value": '
+
+
+class DataPointsEncoder:
+    def __init__(self, config: List[ConfigurationDTO] = (), validate: bool = False) -> None:
+        self.validate = validate
+        self.__schema = DataPointsSchema()
+        self.__sensor_prefixes: Dict[int, str] = {
+            configuration.sensor_id: encode_sensor_prefix(configuration.sensor_id)
+            for configuration in config}
+        self.__device_id = None
+        self.__header = ""
+
+    def dumps(self, data: PublishingData) -> bytes:
+        if self.validate:
+            serialized_data = self.__schema.dumps(data)
+            self.__schema.loads(serialized_data)
+            return serialized_data.encode("utf-8")
+        return self.encode(device_id=data.id, data_points=data.data)
+
+    def encode(self, device_id: str, data_points) -> bytes:
+        prefixes = self.__sensor_prefixes
+        body = ", ".join([
+            f'{prefixes.get(data_point.sensor_id) or encode_sensor_prefix(data_point.sensor_id)}'
+            f'{encode_number(data_point.value)}, "timestamp": {encode_string(format_timestamp(data_point.timestamp))}}}'
+            for data_point in data_points])
+        return f"{self.__encode_header(device_id)}{body}]}}".encode("ascii")
+
+    def encode_columns(self, device_id: str, columns: DataPointColumns) -> bytes:
+        if self.validate:
+            return self.dumps(PublishingData(id=device_id, data=columns.to_data_points()))
+        prefixes = self.__sensor_prefixes
+        encoded_timestamps: Dict[str, str] = {}
+        encoded_data_points = []
+        for sensor_id, value, timestamp in zip(columns.sensor_ids, columns.values, columns.timestamps):
+            encoded_timestamp = encoded_timestamps.get(timestamp)
+            if encoded_timestamp is None:
+                encoded_timestamp = encoded_timestamps[timestamp] = f', "timestamp": {encode_string(format_timestamp(timestamp))}}}'
+            encoded_data_points.append(
+                f'{prefixes.get(sensor_id) or encode_sensor_prefix(sensor_id)}{encode_number(value)}{encoded_timestamp}')
+        return f"{self.__encode_header(device_id)}{', '.join(encoded_data_points)}]}}".encode("ascii")
+
+    def __encode_header(self, device_id: str) -> str:
+        if device_id != self.__device_id or not self.__header:
+            self.__device_id = device_id
+            self.__header = f'{{"id": {encode_string(device_id)}, "data": ['
+        return self.__header
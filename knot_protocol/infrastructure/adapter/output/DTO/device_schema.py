@@ -2,9 +2,11 @@ from marshmallow import Schema, ValidationError, fields, post_load
 from marshmallow.validate import And, Length, OneOf, Regexp
 
 from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
-from knot_protocol.domain.boundary.output.DTO.event import Event
-from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO
+from knot_protocol.domain.boundary.output.DTO.event import Event, EventFactory
+from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO, SchemaFactory
 from knot_protocol.domain.entities.device_entity import DeviceEntity
+from knot_protocol.infrastructure.adapter.output.DTO.timestamp_formatter import \
+    format_timestamp
 from knot_protocol.infrastructure.utils.knot_amqp_options import KNoTValueType, KNoTPatterns
 
 
@@ -24,13 +26,25 @@ def is_positive(value):
         raise ValidationError("Value must be positive.")
 
 
+class Timestamp(fields.Field):
+    default_error_messages = {"invalid": "Not a valid timestamp."}
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        return format_timestamp(value)
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise self.make_error("invalid")
+        return value
+
+
 class DataPointSchema(Schema):
     sensorId = fields.Int(
         attribute="sensor_id",
         validate=And(is_integer, is_positive),
         required=True)
     value = fields.Number(required=True)
-    timestamp = fields.Str(required=True)
+    timestamp = Timestamp(required=True)
 
     @post_load
     def make_data_point(self, data, **kwargs):
@@ -57,7 +71,7 @@ class SensorSchema(Schema):
 
     @post_load
     def make_sensor_schema(self, data, **kwargs):
-        return SchemaDTO(**data)
+        return SchemaFactory.intern(SchemaDTO(**data))
 
 
 class SensorEvent(Schema):
@@ -68,7 +82,7 @@ class SensorEvent(Schema):
 
     @post_load
     def make_event(self, data, **kwargs):
-        return Event(**data)
+        return EventFactory.intern(Event(**data))
 
 
 class SensorConfiguration(Schema):
@@ -97,6 +111,8 @@ class DeviceSchema(Schema):
     token = fields.Str(
         validate=[Length(equal=36), Regexp(regex=KNoTPatterns.TOKEN.value)],
         required=True)
+    configHash = fields.Str(attribute="config_hash", allow_none=True)
+    lastAuthTime = fields.Float(attribute="last_auth_time", allow_none=True)
 
     @post_load
     def make_device(self, data, **kwargs):
@@ -0,0 +1,139 @@
+import json
+import os
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Dict
+
+from knot_protocol.domain.boundary.output.DTO.event import Event, EventFactory
+from knot_protocol.domain.boundary.output.DTO.schema import (SchemaDTO,
+                                                             SchemaFactory)
+from knot_protocol.domain.entities.device_entity import DeviceEntity
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DeviceSchema
+
+VALIDATION_CACHE_VERSION: str = "1"
+DEFAULT_VALIDATION_CACHE_SIZE: int = 4096
+DEVICE_FIELDS: Dict[str, str] = {
+    "id": "device_id",
+    "name": "name",
+    "state": "state",
+    "error": "error",
+    "token": "token",
+    "configHash": "config_hash",
+    "lastAuthTime": "last_auth_time",
+}
+SCHEMA_FIELDS: Dict[str, str] = {"typeId": "type_id", "unit": "unit", "valueType": "value_type", "name": "name"}
+EVENT_FIELDS: Dict[str, str] = {
+    "change": "change",
+    "timeSec": "time_seconds",
+    "lowerThreshold": "lower_threshold",
+    "upperThreshold": "upper_threshold",
+}
+
+DEVICE_SCHEMA = DeviceSchema()
+
+
+def content_digest(content: Dict[str, Any]) -> str:
+    serialized_content = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return sha256(f"{VALIDATION_CACHE_VERSION}:{serialized_content}".encode("utf-8")).hexdigest()
+
+
+def build_device(content: Dict[str, Any]) -> DeviceEntity:
+    device = {attribute: content[key] for key, attribute in DEVICE_FIELDS.items() if key in content}
+    device["config"] = [
+        {
+            "sensor_id": configuration["sensorId"],
+            "schema": SchemaFactory.intern(SchemaDTO(**{
+                attribute: configuration["schema"][key] for key, attribute in SCHEMA_FIELDS.items()})),
+            "event": EventFactory.intern(Event(**{
+                attribute: configuration["event"][key]
+                for key, attribute in EVENT_FIELDS.items() if key in configuration["event"]})),
+        }
+        for configuration in content["config"]]
+    return DeviceEntity(**device)
+
+
+def is_same_device(device: DeviceEntity, other: DeviceEntity) -> bool:
+    return all(
+        repr(getattr(device, attribute)) == repr(getattr(other, attribute))
+        for attribute in [*DEVICE_FIELDS.values(), "config"])
+
+
+class DeviceValidationCache:
+    def __init__(self, max_size: int = DEFAULT_VALIDATION_CACHE_SIZE, filepath: str = None) -> None:
+        self.max_size = max_size
+        self.filepath = filepath
+        self.hits = 0
+        self.misses = 0
+        self.__digests: "OrderedDict[str, None]" = OrderedDict()
+        self.__lock = Lock()
+        self.__sidecar_lines = 0
+        if filepath is not None and os.path.exists(filepath):
+            self.__read_sidecar()
+
+    def __len__(self) -> int:
+        return len(self.__digests)
+
+    def load(self, content: Dict[str, Any]) -> DeviceEntity:
+        digest = content_digest(content)
+        with self.__lock:
+            is_validated = digest in self.__digests
+            if is_validated:
+                self.__digests.move_to_end(digest)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if is_validated:
+            return build_device(content)
+        device = DEVICE_SCHEMA.load(content)
+        try:
+            is_canonical = is_same_device(device, build_device(content))
+        except (KeyError, TypeError):
+            is_canonical = False
+        if is_canonical:
+            self.__remember(digest)
+        return device
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__digests.clear()
+            if self.filepath is not None and os.path.exists(self.filepath):
+                os.remove(self.filepath)
+            self.__sidecar_lines = 0
+
+    def __remember(self, digest: str) -> None:
+        with self.__lock:
+            self.__digests[digest] = None
+            while len(self.__digests) > self.max_size:
+                self.__digests.popitem(last=False)
+            if self.filepath is None:
+                return
+            if self.__sidecar_lines >= 2 * self.max_size:
+                self.__write_sidecar()
+                return
+            with open(self.filepath, "a", encoding="utf-8") as file_writer:
+                file_writer.write(f"{digest}\n")
+            self.__sidecar_lines += 1
+
+    def __read_sidecar(self) -> None:
+        with open(self.filepath, "r", encoding="utf-8") as file_reader:
+            for line in file_reader:
+                digest = line.strip()
+                if len(digest) != sha256().digest_size * 2:
+                    continue
+                self.__digests[digest] = None
+                self.__digests.move_to_end(digest)
+                self.__sidecar_lines += 1
+        while len(self.__digests) > self.max_size:
+            self.__digests.popitem(last=False)
+
+    def __write_sidecar(self) -> None:
+        temporary_filepath = f"{self.filepath}.tmp"
+        with open(temporary_filepath, "w", encoding="utf-8") as file_writer:
+            file_writer.writelines(f"{digest}\n" for digest in self.__digests)
+        os.replace(temporary_filepath, self.filepath)
+        self.__sidecar_lines = len(self.__digests)
+
+
+DEFAULT_VALIDATION_CACHE = DeviceValidationCache()
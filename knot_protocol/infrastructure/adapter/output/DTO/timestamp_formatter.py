@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from math import modf
+from typing import Dict, Union
+
+DEFAULT_PREFIX_CACHE_SIZE: int = 64
+MICROSECONDS_PER_SECOND: int = 1000000
+
+
+class TimestampFormatter:
+    def __init__(self, cache_size: int = DEFAULT_PREFIX_CACHE_SIZE) -> None:
+        self.cache_size = cache_size
+        self.__prefixes: Dict[int, str] = {}
+
+    def format(self, timestamp: Union[str, float, int, None]) -> Union[str, None]:
+        if type(timestamp) is float:
+            fraction, seconds = modf(timestamp)
+            microseconds = round(fraction * MICROSECONDS_PER_SECOND)
+            prefix = self.__prefixes.get(seconds)
+            if prefix is not None and 0 < microseconds < MICROSECONDS_PER_SECOND:
+                return f"{prefix}.{microseconds:06d}"
+            return self.__format(int(seconds), microseconds)
+        if timestamp is None or isinstance(timestamp, str):
+            return timestamp
+        if isinstance(timestamp, int):
+            return self.__format(timestamp, 0)
+        return self.format(float(timestamp))
+
+    def __format(self, seconds: int, microseconds: int) -> str:
+        if microseconds >= MICROSECONDS_PER_SECOND:
+            seconds += 1
+            microseconds -= MICROSECONDS_PER_SECOND
+        elif microseconds < 0:
+            seconds -= 1
+            microseconds += MICROSECONDS_PER_SECOND
+        prefix = self.__prefixes.get(seconds)
+        if prefix is None:
+            if len(self.__prefixes) >= self.cache_size:
+                self.__prefixes.clear()
+            prefix = datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            self.__prefixes[seconds] = prefix
+        if microseconds:
+            return f"{prefix}.{microseconds:06d}"
+        return prefix
+
+
+TIMESTAMP_FORMATTER = TimestampFormatter()
+
+
+def format_timestamp(timestamp: Union[str, float, int, None]) -> Union[str, None]:
+    return TIMESTAMP_FORMATTER.format(timestamp)
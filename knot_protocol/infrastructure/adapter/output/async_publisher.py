@@ -0,0 +1,54 @@
+import asyncio
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import List
+
+from knot_protocol.domain.exceptions.device_exception import (
+    PublisherBacklogFullException, UnroutableMessageException)
+from knot_protocol.infrastructure.adapter.output.pipelined_publisher import \
+    AMQPPipelinedPublisher
+from knot_protocol.infrastructure.utils.utils import is_event_loop_thread
+
+
+@dataclass
+class AsyncAMQPPublisher(AMQPPipelinedPublisher):
+    loop: asyncio.AbstractEventLoop = None
+
+    def __post_init__(self) -> None:
+        self.__unconfirmed: List[Future] = []
+
+    def publish(self) -> Future:
+        if is_event_loop_thread(self.loop):
+            future = self.__publish(self.content)
+            self.__unconfirmed.append(future)
+            return future
+        return asyncio.run_coroutine_threadsafe(self.__publish_async(self.content), self.loop)
+
+    async def publish_async(self) -> bool:
+        return await self.__publish_async(self.content)
+
+    async def wait_for_capacity(self) -> None:
+        while not self.tracker.has_capacity:
+            await asyncio.wrap_future(self.tracker.wait_for_capacity())
+
+    async def wait_for_confirms(self) -> bool:
+        unconfirmed, self.__unconfirmed = self.__unconfirmed, []
+        confirmed = True
+        for future in unconfirmed:
+            try:
+                await asyncio.wrap_future(future)
+            except (UnroutableMessageException, PublisherBacklogFullException) as exception:
+                self.logger.error(f"Message was not published: {exception!r}")
+                confirmed = False
+        return confirmed
+
+    async def __publish_async(self, content: str) -> bool:
+        await self.wait_for_capacity()
+        return await asyncio.wrap_future(self.__publish(content))
+
+    def __publish(self, content: str) -> Future:
+        return self.tracker.publish(
+            exchange_name=self.exchange_name,
+            routing_key=self.routing_key,
+            body=content,
+            properties=self.properties)
@@ -0,0 +1,172 @@
+from collections import deque
+from enum import Enum
+from logging import Logger
+from threading import Condition, Event, Thread
+from time import monotonic
+from typing import Any, Callable
+
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import AMQPError
+
+from knot_protocol.domain.boundary.output.publisher import Publisher
+from knot_protocol.infrastructure.adapter.input.amqp_connection import \
+    close_connection
+
+DEFAULT_QUEUE_SIZE: int = 1000
+DEFAULT_HEARTBEAT_INTERVAL: float = 1.0
+DEFAULT_CONNECTION_RETRY_INTERVAL: float = 5.0
+
+
+class OverflowPolicy(Enum):
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
+class BoundedPublishingQueue:
+    def __init__(self, maxsize: int, overflow_policy: OverflowPolicy) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+        self.__items = deque()
+        self.__condition = Condition()
+        self.__closed = False
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def put(self, item: Any) -> bool:
+        with self.__condition:
+            if self.__closed:
+                return False
+            if len(self.__items) >= self.maxsize:
+                if self.overflow_policy is OverflowPolicy.drop_newest:
+                    self.dropped += 1
+                    return False
+                if self.overflow_policy is OverflowPolicy.drop_oldest:
+                    self.__items.popleft()
+                    self.dropped += 1
+                else:
+                    self.__condition.wait_for(lambda: len(self.__items) < self.maxsize or self.__closed)
+                    if self.__closed:
+                        return False
+            self.__items.append(item)
+            self.__condition.notify_all()
+            return True
+
+    def get(self, timeout: float = None) -> Any:
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__items or self.__closed, timeout=timeout)
+            if not self.__items:
+                return None
+            item = self.__items.popleft()
+            self.__condition.notify_all()
+            return item
+
+    def close(self) -> None:
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+
+class BackgroundPublisher(Publisher):
+    def __init__(
+            self,
+            publisher: Publisher,
+            logger: Logger,
+            channel_factory: Callable[[], BlockingChannel],
+            maxsize: int = DEFAULT_QUEUE_SIZE,
+            overflow_policy: OverflowPolicy = OverflowPolicy.block,
+            heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+            connection_retry_interval: float = DEFAULT_CONNECTION_RETRY_INTERVAL) -> None:
+        self.publisher = publisher
+        self.content = ""
+        self.published = 0
+        self.failed = 0
+        self.__logger = logger
+        self.__channel_factory = channel_factory
+        self.__heartbeat_interval = heartbeat_interval
+        self.__connection_retry_interval = connection_retry_interval
+        self.__stopped = Event()
+        self.__queue = BoundedPublishingQueue(maxsize=maxsize, overflow_policy=overflow_policy)
+        self.__thread = Thread(target=self.__run, name="knot-background-publisher", daemon=True)
+
+    @property
+    def dropped(self) -> int:
+        return self.__queue.dropped
+
+    @property
+    def pending(self) -> int:
+        return len(self.__queue)
+
+    def start(self) -> None:
+        supervisor = getattr(self.publisher, "supervisor", None)
+        if supervisor is not None:
+            supervisor.detach_publisher(self.publisher)
+        self.publisher.supervisor = self
+        self.__thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        self.__stopped.set()
+        self.__queue.close()
+        if self.__thread.is_alive():
+            self.__thread.join(timeout)
+
+    def publish(self) -> bool:
+        return self.__queue.put(self.content)
+
+    def reconnect(self) -> None:
+        close_connection(self.publisher.channel.connection)
+        self.publisher.rebind(self.__channel_factory())
+
+    def __run(self) -> None:
+        if not self.__open_channel():
+            return
+        last_heartbeat = monotonic()
+        while True:
+            content = self.__queue.get(timeout=self.__heartbeat_interval)
+            if content is None and self.__queue.closed:
+                break
+            if content is not None:
+                self.__publish(content)
+            if monotonic() - last_heartbeat >= self.__heartbeat_interval:
+                self.__process_data_events()
+                last_heartbeat = monotonic()
+        self.__close_channel()
+
+    def __open_channel(self) -> bool:
+        while not self.__stopped.is_set():
+            try:
+                self.publisher.rebind(self.__channel_factory())
+                return True
+            except Exception as exception:
+                self.__logger.error(f"Background publisher channel could not be opened: {exception!r}")
+                self.__stopped.wait(self.__connection_retry_interval)
+        return False
+
+    def __publish(self, content: Any) -> None:
+        self.publisher.content = content
+        try:
+            self.publisher.publish()
+            self.published += 1
+        except Exception as exception:
+            self.failed += 1
+            self.__logger.error(f"Background publishing failed: {exception!r}")
+
+    def __process_data_events(self) -> None:
+        connection = self.publisher.channel.connection
+        if not connection.is_open:
+            return
+        try:
+            connection.process_data_events(time_limit=0)
+        except AMQPError as exception:
+            self.__logger.error(f"Publisher heartbeat failed: {exception!r}")
+
+    def __close_channel(self) -> None:
+        close_connection(self.publisher.channel.connection)
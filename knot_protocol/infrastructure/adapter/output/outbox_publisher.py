@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from logging import Logger
+from threading import Event, Thread
+from time import monotonic
+from typing import Dict
+
+from pika.exceptions import AMQPError
+
+from knot_protocol.domain.boundary.output.outbox import Outbox
+from knot_protocol.domain.boundary.output.publisher import Publisher
+
+DEFAULT_RETRY_INTERVAL: float = 5.0
+DEFAULT_MAX_RETURNED_ATTEMPTS: int = 3
+DEFAULT_MAX_PUBLISH_ATTEMPTS: int = 1
+
+
+@dataclass
+class OutboxPublisher(Publisher):
+    publisher: Publisher
+    outbox: Outbox
+    logger: Logger
+    content: str = ""
+    batch_size: int = 100
+    retry_interval: float = DEFAULT_RETRY_INTERVAL
+    max_returned_attempts: int = DEFAULT_MAX_RETURNED_ATTEMPTS
+    max_publish_attempts: int = DEFAULT_MAX_PUBLISH_ATTEMPTS
+
+    def __post_init__(self) -> None:
+        self.__last_attempt = monotonic()
+        self.__returned_attempts: Dict[int, int] = {}
+        self.__pending = Event()
+        self.__stopped = Event()
+        self.__thread = Thread(target=self.__run, name="knot-outbox-replay", daemon=True)
+        if hasattr(self.publisher, "max_publish_attempts"):
+            self.publisher.max_publish_attempts = self.max_publish_attempts
+
+    def start(self) -> None:
+        self.__thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        self.__stopped.set()
+        self.__pending.set()
+        if self.__thread.is_alive():
+            self.__thread.join(timeout)
+
+    def publish(self) -> None:
+        self.outbox.append(self.content)
+        self.__pending.set()
+
+    def replay(self) -> bool:
+        self.__last_attempt = monotonic()
+        while True:
+            messages = self.outbox.peek(self.batch_size)
+            if not messages:
+                return True
+            for message_id, payload in messages:
+                self.publisher.content = payload
+                try:
+                    published = self.publisher.publish()
+                except AMQPError as exception:
+                    self.logger.warning(f"Broker unavailable, {len(self.outbox)} message(s) kept in the outbox: {exception!r}")
+                    return False
+                if published is False:
+                    if not self.__set_aside_returned(message_id):
+                        return False
+                    continue
+                self.__returned_attempts.pop(message_id, None)
+                self.outbox.remove(message_id)
+
+    def __run(self) -> None:
+        while True:
+            self.__pending.wait(timeout=self.retry_interval)
+            self.__pending.clear()
+            if self.__is_connected() or self.__is_retry_due():
+                self.replay()
+            if self.__stopped.is_set():
+                return
+
+    def __is_connected(self) -> bool:
+        return getattr(self.publisher, "is_connected", False)
+
+    def __set_aside_returned(self, message_id: int) -> bool:
+        attempts = self.__returned_attempts.get(message_id, 0) + 1
+        if attempts < self.max_returned_attempts:
+            self.__returned_attempts[message_id] = attempts
+            return False
+        self.logger.error(f"Message {message_id} was returned {attempts} times, setting it aside")
+        self.__returned_attempts.pop(message_id, None)
+        self.outbox.set_aside(message_id)
+        return True
+
+    def __is_retry_due(self) -> bool:
+        if self.retry_interval is None:
+            return False
+        return monotonic() - self.__last_attempt >= self.retry_interval
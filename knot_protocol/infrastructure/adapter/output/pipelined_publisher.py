@@ -0,0 +1,216 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from copy import copy
+from dataclasses import dataclass, field
+from logging import Logger
+from os import environ
+from typing import Callable, Deque, Dict, List
+from uuid import uuid4
+
+from pika import BasicProperties
+from pika.channel import Channel
+from pika.frame import Method
+from pika.spec import Basic
+
+from knot_protocol.domain.boundary.output.publisher import Publisher
+from knot_protocol.domain.exceptions.device_exception import (
+    MessageNackedException, PublisherBacklogFullException,
+    UnroutableMessageException)
+
+DEFAULT_MAX_IN_FLIGHT: int = 64
+DEFAULT_MAX_BACKLOG: int = 10000
+DEFAULT_MAX_PUBLISH_ATTEMPTS: int = 5
+
+
+@dataclass
+class PendingMessage:
+    exchange_name: str
+    routing_key: str
+    body: str
+    properties: BasicProperties
+    future: Future = field(default_factory=Future)
+    returned: bool = False
+    attempts: int = 0
+
+    @property
+    def message_id(self) -> str:
+        return self.properties.message_id
+
+
+class AMQPConfirmTracker:
+    def __init__(
+            self,
+            channel: Channel,
+            logger: Logger,
+            max_in_flight: int = None,
+            max_backlog: int = DEFAULT_MAX_BACKLOG,
+            max_publish_attempts: int = DEFAULT_MAX_PUBLISH_ATTEMPTS,
+            on_ack: Callable[[PendingMessage], None] = None,
+            on_nack: Callable[[PendingMessage], None] = None,
+            on_return: Callable[[PendingMessage], None] = None) -> None:
+        if max_in_flight is None:
+            max_in_flight = int(environ.get("AMQP_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT))
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        if max_backlog < 1:
+            raise ValueError("max_backlog must be at least 1.")
+        if max_publish_attempts is not None and max_publish_attempts < 1:
+            raise ValueError("max_publish_attempts must be at least 1.")
+        self.max_in_flight = max_in_flight
+        self.max_backlog = max_backlog
+        self.max_publish_attempts = max_publish_attempts
+        self.on_ack = on_ack
+        self.on_nack = on_nack
+        self.on_return = on_return
+        self.__logger = logger
+        self.__backlog: Deque[PendingMessage] = deque()
+        self.__unconfirmed: "OrderedDict[int, PendingMessage]" = OrderedDict()
+        self.__unconfirmed_by_id: Dict[str, PendingMessage] = {}
+        self.__capacity_waiters: Deque[Future] = deque()
+        self.__delivery_tag = 0
+        self.__channel = None
+        self.rebind(channel)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.__unconfirmed)
+
+    @property
+    def backlog(self) -> int:
+        return len(self.__backlog)
+
+    @property
+    def has_capacity(self) -> bool:
+        return len(self.__backlog) < self.max_backlog
+
+    def wait_for_capacity(self) -> Future:
+        future = Future()
+        if self.has_capacity:
+            future.set_result(True)
+        else:
+            self.__capacity_waiters.append(future)
+        return future
+
+    def rebind(self, channel: Channel) -> None:
+        self.__channel = channel
+        self.__delivery_tag = 0
+        unconfirmed = list(self.__unconfirmed.values())
+        self.__unconfirmed.clear()
+        self.__unconfirmed_by_id.clear()
+        self.__backlog.extendleft(reversed(unconfirmed))
+        channel.confirm_delivery(ack_nack_callback=self.__on_delivery_confirmation)
+        channel.add_on_return_callback(self.__on_message_returned)
+        self.__drain()
+
+    def publish(
+            self,
+            exchange_name: str,
+            routing_key: str,
+            body: str,
+            properties: BasicProperties) -> Future:
+        properties = BasicProperties() if properties is None else copy(properties)
+        properties.message_id = uuid4().hex
+        message = PendingMessage(
+            exchange_name=exchange_name,
+            routing_key=routing_key,
+            body=body,
+            properties=properties)
+        if not self.has_capacity:
+            message.future.set_exception(PublisherBacklogFullException(
+                f"{len(self.__backlog)} message(s) are waiting for the publishing window."))
+            return message.future
+        self.__backlog.append(message)
+        self.__drain()
+        return message.future
+
+    def __drain(self) -> None:
+        while self.__backlog and len(self.__unconfirmed) < self.max_in_flight:
+            if not self.__channel.is_open:
+                break
+            message = self.__backlog.popleft()
+            message.returned = False
+            message.attempts += 1
+            self.__channel.basic_publish(
+                exchange=message.exchange_name,
+                routing_key=message.routing_key,
+                body=message.body,
+                properties=message.properties,
+                mandatory=True)
+            self.__delivery_tag += 1
+            self.__unconfirmed[self.__delivery_tag] = message
+            self.__unconfirmed_by_id[message.message_id] = message
+        while self.__capacity_waiters and self.has_capacity:
+            waiter = self.__capacity_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+
+
+    def __pop_confirmed(self, delivery_tag: int, multiple: bool) -> List[PendingMessage]:
+        if not multiple:
+            message = self.__unconfirmed.pop(delivery_tag, None)
+            confirmed = [message] if message else []
+        else:
+            confirmed = []
+            while self.__unconfirmed and next(iter(self.__unconfirmed)) <= delivery_tag:
+                confirmed.append(self.__unconfirmed.popitem(last=False)[1])
+        for message in confirmed:
+            self.__unconfirmed_by_id.pop(message.message_id, None)
+        return confirmed
+
+    def __has_attempts_left(self, message: PendingMessage) -> bool:
+        return self.max_publish_attempts is None or message.attempts < self.max_publish_attempts
+
+    def __on_delivery_confirmation(self, method_frame: Method) -> None:
+        method = method_frame.method
+        confirmed = self.__pop_confirmed(method.delivery_tag, method.multiple)
+        if isinstance(method, Basic.Nack):
+            retried = [message for message in confirmed if self.__has_attempts_left(message)]
+            dropped = [message for message in confirmed if not self.__has_attempts_left(message)]
+            if retried:
+                self.__logger.warning(f"{len(retried)} message(s) nacked by the broker. Republishing...")
+                self.__backlog.extendleft(reversed(retried))
+            if dropped:
+                self.__logger.error(
+                    f"{len(dropped)} message(s) nacked by the broker {self.max_publish_attempts} time(s). Dropping...")
+            for message in dropped:
+                message.future.set_exception(MessageNackedException(message.routing_key))
+            self.__notify(self.on_nack, confirmed)
+        else:
+            for message in confirmed:
+                if message.returned:
+                    message.future.set_exception(UnroutableMessageException(message.routing_key))
+                else:
+                    message.future.set_result(True)
+            self.__notify(self.on_ack, [message for message in confirmed if not message.returned])
+            self.__notify(self.on_return, [message for message in confirmed if message.returned])
+        self.__drain()
+
+    def __on_message_returned(self, channel, method, properties, body) -> None:
+        message = self.__unconfirmed_by_id.get(getattr(properties, "message_id", None))
+        if message is None:
+            return
+        message.returned = True
+        self.__logger.error(f"Message returned by the broker: {method.reply_text}")
+
+    def __notify(self, callback: Callable[[PendingMessage], None], messages: List[PendingMessage]) -> None:
+        if callback is None:
+            return
+        for message in messages:
+            callback(message)
+
+
+@dataclass
+class AMQPPipelinedPublisher(Publisher):
+    tracker: AMQPConfirmTracker
+    exchange_name: str
+    routing_key: str
+    properties: BasicProperties
+    logger: Logger
+    content: str = ""
+
+    def publish(self) -> Future:
+        return self.tracker.publish(
+            exchange_name=self.exchange_name,
+            routing_key=self.routing_key,
+            body=self.content,
+            properties=self.properties)
@@ -1,16 +1,22 @@
 from dataclasses import dataclass
-from os import environ
 from logging import Logger
-from pika import BasicProperties, URLParameters
+from typing import Any
+
+from pika import BasicProperties
 from pika.adapters.blocking_connection import BlockingChannel
 from pika.channel import Channel
 from pika.exceptions import ConnectionClosedByBroker, UnroutableError
-from tenacity import retry, retry_if_exception_type
+from tenacity import RetryCallState, retry, retry_if_exception_type
 from tenacity.wait import wait_exponential
 
 from knot_protocol.domain.boundary.output.publisher import Publisher
-from knot_protocol.infrastructure.adapter.input.amqp_connection import (
-    AMQPChannel, AMQPConnection)
+from knot_protocol.infrastructure.adapter.input.amqp_connection import \
+    reconnect_channel
+
+
+def stop_after_publish_attempts(retry_state: RetryCallState) -> bool:
+    max_publish_attempts = retry_state.args[0].max_publish_attempts
+    return max_publish_attempts is not None and retry_state.attempt_number >= max_publish_attempts
 
 
 @dataclass
@@ -22,16 +28,28 @@ class AMQPPublisher(Publisher):
     properties: BasicProperties
     logger: Logger
     content: str = ""
+    supervisor: Any = None
+    max_publish_attempts: int = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self.channel.connection.is_open
+
+    def rebind(self, channel: BlockingChannel) -> None:
+        self.channel = channel
 
     @retry(
         retry=retry_if_exception_type(ConnectionClosedByBroker),
-        wait=wait_exponential(multiplier=1, min=4, max=10))
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        stop=stop_after_publish_attempts,
+        reraise=True)
     def publish(self):
         if self.channel.connection.is_closed:
             self.logger.info("Publisher connection closed! Reconnecting...")
-            connection = AMQPConnection(URLParameters(environ.get("AMQP_URL"))).create()
-            self.channel = AMQPChannel(connection=connection).create()
-            self.channel.confirm_delivery()
+            if self.supervisor is None:
+                self.rebind(reconnect_channel(self.channel, publisher_confirms=True))
+            else:
+                self.supervisor.reconnect()
 
         try:
             self.channel.basic_publish(
@@ -41,4 +59,6 @@ class AMQPPublisher(Publisher):
                 properties=self.properties,
                 mandatory=True)
         except UnroutableError:
-            print('Message could not be confirmed')
+            self.logger.error("Message could not be confirmed")
+            return False
+        return True
@@ -0,0 +1,97 @@
+import json
+from abc import ABC, abstractmethod
+from os.path import splitext
+from typing import IO, Any, Dict
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class DeviceCodec(ABC):
+    binary: bool = False
+
+    @abstractmethod
+    def load(self, file_reader: IO) -> Any:
+        ...
+
+    @abstractmethod
+    def dump(self, content: Any, file_writer: IO) -> None:
+        ...
+
+
+class YAMLCodec(DeviceCodec):
+    def load(self, file_reader: IO) -> Any:
+        return yaml.load(file_reader, Loader=SafeLoader)
+
+    def dump(self, content: Any, file_writer: IO) -> None:
+        yaml.dump(content, file_writer, Dumper=SafeDumper)
+
+
+class JSONCodec(DeviceCodec):
+    def load(self, file_reader: IO) -> Any:
+        return json.load(file_reader)
+
+    def dump(self, content: Any, file_writer: IO) -> None:
+        json.dump(content, file_writer, separators=(",", ":"))
+
+
+class MessagePackCodec(DeviceCodec):
+    binary = True
+
+    def load(self, file_reader: IO) -> Any:
+        return self.__msgpack().unpackb(file_reader.read())
+
+    def dump(self, content: Any, file_writer: IO) -> None:
+        file_writer.write(self.__msgpack().packb(content))
+
+    def __msgpack(self):
+        if msgpack is None:
+            raise ModuleNotFoundError("Install msgpack to read and write .msgpack device files.")
+        return msgpack
+
+
+DEFAULT_CODEC: DeviceCodec = YAMLCodec()
+CODECS: Dict[str, DeviceCodec] = {
+    ".yaml": DEFAULT_CODEC,
+    ".yml": DEFAULT_CODEC,
+    ".json": JSONCodec(),
+    ".msgpack": MessagePackCodec(),
+}
+
+
+def register_codec(extension: str, codec: DeviceCodec) -> None:
+    CODECS[extension.lower()] = codec
+
+
+def codec_for(filepath: str) -> DeviceCodec:
+    _, extension = splitext(filepath)
+    return CODECS.get(extension.lower(), DEFAULT_CODEC)
+
+
+def read_file(filepath: str, codec: DeviceCodec = None) -> Any:
+    codec = codec or codec_for(filepath)
+    if codec.binary:
+        with open(filepath, "rb") as file_reader:
+            return codec.load(file_reader)
+    with open(filepath, "r", encoding="utf-8") as file_reader:
+        return codec.load(file_reader)
+
+
+def write_file(filepath: str, content: Any, codec: DeviceCodec = None) -> None:
+    codec = codec or codec_for(filepath)
+    if codec.binary:
+        with open(filepath, "wb") as file_writer:
+            codec.dump(content, file_writer)
+        return
+    with open(filepath, "w", encoding="utf-8") as file_writer:
+        codec.dump(content, file_writer)
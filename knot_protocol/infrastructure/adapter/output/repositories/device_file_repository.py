@@ -1,23 +1,29 @@
 from dataclasses import dataclass
 
-from yaml import safe_dump, safe_load
-
 from knot_protocol.domain.entities.device_entity import DeviceEntity
-from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
-    DeviceSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_validation_cache import (
+    DEFAULT_VALIDATION_CACHE, DEVICE_SCHEMA, DeviceValidationCache)
 from knot_protocol.domain.boundary.output.device_persistence_gateway import DevicePersistenceGateway
+from knot_protocol.infrastructure.adapter.output.repositories.device_codecs import (
+    DeviceCodec, codec_for, read_file, write_file)
 
 
 @dataclass
 class DeviceFileRepository(DevicePersistenceGateway):
     filepath: str
+    codec: DeviceCodec = None
+    validation_cache: DeviceValidationCache = None
+
+    def __post_init__(self) -> None:
+        if self.codec is None:
+            self.codec = codec_for(self.filepath)
+        if self.validation_cache is None:
+            self.validation_cache = DEFAULT_VALIDATION_CACHE
 
     def save(self, device: DeviceEntity) -> None:
-        serialized_device = DeviceSchema().dump(device)
-        with open(self.filepath, "w", encoding="utf-8") as file_writer:
-            safe_dump(serialized_device, file_writer)
+        serialized_device = DEVICE_SCHEMA.dump(device)
+        write_file(self.filepath, serialized_device, codec=self.codec)
 
     def load(self) -> DeviceEntity:
-        with open(file=self.filepath, mode="r", encoding="utf-8") as file_reader:
-            content = safe_load(file_reader)
-        return DeviceSchema().load(content)
+        content = read_file(self.filepath, codec=self.codec)
+        return self.validation_cache.load(content)
@@ -0,0 +1,150 @@
+import json
+import os
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from knot_protocol.domain.boundary.output.device_persistence_gateway import \
+    DevicePersistenceGateway
+from knot_protocol.domain.entities.device_entity import DeviceEntity
+from knot_protocol.infrastructure.adapter.output.DTO.device_validation_cache import (
+    DEFAULT_VALIDATION_CACHE, DEVICE_SCHEMA, DeviceValidationCache)
+from knot_protocol.infrastructure.adapter.output.repositories.device_codecs import (
+    DeviceCodec, codec_for, read_file, write_file)
+
+GENERATION_KEY: str = "generation"
+LIFECYCLE_FIELDS: Dict[str, str] = {
+    "state": "state",
+    "token": "token",
+    "error": "error",
+    "configHash": "config_hash",
+    "lastAuthTime": "last_auth_time",
+}
+
+
+def lifecycle_content(device: DeviceEntity) -> Dict[str, Any]:
+    content = {key: getattr(device, attribute) for key, attribute in LIFECYCLE_FIELDS.items()}
+    content["state"] = str(device.state)
+    return content
+
+
+@dataclass
+class JournaledDeviceRepository(DevicePersistenceGateway):
+    filepath: str
+    journal_filepath: str = None
+    codec: DeviceCodec = None
+    fsync_batch_size: int = 16
+    fsync_interval: float = 1.0
+    compaction_threshold: int = 1000
+    validation_cache: DeviceValidationCache = None
+
+    def __post_init__(self) -> None:
+        if self.journal_filepath is None:
+            self.journal_filepath = f"{self.filepath}.journal"
+        if self.codec is None:
+            self.codec = codec_for(self.filepath)
+        if self.validation_cache is None:
+            self.validation_cache = DEFAULT_VALIDATION_CACHE
+        self.__generation = None
+        self.__recorded: Dict[str, Any] = {}
+        self.__records = 0
+        self.__unsynced_records = 0
+        self.__last_sync_time = monotonic()
+        self.__journal = None
+
+    @property
+    def records(self) -> int:
+        return self.__records
+
+    def save(self, device: DeviceEntity) -> None:
+        self.compact(device)
+
+    def record(self, device: DeviceEntity) -> None:
+        if (self.__generation is None
+                or not os.path.exists(self.filepath)
+                or self.__records >= self.compaction_threshold):
+            self.compact(device)
+            return
+        content = lifecycle_content(device)
+        changes = {key: value for key, value in content.items() if self.__recorded.get(key) != value}
+        if not changes:
+            return
+        changes[GENERATION_KEY] = self.__generation
+        self.__open_journal().write(json.dumps(changes, separators=(",", ":")) + "\n")
+        self.__recorded.update(content)
+        self.__records += 1
+        self.__unsynced_records += 1
+        if self.__unsynced_records >= self.fsync_batch_size or monotonic() - self.__last_sync_time >= self.fsync_interval:
+            self.flush()
+
+    def compact(self, device: DeviceEntity) -> None:
+        content = DEVICE_SCHEMA.dump(device)
+        generation = uuid4().hex[:8]
+        content[GENERATION_KEY] = generation
+        temporary_filepath = f"{self.filepath}.tmp"
+        write_file(temporary_filepath, content, codec=self.codec)
+        with open(temporary_filepath, "rb") as file_reader:
+            os.fsync(file_reader.fileno())
+        os.replace(temporary_filepath, self.filepath)
+        self.__close_journal()
+        with open(self.journal_filepath, "w", encoding="utf-8"):
+            pass
+        self.__generation = generation
+        self.__recorded = lifecycle_content(device)
+        self.__records = 0
+
+    def load(self) -> DeviceEntity:
+        content = read_file(self.filepath, codec=self.codec)
+        generation = content.pop(GENERATION_KEY, None)
+        records = 0
+        for changes in self.__read_journal():
+            if changes.pop(GENERATION_KEY, None) != generation:
+                continue
+            content.update(changes)
+            records += 1
+        self.__generation = generation
+        self.__recorded = {key: content.get(key) for key in LIFECYCLE_FIELDS}
+        self.__records = records
+        return self.validation_cache.load(content)
+
+    def flush(self) -> None:
+        self.__last_sync_time = monotonic()
+        self.__unsynced_records = 0
+        if self.__journal is None:
+            return
+        self.__journal.flush()
+        os.fsync(self.__journal.fileno())
+
+    def close(self) -> None:
+        self.__close_journal()
+
+    def __open_journal(self):
+        if self.__journal is None:
+            self.__journal = open(self.journal_filepath, "a", encoding="utf-8")
+        return self.__journal
+
+    def __close_journal(self) -> None:
+        if self.__journal is None:
+            return
+        self.flush()
+        self.__journal.close()
+        self.__journal = None
+
+    def __read_journal(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.journal_filepath):
+            return []
+        records = []
+        valid_size = 0
+        with open(self.journal_filepath, "rb") as file_reader:
+            for line in file_reader:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_size += len(line)
+        if valid_size < os.path.getsize(self.journal_filepath):
+            os.truncate(self.journal_filepath, valid_size)
+        return records
@@ -0,0 +1,82 @@
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List
+
+from knot_protocol.domain.boundary.output.device_persistence_gateway import \
+    DevicePersistenceGateway
+from knot_protocol.domain.entities.device_entity import DeviceEntity
+from knot_protocol.domain.exceptions.device_exception import \
+    DeviceNotFoundException
+from knot_protocol.infrastructure.adapter.output.DTO.device_validation_cache import (
+    DEFAULT_VALIDATION_CACHE, DEVICE_SCHEMA, DeviceValidationCache)
+
+DEFAULT_BATCH_SIZE: int = 1000
+
+
+@dataclass
+class SQLiteDeviceRepository(DevicePersistenceGateway):
+    filepath: str
+    device_id: str = None
+    validation_cache: DeviceValidationCache = None
+
+    def __post_init__(self) -> None:
+        if self.validation_cache is None:
+            self.validation_cache = DEFAULT_VALIDATION_CACHE
+        self.__connection = sqlite3.connect(self.filepath, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS devices ("
+            "device_id TEXT PRIMARY KEY, "
+            "document TEXT NOT NULL)")
+        self.__connection.commit()
+
+    def save(self, device: DeviceEntity) -> None:
+        self.save_many([device])
+
+    def save_many(self, devices: Iterable[DeviceEntity]) -> None:
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT INTO devices (device_id, document) VALUES (?, ?) "
+                "ON CONFLICT(device_id) DO UPDATE SET document = excluded.document",
+                ((device.device_id, json.dumps(DEVICE_SCHEMA.dump(device))) for device in devices))
+
+    def load(self) -> DeviceEntity:
+        if self.device_id is not None:
+            return self.load_by_id(self.device_id)
+        row = self.__connection.execute("SELECT document FROM devices LIMIT 1").fetchone()
+        if row is None:
+            raise DeviceNotFoundException("The repository has no devices.")
+        return self.validation_cache.load(json.loads(row[0]))
+
+    def load_by_id(self, device_id: str) -> DeviceEntity:
+        row = self.__connection.execute(
+            "SELECT document FROM devices WHERE device_id = ?",
+            (device_id,)).fetchone()
+        if row is None:
+            raise DeviceNotFoundException(f"Device {device_id} not found.")
+        return self.validation_cache.load(json.loads(row[0]))
+
+    def load_all(self) -> List[DeviceEntity]:
+        return list(self.iterate())
+
+    def iterate(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[DeviceEntity]:
+        cursor = self.__connection.execute("SELECT document FROM devices ORDER BY device_id")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for document, in rows:
+                yield self.validation_cache.load(json.loads(document))
+
+    def delete(self, device_id: str) -> None:
+        with self.__connection:
+            self.__connection.execute("DELETE FROM devices WHERE device_id = ?", (device_id,))
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def __len__(self) -> int:
+        count, = self.__connection.execute("SELECT COUNT(*) FROM devices").fetchone()
+        return count
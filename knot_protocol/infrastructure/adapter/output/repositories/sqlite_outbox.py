@@ -0,0 +1,107 @@
+import sqlite3
+from dataclasses import dataclass
+from threading import RLock
+from time import time
+from typing import List, Tuple, Union
+
+from knot_protocol.domain.boundary.output.outbox import Outbox
+
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS: float = 7 * 24 * 60 * 60
+
+
+@dataclass
+class SQLiteOutbox(Outbox):
+    filepath: str
+    max_bytes: int = DEFAULT_MAX_BYTES
+    max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
+
+    def __post_init__(self) -> None:
+        self.__lock = RLock()
+        self.__connection = sqlite3.connect(self.filepath, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "created_at REAL NOT NULL, "
+            "payload BLOB NOT NULL)")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS outbox_set_aside ("
+            "id INTEGER PRIMARY KEY, "
+            "created_at REAL NOT NULL, "
+            "payload BLOB NOT NULL)")
+        self.__connection.commit()
+        self.__size, = self.__connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM outbox").fetchone()
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def append(self, message: Union[str, bytes]) -> None:
+        payload = message.encode("utf-8") if isinstance(message, str) else bytes(message)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT INTO outbox (created_at, payload) VALUES (?, ?)",
+                (time(), payload))
+            self.__size += len(payload)
+            self.__apply_retention()
+
+    def peek(self, limit: int) -> List[Tuple[int, bytes]]:
+        with self.__lock:
+            return self.__connection.execute(
+                "SELECT id, payload FROM outbox ORDER BY id LIMIT ?",
+                (limit,)).fetchall()
+
+    def remove(self, message_id: int) -> None:
+        with self.__lock, self.__connection:
+            self.__delete_until(message_id)
+
+    def set_aside(self, message_id: int) -> None:
+        with self.__lock, self.__connection:
+            row = self.__connection.execute(
+                "SELECT created_at, payload FROM outbox WHERE id = ?",
+                (message_id,)).fetchone()
+            if row is None:
+                return
+            created_at, payload = row
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO outbox_set_aside (id, created_at, payload) VALUES (?, ?, ?)",
+                (message_id, created_at, payload))
+            self.__connection.execute("DELETE FROM outbox WHERE id = ?", (message_id,))
+            self.__size -= len(payload)
+
+    def set_aside_messages(self, limit: int) -> List[Tuple[int, bytes]]:
+        with self.__lock:
+            return self.__connection.execute(
+                "SELECT id, payload FROM outbox_set_aside ORDER BY id LIMIT ?",
+                (limit,)).fetchall()
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            count, = self.__connection.execute("SELECT COUNT(*) FROM outbox").fetchone()
+        return count
+
+    def __apply_retention(self) -> None:
+        oldest_allowed_time = time() - self.max_age_seconds
+        while True:
+            oldest = self.__connection.execute(
+                "SELECT id, created_at FROM outbox ORDER BY id LIMIT 1").fetchone()
+            if oldest is None:
+                return
+            message_id, created_at = oldest
+            if created_at >= oldest_allowed_time and self.__size <= self.max_bytes:
+                return
+            self.__delete_until(message_id)
+
+    def __delete_until(self, message_id: int) -> None:
+        deleted_size, = self.__connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM outbox WHERE id <= ?",
+            (message_id,)).fetchone()
+        self.__connection.execute("DELETE FROM outbox WHERE id <= ?", (message_id,))
+        self.__size -= deleted_size
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from uuid import uuid4
+
+from pika import BasicProperties
+
+from knot_protocol.infrastructure.adapter.input.rpc_client import \
+    AMQPRPCSubscriber
+from knot_protocol.infrastructure.adapter.output.publisher import \
+    AMQPPublisher
+
+
+@dataclass
+class AMQPRPCPublisher(AMQPPublisher):
+    reply_subscriber: AMQPRPCSubscriber = None
+
+    def publish(self):
+        correlation_id = uuid4().hex
+        self.properties = BasicProperties(
+            headers=self.properties.headers,
+            delivery_mode=self.properties.delivery_mode,
+            reply_to=self.reply_subscriber.client.reply_to,
+            correlation_id=correlation_id)
+        self.reply_subscriber.expect(correlation_id)
+        return super().publish()
@@ -1,8 +1,9 @@
+import asyncio
 from json import loads
 from typing import Dict
 from uuid import uuid4
-import yaml
 from knot_protocol.infrastructure.adapter.output.DTO.device_schema import SchemaConfiguration
+from knot_protocol.infrastructure.adapter.output.repositories.device_codecs import YAMLCodec, read_file
 
 
 def json_parser(json_content: Dict[str, str]) -> Dict[str, str]:
@@ -14,6 +15,22 @@ def generate_consumer_tag() -> str:
 
 
 def load_device_schema_from_yaml_file(filepath: str):
-    with open(filepath, "r", encoding="utf-8") as file_reader:
-        yaml_content = yaml.safe_load(file_reader)
-    return SchemaConfiguration().load(yaml_content)
+    return SchemaConfiguration().load(read_file(filepath, codec=YAMLCodec()))
+
+
+def load_device_schema_from_file(filepath: str):
+    return SchemaConfiguration().load(read_file(filepath))
+
+
+def is_event_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def run_on_event_loop(loop: asyncio.AbstractEventLoop, coroutine):
+    if is_event_loop_thread(loop):
+        coroutine.close()
+        raise RuntimeError("Blocking call on the event loop thread, await the coroutine instead.")
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
@@ -4,16 +4,24 @@ from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
 from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO
 from knot_protocol.domain.boundary.output.DTO.event import Event
 from knot_protocol.domain.boundary.output.DTO.device_configuration import ConfigurationDTO
+from knot_protocol.domain.entities.device_adapters import DeviceAdapters
 from knot_protocol.domain.entities.device_entity import DeviceEntity
 from knot_protocol.domain.usecase.states import (
-    AuthenticatedState,
-    DisconnectedState,
-    RegisteredState,
-    UpdatedSchemaState)
+    AUTHENTICATED_STATE,
+    DISCONNECTED_STATE,
+    READY_STATE,
+    REGISTERED_STATE)
 from knot_protocol.infrastructure.adapter.output.DTO.device_auth_request_DTO import \
     DeviceAuthRequestSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_registration_request_DTO import \
+    DeviceRegistrationRequestSchema
 from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
-    DeviceSchema
+    DataPointsSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_unregistration_request_dto import \
+    DeviceUnregistrationRequestDTO
+from knot_protocol.infrastructure.adapter.output.DTO.update_config_schema import \
+    UpdateConfigRequestSchema
+from tests.mocks.clock_mock import FakeClock
 from tests.mocks.publisher_mock import PublisherMock
 from tests.mocks.subscriber_mock import (InvalidAuthSubscriberMock,
                                          InvalidRegisterSubscriberMock,
@@ -26,7 +34,11 @@ from tests.mocks.subscriber_mock import (InvalidAuthSubscriberMock,
                                          InvalidSchemaCallback,
                                          ValidRegisterCallback,
                                          ValidAuthCallback)
-from tests.mocks.common_operation_mock import CommonOperationMock
+
+
+@pytest.fixture(scope="function")
+def fake_clock() -> FakeClock:
+    return FakeClock()
 
 
 @pytest.fixture(scope="function")
@@ -49,7 +61,7 @@ def subscriber_with_invalid_token():
 
 @pytest.fixture(scope="function")
 def subscriber_with_exception():
-    return RegisterSubscriberWithExceptionMock()
+    return RegisterSubscriberWithExceptionMock(callback=ValidRegisterCallback())
 
 
 @pytest.fixture(scope="function")
@@ -68,11 +80,6 @@ def invalid_auth_subscriber():
     return invalid_subscriber
 
 
-@pytest.fixture(scope="function")
-def common_operation_mock():
-    return CommonOperationMock(register_state=None, device=None)
-
-
 @pytest.fixture(scope="function")
 def valid_update_schema_subscriber_mock():
     callback = ValidSchemaCallback()
@@ -95,58 +102,49 @@ def publisher_mock():
 
 
 @pytest.fixture(scope="function")
-def test_disconnected_state(publisher_mock, common_operation_mock):
-    new_state = DisconnectedState(
-        registered_state=RegisteredState(
-            authenticated=None,
-            publisher=None,
-            request_serializer=None,
-            subscriber=None,
-            common_operation=common_operation_mock),
-        authenticate_publisher=None,
-        authenticate_serializer=None,
-        authenticate_subscriber=None,
-        authenticated=None,
-        common_operation=common_operation_mock)
-    return new_state
+def test_disconnected_state():
+    return DISCONNECTED_STATE
+
+
+@pytest.fixture(scope="function")
+def test_adapters(publisher_mock):
+    return DeviceAdapters(
+        register_publisher=publisher_mock,
+        register_serializer=DeviceRegistrationRequestSchema(),
+        auth_publisher=publisher_mock,
+        device_auth_serializer=DeviceAuthRequestSchema(),
+        update_config_publisher=publisher_mock,
+        update_config_serializer=UpdateConfigRequestSchema(),
+        data_publisher=publisher_mock,
+        publisher_serializer=DataPointsSchema(),
+        unregister_publisher=publisher_mock,
+        unregister_serializer=DeviceUnregistrationRequestDTO())
 
 
 @pytest.fixture(scope="function")
-def another_device(data_point, test_empty_disconnected_state, test_schema) -> DeviceEntity:
+def another_device(data_point, test_schema) -> DeviceEntity:
     return DeviceEntity(
         device_id="2",
         name="device_test",
         config=[test_schema],
-        state=test_empty_disconnected_state,
+        state=DISCONNECTED_STATE,
         data=[data_point],
         error="")
 
 
 @pytest.fixture(scope="function")
-def test_registered_state(publisher_mock, common_operation_mock, valid_auth_subscriber):
-    registered_state = RegisteredState(
-        authenticated=AuthenticatedState(
-            publisher=None,
-            request_serializer=None,
-            subscriber=None,
-            updated_schema_state=None,
-            common_operation=common_operation_mock),
-        publisher=publisher_mock,
-        request_serializer=DeviceAuthRequestSchema(),
-        subscriber=valid_auth_subscriber,
-        common_operation=common_operation_mock)
-    return registered_state
+def test_registered_state():
+    return REGISTERED_STATE
+
+
+@pytest.fixture(scope="function")
+def test_authenticated_state():
+    return AUTHENTICATED_STATE
 
 
 @pytest.fixture(scope="function")
-def test_authenticated_state(publisher_mock, common_operation_mock):
-    authenticated = AuthenticatedState(
-        publisher=publisher_mock,
-        subscriber=subscriber_with_valid_token,
-        request_serializer=DeviceSchema(),
-        updated_schema_state=UpdatedSchemaState(ready_state=None, common_operation=common_operation_mock),
-        common_operation=common_operation_mock)
-    return authenticated
+def test_ready_state():
+    return READY_STATE
 
 
 @pytest.fixture(scope="function")
@@ -158,26 +156,14 @@ def test_schema():
     return schema
 
 
-
-@pytest.fixture(scope="function")
-def test_empty_disconnected_state(common_operation_mock):
-    return DisconnectedState(
-            authenticate_publisher=None,
-            authenticate_subscriber=None,
-            registered_state=None,
-            authenticated=None,
-            authenticate_serializer=None,
-            common_operation=common_operation_mock,
-            )
-
-
 @pytest.fixture(scope="function")
-def test_device(test_schema, test_empty_disconnected_state):
+def test_device(test_schema, test_adapters):
     device = DeviceEntity(
         device_id="1",
         name="device_test",
         config=[test_schema],
-        state=test_empty_disconnected_state,
+        state=DISCONNECTED_STATE,
+        adapters=test_adapters,
         data=[data_point],
         error="",
         token="")
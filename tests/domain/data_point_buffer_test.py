@@ -0,0 +1,118 @@
+import pytest
+from pika.exceptions import AMQPConnectionError
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.usecase.data_point_buffer import DataPointBuffer
+from tests.mocks.publisher_mock import ConnectionPublisherMock
+
+
+def test_given_buffer_below_limits_then_not_full(data_point):
+    buffer = DataPointBuffer(max_count=2, max_bytes=1024, max_age_seconds=60)
+    buffer.append([data_point])
+    assert not buffer.is_full()
+
+
+def test_given_buffer_reaches_max_count_then_full(data_point):
+    buffer = DataPointBuffer(max_count=2, max_bytes=1024, max_age_seconds=60)
+    buffer.append([data_point, data_point])
+    assert buffer.is_full()
+
+
+def test_given_buffer_reaches_max_bytes_then_full(data_point):
+    buffer = DataPointBuffer(max_count=100, max_bytes=10, max_age_seconds=60)
+    buffer.append([data_point])
+    assert buffer.is_full()
+
+
+def test_given_buffer_older_than_max_age_then_full(data_point):
+    buffer = DataPointBuffer(max_count=100, max_bytes=1024, max_age_seconds=1)
+    buffer.append([data_point])
+    assert buffer.is_full(now=buffer.first_data_point_time + 1)
+
+
+def test_given_drained_buffer_then_empty(data_point):
+    buffer = DataPointBuffer()
+    buffer.append([data_point])
+    assert buffer.drain() == [data_point]
+    assert len(buffer) == 0
+    assert buffer.size == 0
+    assert not buffer.is_full()
+
+
+def test_given_buffered_device_when_publish_data_then_publishes_once_per_batch(
+    test_ready_state,
+    publisher_mock,
+    test_device):
+    test_device.publishing_buffer = DataPointBuffer(max_count=3, max_bytes=1024, max_age_seconds=60)
+    test_device.transition_to_state(test_ready_state)
+    for value in range(3):
+        test_device.data = [DataPointDTO(sensor_id=1, value=value, timestamp="2023-01-21 12:15:00")]
+        test_device.publish_data()
+    assert len(publisher_mock.published) == 1
+    assert '"value": 2' in publisher_mock.published[0]
+
+
+def test_given_buffered_device_when_flush_then_publishes_pending_data(
+    test_ready_state,
+    publisher_mock,
+    test_device,
+    data_point):
+    test_device.publishing_buffer = DataPointBuffer(max_count=10, max_bytes=1024, max_age_seconds=60)
+    test_device.transition_to_state(test_ready_state)
+    test_device.data = [data_point]
+    test_device.publish_data()
+    assert not publisher_mock.published
+    test_device.flush()
+    assert len(publisher_mock.published) == 1
+    test_device.flush()
+    assert len(publisher_mock.published) == 1
+
+
+def test_given_unbuffered_device_when_publish_data_then_publishes_immediately(
+    test_ready_state,
+    publisher_mock,
+    test_device,
+    data_point):
+    test_device.transition_to_state(test_ready_state)
+    test_device.data = [data_point]
+    test_device.publish_data()
+    assert len(publisher_mock.published) == 1
+
+
+def test_given_buffered_device_when_flush_expired_then_publishes_only_expired_buffer(
+    test_ready_state,
+    publisher_mock,
+    test_device,
+    data_point):
+    test_device.publishing_buffer = DataPointBuffer(max_count=10, max_bytes=1024, max_age_seconds=60)
+    test_device.transition_to_state(test_ready_state)
+    test_device.data = [data_point]
+    test_device.publish_data()
+    test_device.flush_expired()
+    assert not publisher_mock.published
+    test_device.publishing_buffer.max_age_seconds = 0
+    test_device.flush_expired()
+    assert len(publisher_mock.published) == 1
+
+
+def test_given_failing_publisher_when_flush_then_keeps_buffered_data(
+    test_ready_state,
+    test_device,
+    data_point):
+    data_publisher = ConnectionPublisherMock()
+    test_device.adapters.data_publisher = data_publisher
+    test_device.publishing_buffer = DataPointBuffer(max_count=10, max_bytes=1024, max_age_seconds=60)
+    test_device.transition_to_state(test_ready_state)
+    test_device.data = [data_point]
+    test_device.publish_data()
+    data_publisher.fail = True
+    with pytest.raises(AMQPConnectionError):
+        test_device.flush()
+    test_device.amqp_generator = iter([])
+    test_device.stop()
+    assert test_device.publishing_buffer.data == [data_point]
+    data_publisher.fail = False
+    test_device.flush()
+    assert len(data_publisher.published) == 1
+    assert len(test_device.publishing_buffer) == 0
+    assert test_device.published_data_points == 1
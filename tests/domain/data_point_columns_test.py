@@ -0,0 +1,83 @@
+import json
+from array import array
+
+import pytest
+
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.knot_amqp_options import \
+    KNoTValueType
+from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO
+from knot_protocol.domain.exceptions.device_exception import (
+    InvalidDataPointException, NotReadyException)
+from knot_protocol.domain.usecase.data_point_buffer import DataPointBuffer
+from knot_protocol.domain.usecase.data_point_validator import (
+    DataPointValidator, ValidationMode)
+from knot_protocol.domain.usecase.states import (READY_STATE,
+                                                 UPDATED_SCHEMA_STATE)
+from knot_protocol.infrastructure.adapter.output.DTO.data_points_encoder import \
+    DataPointsEncoder
+
+
+@pytest.fixture(scope="function")
+def config():
+    return [
+        ConfigurationDTO(
+            sensor_id=sensor_id,
+            schema=SchemaDTO(value_type=KNoTValueType.FLOAT.value, unit=0, type_id=65521, name="sensor"),
+            event=None)
+        for sensor_id in [1, 2]]
+
+
+def published_data(device):
+    return [
+        (data_point["sensorId"], data_point["value"], data_point["timestamp"])
+        for data_point in json.loads(device.adapters.data_publisher.content)["data"]]
+
+
+def test_given_ready_device_when_publish_columns_then_publish_single_message(test_device, config):
+    test_device.adapters.publisher_serializer = DataPointsEncoder(config=config)
+    test_device.transition_to_state(READY_STATE)
+    test_device.publish_columns(
+        sensor_ids=array("i", [1, 2]),
+        values=array("d", [1.5, 2.5]),
+        timestamps="2023-01-21 12:15:00")
+    assert published_data(test_device) == [(1, 1.5, "2023-01-21 12:15:00"), (2, 2.5, "2023-01-21 12:15:00")]
+
+
+def test_given_marshmallow_serializer_when_publish_columns_then_publish_data_points(test_device):
+    test_device.transition_to_state(UPDATED_SCHEMA_STATE)
+    test_device.publish_columns(sensor_ids=[1], values=[1.5], timestamps=["2023-01-21 12:15:00"])
+    assert test_device.state is READY_STATE
+    assert published_data(test_device) == [(1, 1.5, "2023-01-21 12:15:00")]
+
+
+def test_given_validator_when_publish_columns_then_drop_invalid_values(test_device, config):
+    test_device.data_point_validator = DataPointValidator(config=config, mode=ValidationMode.drop_invalid)
+    test_device.transition_to_state(READY_STATE)
+    test_device.publish_columns(sensor_ids=[1, 9, 2], values=[1.5, 1.0, "2.5"], timestamps="t")
+    assert published_data(test_device) == [(1, 1.5, "t")]
+
+
+def test_given_columns_with_different_lengths_then_raise_exception(test_device):
+    test_device.transition_to_state(READY_STATE)
+    with pytest.raises(InvalidDataPointException):
+        test_device.publish_columns(sensor_ids=[1, 2], values=[1.5], timestamps="t")
+
+
+def test_given_disconnected_device_when_publish_columns_then_raise_exception(test_device):
+    with pytest.raises(NotReadyException):
+        test_device.publish_columns(sensor_ids=[1], values=[1.5], timestamps="t")
+
+
+def test_given_buffered_device_when_publish_columns_then_buffer_columns_and_encode_them_once(test_device, config):
+    test_device.adapters.publisher_serializer = DataPointsEncoder(config=config)
+    test_device.publishing_buffer = DataPointBuffer(max_count=4, max_bytes=1024, max_age_seconds=60)
+    test_device.transition_to_state(READY_STATE)
+    test_device.publish_columns(sensor_ids=[1, 2], values=[1.5, 2.5], timestamps="t1")
+    assert test_device.publishing_buffer.data == []
+    assert test_device.publishing_buffer.columns.values == [1.5, 2.5]
+    test_device.publish_columns(sensor_ids=[1, 2], values=[3.5, 4.5], timestamps="t2")
+    assert published_data(test_device) == [(1, 1.5, "t1"), (2, 2.5, "t1"), (1, 3.5, "t2"), (2, 4.5, "t2")]
+    assert test_device.published_messages == 1
+    assert len(test_device.publishing_buffer) == 0
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.device_configuration import \
+    ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.knot_amqp_options import \
+    KNoTValueType
+from knot_protocol.domain.boundary.output.DTO.schema import SchemaDTO
+from knot_protocol.domain.exceptions.device_exception import \
+    InvalidDataPointException
+from knot_protocol.domain.usecase.data_point_validator import (
+    DataPointValidator, ValidationMode)
+from knot_protocol.domain.usecase.states import READY_STATE
+
+
+def sensor_configuration(sensor_id, value_type):
+    return ConfigurationDTO(
+        sensor_id=sensor_id,
+        schema=SchemaDTO(value_type=value_type.value, unit=0, type_id=65521, name="sensor"),
+        event=None)
+
+
+@pytest.fixture(scope="function")
+def config():
+    return [
+        sensor_configuration(1, KNoTValueType.INT),
+        sensor_configuration(2, KNoTValueType.FLOAT),
+        sensor_configuration(3, KNoTValueType.BOOL),
+        sensor_configuration(4, KNoTValueType.STRING)]
+
+
+def data_points(*values):
+    return [DataPointDTO(sensor_id=sensor_id, value=value, timestamp="") for sensor_id, value in values]
+
+
+def test_given_valid_batch_then_return_it_unchanged(config):
+    batch = data_points((1, 42), (2, 1.5), (2, 3), (3, True), (4, "on"))
+    assert DataPointValidator(config=config).validate(batch) is batch
+
+
+@pytest.mark.parametrize("invalid_data_point", [(9, 1), (1, 1.5), (2, True), (3, 1), (4, 4)])
+def test_given_invalid_data_point_in_strict_mode_then_raise_exception(config, invalid_data_point):
+    with pytest.raises(InvalidDataPointException):
+        DataPointValidator(config=config).validate(data_points((1, 42), invalid_data_point))
+
+
+def test_given_drop_invalid_mode_then_keep_only_valid_data_points(config):
+    validator = DataPointValidator(config=config, mode=ValidationMode.drop_invalid)
+    batch = data_points((1, 42), (9, 1), (1, 1.5), (2, 2.5))
+    assert [data_point.value for data_point in validator.validate(batch)] == [42, 2.5]
+    assert validator.dropped == 2
+
+
+def test_given_coerce_mode_then_convert_values_to_sensor_type(config):
+    validator = DataPointValidator(config=config, mode=ValidationMode.coerce)
+    batch = data_points((1, 2.0), (1, "7"), (1, 1.5), (2, "3.5"), (3, "false"), (3, 1), (4, 12))
+    assert [data_point.value for data_point in validator.validate(batch)] == [2, 7, 3.5, False, True, "12"]
+    assert validator.coerced == 6
+    assert validator.dropped == 1
+
+
+def test_given_device_validator_then_publish_only_valid_data_points(test_device, config):
+    test_device.config = config
+    test_device.data_point_validator = DataPointValidator(config=config, mode=ValidationMode.drop_invalid)
+    test_device.data = data_points((1, 42), (9, 1))
+    test_device.transition_to_state(READY_STATE)
+    test_device.publish_data()
+    published_data = json.loads(test_device.adapters.data_publisher.content)["data"]
+    assert [data_point["value"] for data_point in published_data] == [42]
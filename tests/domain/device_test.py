@@ -1,6 +1,12 @@
+import gc
+from weakref import ref
+
 import pytest 
 
 from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.device_configuration import ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.event import EventFactory
+from knot_protocol.domain.boundary.output.DTO.schema import SchemaFactory
 from knot_protocol.domain.entities.device_entity import DeviceEntity
 
 
@@ -51,3 +57,34 @@ def test_given_valid_token_return_true(test_device, token):
 def test_given_invalid_token_return_false(test_device, token):
     test_device.token = token
     assert not test_device.is_valid_token()
+
+
+def test_given_equal_schemas_and_events_then_factories_return_same_instance():
+    first_schema = SchemaFactory.create(value_type=2, unit=0, type_id=65521, name="temperature")
+    second_schema = SchemaFactory.create(value_type=2, unit=0, type_id=65521, name="temperature")
+    first_event = EventFactory.create(change=True, time_seconds=5, lower_threshold=1.6, upper_threshold=89.2)
+    second_event = EventFactory.create(change=True, time_seconds=5, lower_threshold=1.6, upper_threshold=89.2)
+    assert first_schema is second_schema
+    assert first_event is second_event
+
+
+def test_given_unreferenced_schemas_and_events_then_factories_release_them():
+    schema = ref(SchemaFactory.create(value_type=2, unit=0, type_id=65521, name="released"))
+    event = ref(EventFactory.create(change=False, time_seconds=7, lower_threshold=0, upper_threshold=7))
+    gc.collect()
+    assert schema() is None
+    assert event() is None
+
+
+def test_given_configurations_with_same_sensor_id_then_equal_and_deduplicated_in_set(test_schema):
+    other_configuration = ConfigurationDTO(
+        sensor_id=test_schema.sensor_id,
+        schema=SchemaFactory.create(value_type=1, unit=0, type_id=65521, name="humidity"),
+        event=test_schema.event)
+    assert other_configuration == test_schema
+    assert len({other_configuration, test_schema}) == 1
+
+
+def test_given_slotted_dtos_then_instances_have_no_dict(data_point, test_schema, test_device):
+    for instance in (data_point, test_schema, test_schema.schema, test_schema.event, test_device):
+        assert not hasattr(instance, "__dict__")
@@ -0,0 +1,62 @@
+import pytest
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.device_configuration import ConfigurationDTO
+from knot_protocol.domain.boundary.output.DTO.event import Event
+from knot_protocol.domain.usecase.emission_filter import EmissionFilter
+
+
+def sensor_configuration(change=False, time_seconds=0, lower_threshold=None, upper_threshold=None):
+    return ConfigurationDTO(
+        sensor_id=1,
+        schema=None,
+        event=Event(
+            change=change,
+            time_seconds=time_seconds,
+            lower_threshold=lower_threshold,
+            upper_threshold=upper_threshold))
+
+
+def emitted_values(emission_filter, values, times):
+    return [
+        data_point.value
+        for value, now in zip(values, times)
+        for data_point in emission_filter.filter([DataPointDTO(sensor_id=1, value=value, timestamp="")], now=now)]
+
+
+def test_given_change_event_then_emits_only_changed_values():
+    emission_filter = EmissionFilter(config=[sensor_configuration(change=True)])
+    assert emitted_values(emission_filter, [1, 1, 2, 2, 1], range(5)) == [1, 2, 1]
+
+
+def test_given_time_event_then_emits_when_interval_expires():
+    emission_filter = EmissionFilter(config=[sensor_configuration(time_seconds=5)])
+    assert emitted_values(emission_filter, [1, 2, 3, 4], [0, 4, 5, 9]) == [1, 3]
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([5, 11, 12, 5, 0, -1, 5], [5, 11, 0]),
+    ([5, 6, 7], [5]),
+])
+def test_given_threshold_event_then_emits_when_threshold_is_crossed(values, expected):
+    emission_filter = EmissionFilter(config=[sensor_configuration(lower_threshold=1, upper_threshold=10)])
+    assert emitted_values(emission_filter, values, range(len(values))) == expected
+
+
+def test_given_unknown_sensor_then_data_point_is_emitted():
+    emission_filter = EmissionFilter(config=[sensor_configuration()])
+    data_point = DataPointDTO(sensor_id=2, value=1, timestamp="")
+    assert emission_filter.filter([data_point, data_point], now=0) == [data_point, data_point]
+
+
+def test_given_device_with_emission_filter_when_publish_unchanged_data_then_publishes_once(
+    test_ready_state,
+    publisher_mock,
+    test_device,
+    data_point):
+    test_device.emission_filter = EmissionFilter(config=[sensor_configuration(change=True, time_seconds=300)])
+    test_device.transition_to_state(test_ready_state)
+    test_device.data = [data_point]
+    test_device.publish_data()
+    test_device.publish_data()
+    assert len(publisher_mock.published) == 1
@@ -3,6 +3,7 @@ import pytest
 
 from knot_protocol.domain.usecase.states import DisconnectedState, RegisteredState, AuthenticatedState, UpdatedSchemaState
 from knot_protocol.domain.exceptions.device_exception import (
+    AlreadyRegisteredDeviceException,
     NotAuthenticatedException,
     UpdateConfigurationException,
     AuthenticationErrorException)
@@ -11,7 +12,7 @@ from knot_protocol.domain.exceptions.device_exception import (
 def test_device_register_is_called(subscriber_with_valid_token,
     test_disconnected_state,
     test_device):
-    test_disconnected_state.register_subscriber = subscriber_with_valid_token
+    test_device.adapters.register_subscriber = subscriber_with_valid_token
     test_device.transition_to_state(test_disconnected_state)
     with patch.object(DisconnectedState, "register") as mocked_state:
         test_device.register()
@@ -22,12 +23,12 @@ def test_given_valid_token_transition_to_registered_state(
     test_disconnected_state,
     test_device
     ):
-    test_disconnected_state.register_subscriber = subscriber_with_valid_token
+    test_device.adapters.register_subscriber = subscriber_with_valid_token
     test_device.transition_to_state(test_disconnected_state)
     assert isinstance(test_device.state, DisconnectedState)
     test_device.register()
     assert isinstance(test_device.state, RegisteredState)
-    assert test_device.token != "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
+    assert test_device.token == "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
 
 
 def test_given_invalid_token_remains_diconnected_state(
@@ -35,7 +36,7 @@ def test_given_invalid_token_remains_diconnected_state(
     test_disconnected_state,
     test_device
     ):
-    test_disconnected_state.authenticate_subscriber = subscriber_with_invalid_token
+    test_device.adapters.auth_subscriber = subscriber_with_invalid_token
     test_device.transition_to_state(test_disconnected_state)
     assert isinstance(test_device.state, DisconnectedState)
     test_device.authenticate()
@@ -48,19 +49,32 @@ def test_given_disconnected_device_when_publish_data_raises_not_authenticated_ex
     test_disconnected_state,
     test_device
     ):
-    test_disconnected_state.register_subscriber = subscriber_with_valid_token
+    test_device.adapters.register_subscriber = subscriber_with_valid_token
     test_device.transition_to_state(test_disconnected_state)
     with pytest.raises(NotAuthenticatedException):
         test_device.publish_data()
 
 
-def test_given_subscriber_exception_transition_to_registered_state(
+def test_given_subscriber_exception_remains_disconnected_state(
     test_disconnected_state,
     subscriber_with_exception,
     test_device):
-    test_disconnected_state.register_subscriber = subscriber_with_exception
+    test_device.adapters.register_subscriber = subscriber_with_exception
     test_device.transition_to_state(test_disconnected_state)
     assert isinstance(test_device.state, DisconnectedState)
+    with pytest.raises(AlreadyRegisteredDeviceException):
+        test_device.register()
+    assert isinstance(test_device.state, DisconnectedState)
+
+
+def test_given_valid_token_when_register_then_skips_registration_request(
+    subscriber_with_exception,
+    test_disconnected_state,
+    test_device):
+    test_device.adapters.register_subscriber = subscriber_with_exception
+    test_device.device_id = "1964a231a4d14173"
+    test_device.token = "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
+    test_device.transition_to_state(test_disconnected_state)
     test_device.register()
     assert isinstance(test_device.state, RegisteredState)
 
@@ -68,7 +82,7 @@ def test_given_valid_auth_subscriber_when_device_registered_then_transition_to_a
     valid_auth_subscriber,
     test_registered_state,
     test_device):
-    test_registered_state.subscriber = valid_auth_subscriber
+    test_device.adapters.auth_subscriber = valid_auth_subscriber
     test_device.transition_to_state(test_registered_state)
     assert isinstance(test_device.state, RegisteredState)
     test_device.authenticate()
@@ -80,7 +94,7 @@ def test_given_invalid_auth_subscriber_when_device_registered_then_remains_regis
     test_registered_state,
     test_device
     ):
-    test_registered_state.subscriber = invalid_auth_subscriber
+    test_device.adapters.auth_subscriber = invalid_auth_subscriber
     test_device.transition_to_state(test_registered_state)
     assert isinstance(test_device.state, RegisteredState)
     with pytest.raises(AuthenticationErrorException):
@@ -93,7 +107,7 @@ def test_given_valid_schema_subscriber_when_device_authenticated_then_transition
     valid_update_schema_subscriber_mock,
     test_device
     ):
-    test_authenticated_state.subscriber = valid_update_schema_subscriber_mock
+    test_device.adapters.update_config_subscriber = valid_update_schema_subscriber_mock
     test_device.transition_to_state(test_authenticated_state)
     assert isinstance(test_device.state, AuthenticatedState)
     test_device.update_schema()
@@ -104,9 +118,19 @@ def test_given_invalid_schema_subscriber_when_device_authenticated_then_transiti
     test_authenticated_state,
     invalid_update_schema_subscriber_mock,
     test_device):
-    test_authenticated_state.subscriber = invalid_update_schema_subscriber_mock
+    test_device.adapters.update_config_subscriber = invalid_update_schema_subscriber_mock
     test_device.transition_to_state(test_authenticated_state)
     assert isinstance(test_device.state, AuthenticatedState)
     with pytest.raises(UpdateConfigurationException):
         test_device.update_schema()
     assert isinstance(test_device.state, AuthenticatedState)
+
+
+def test_given_many_devices_then_share_state_instances(test_device, another_device, publisher_mock):
+    another_device.adapters = test_device.adapters
+    assert test_device.state is another_device.state
+    test_device.token = "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
+    test_device.device_id = "1964a231a4d14173"
+    test_device.register()
+    assert isinstance(test_device.state, RegisteredState)
+    assert isinstance(another_device.state, DisconnectedState)
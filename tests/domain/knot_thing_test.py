@@ -0,0 +1,126 @@
+import pytest
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.entities.device_adapters import DeviceAdapters
+from knot_protocol.domain.usecase.data_point_buffer import DataPointBuffer
+from knot_protocol.domain.usecase.knot_thing import (DeviceStatus,
+                                                     KNoTThingManager)
+from knot_protocol.infrastructure.adapter.input.amqp_connection_supervisor import \
+    AMQPConnectionSupervisor
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import BlockingConnectionMock
+from tests.mocks.device_mock import DeviceMock
+from tests.mocks.publisher_mock import PublisherMock
+from tests.mocks.subscriber_mock import ConcurrencyProbe
+
+
+def read_data(device):
+    return [DataPointDTO(sensor_id=1, value=42, timestamp="2023-01-21 12:15:00")]
+
+
+def test_given_devices_when_onboard_then_reports_status_per_device():
+    devices = [DeviceMock(device_id=f"{index:016x}") for index in range(50)]
+    devices.append(DeviceMock(device_id="ffffffffffffffff", fail=True))
+    manager = KNoTThingManager(devices=devices, max_concurrency=8)
+    status = manager.onboard()
+    assert list(status.values()).count(DeviceStatus.ready) == 50
+    assert status["ffffffffffffffff"] is DeviceStatus.failed
+    assert "TimeoutError" in manager.reports["ffffffffffffffff"].error
+    assert manager.reports["0000000000000000"].time_to_ready == 0.01
+
+
+def test_given_scheduled_devices_when_run_then_publishes_at_each_interval(fake_clock):
+    fast_device = DeviceMock(device_id="0000000000000001")
+    slow_device = DeviceMock(device_id="0000000000000002")
+    manager = KNoTThingManager(devices=[fast_device, slow_device], clock=fake_clock, wait=fake_clock.wait)
+    manager.onboard()
+    manager.schedule(fast_device, interval=1.0, read_data=read_data)
+    manager.schedule(slow_device, interval=5.0, read_data=read_data)
+    manager.run(duration=10.0)
+    assert len(fast_device.published) == 10
+    assert len(slow_device.published) == 2
+    assert manager.reports["0000000000000001"].published_data_points == 10
+    assert manager.throughput() == pytest.approx(1.2)
+
+
+def test_given_failed_device_then_scheduler_skips_it_and_stop_only_stops_ready_devices(fake_clock):
+    ready_device = DeviceMock(device_id="0000000000000001")
+    failed_device = DeviceMock(device_id="0000000000000002", fail=True)
+    manager = KNoTThingManager(devices=[ready_device, failed_device], clock=fake_clock, wait=fake_clock.wait)
+    manager.onboard()
+    manager.schedule(failed_device, interval=1.0, read_data=read_data)
+    manager.run(duration=3.0)
+    manager.stop()
+    assert failed_device.published == []
+    assert ready_device.stopped
+    assert not failed_device.stopped
+    assert manager.status() == {
+        "0000000000000001": DeviceStatus.stopped,
+        "0000000000000002": DeviceStatus.failed}
+
+
+def test_given_quiet_buffered_device_when_run_then_flushes_buffer_at_max_age(fake_clock, monkeypatch):
+    monkeypatch.setattr("knot_protocol.domain.usecase.data_point_buffer.monotonic", fake_clock)
+    device = DeviceMock(device_id="0000000000000001", publishing_buffer=DataPointBuffer(max_age_seconds=2.0))
+    readings = [read_data(device)]
+    manager = KNoTThingManager(devices=[device], clock=fake_clock, wait=fake_clock.wait)
+    manager.onboard()
+    manager.schedule(device, interval=10.0, read_data=lambda _: readings.pop() if readings else [])
+    manager.run(duration=5.0)
+    assert device.published == [read_data(device)]
+    assert len(device.publishing_buffer) == 0
+
+
+def test_given_device_id_replaced_by_registration_then_reports_follow_the_device(fake_clock):
+    device = DeviceMock(device_id="0000000000000000", registered_id="0000000000000001")
+    manager = KNoTThingManager(devices=[device], clock=fake_clock, wait=fake_clock.wait)
+    manager.onboard()
+    manager.schedule(device, interval=1.0, read_data=read_data)
+    manager.run(duration=2.0)
+    manager.stop()
+    assert manager.status() == {"0000000000000001": DeviceStatus.stopped}
+    assert manager.reports["0000000000000001"].published_messages == 2
+
+
+def supervised_devices(supervisor, probe, number_devices, first_index=0):
+    devices = []
+    for index in range(first_index, first_index + number_devices):
+        data_publisher = PublisherMock()
+        supervisor.attach_publisher(data_publisher)
+        devices.append(DeviceMock(
+            device_id=f"{index:016x}", adapters=DeviceAdapters(data_publisher=data_publisher), probe=probe))
+    return devices
+
+
+def test_given_devices_sharing_a_connection_when_onboard_then_onboards_them_one_at_a_time():
+    probe = ConcurrencyProbe()
+    supervisor = AMQPConnectionSupervisor(connection_factory=BlockingConnectionMock, logger=logger_factory())
+    devices = supervised_devices(supervisor, probe, 8)
+    manager = KNoTThingManager(devices=devices, max_concurrency=8)
+    manager.onboard()
+    assert manager.max_concurrency == 8
+    assert probe.peak == 1
+    assert len({device.onboarding_thread for device in devices}) == 1
+
+
+def test_given_devices_on_distinct_connections_when_onboard_then_groups_onboard_concurrently():
+    probe = ConcurrencyProbe()
+    devices = []
+    for group in range(4):
+        supervisor = AMQPConnectionSupervisor(connection_factory=BlockingConnectionMock, logger=logger_factory())
+        devices.extend(supervised_devices(supervisor, probe, 3, first_index=group * 3))
+    manager = KNoTThingManager(devices=devices, max_concurrency=4)
+    status = manager.onboard()
+    assert list(status.values()).count(DeviceStatus.ready) == 12
+    assert 1 < probe.peak <= 4
+
+
+def test_given_buffered_device_when_run_then_counts_only_published_data_points(fake_clock, monkeypatch):
+    monkeypatch.setattr("knot_protocol.domain.usecase.data_point_buffer.monotonic", fake_clock)
+    device = DeviceMock(device_id="0000000000000001", publishing_buffer=DataPointBuffer(max_count=3, max_age_seconds=100.0))
+    manager = KNoTThingManager(devices=[device], clock=fake_clock, wait=fake_clock.wait)
+    manager.onboard()
+    manager.schedule(device, interval=1.0, read_data=read_data)
+    manager.run(duration=2.0)
+    assert manager.reports["0000000000000001"].published_data_points == 0
+    assert manager.throughput() == 0.0
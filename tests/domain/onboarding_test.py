@@ -0,0 +1,225 @@
+import asyncio
+from dataclasses import dataclass, field
+from threading import get_ident
+from typing import List
+
+import pytest
+
+from knot_protocol.domain.entities.device_factory import DeviceFactory
+from knot_protocol.domain.exceptions.device_exception import \
+    OnboardingTimeoutException
+from knot_protocol.domain.usecase.onboarding import OnboardingDriver
+from knot_protocol.domain.usecase.states import ReadyState
+from knot_protocol.infrastructure.adapter.output.DTO.device_auth_request_DTO import \
+    DeviceAuthRequestSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_registration_request_DTO import \
+    DeviceRegistrationRequestSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DataPointsSchema
+from knot_protocol.infrastructure.adapter.output.DTO.device_unregistration_request_dto import \
+    DeviceUnregistrationRequestDTO
+from knot_protocol.infrastructure.adapter.output.DTO.update_config_schema import \
+    UpdateConfigRequestSchema
+from knot_protocol.infrastructure.adapter.output.repositories.device_file_repository import \
+    DeviceFileRepository
+from tests.mocks.publisher_mock import AsyncPublisherMock, PublisherMock
+from tests.mocks.subscriber_mock import (AsyncSubscriberMock,
+                                         ConcurrencyProbe,
+                                         InvalidAuthSubscriberMock,
+                                         ValidAuthCallback,
+                                         ValidAuthSubscriberMock,
+                                         ValidRegisterCallback,
+                                         ValidRegisterSubscriberMock,
+                                         ValidSchemaCallback,
+                                         ValidUpdateSchemaSubscriberMock)
+
+
+class FlakyAuthSubscriberMock(ValidAuthSubscriberMock):
+    failures: int = 0
+
+    def subscribe(self):
+        if self.failures > 0:
+            self.failures -= 1
+            raise TimeoutError()
+
+
+@dataclass
+class TimedAuthSubscriberMock(InvalidAuthSubscriberMock):
+    timeout: float = 300.0
+    timeouts: List[float] = field(default_factory=list)
+
+    def subscribe(self):
+        self.timeouts.append(self.timeout)
+        super().subscribe()
+
+
+def onboarding_device(auth_subscriber, onboarding_driver, schema=(), update_config_publisher=None):
+    return DeviceFactory.create(
+        device_id="1964a231a4d14173",
+        name="thing_test",
+        schema=list(schema),
+        amqp_generator=None,
+        register_subscriber=ValidRegisterSubscriberMock(callback=ValidRegisterCallback()),
+        auth_subscriber=auth_subscriber,
+        update_config_subscriber=ValidUpdateSchemaSubscriberMock(callback=ValidSchemaCallback()),
+        register_publisher=PublisherMock(),
+        auth_publisher=PublisherMock(),
+        update_config_publisher=update_config_publisher or PublisherMock(),
+        data_publisher=PublisherMock(),
+        unregister_subscriber=None,
+        unregister_publisher=PublisherMock(),
+        unregister_serializer=DeviceUnregistrationRequestDTO(),
+        register_serializer=DeviceRegistrationRequestSchema(),
+        update_config_serializer=UpdateConfigRequestSchema(),
+        device_auth_serializer=DeviceAuthRequestSchema(),
+        publisher_serializer=DataPointsSchema(),
+        onboarding_driver=onboarding_driver)
+
+
+def test_given_immediate_responses_then_ready_without_waiting(fake_clock):
+    driver = OnboardingDriver(clock=fake_clock, wait=fake_clock.wait)
+    device = onboarding_device(ValidAuthSubscriberMock(callback=ValidAuthCallback()), driver)
+    device.start()
+    assert isinstance(device.state, ReadyState)
+    assert fake_clock.waits == []
+    assert device.time_to_ready == 0.0
+
+
+def test_given_failed_step_then_retries_with_jittered_exponential_delay(fake_clock):
+    driver = OnboardingDriver(clock=fake_clock, wait=fake_clock.wait, base_retry_delay=0.1, jitter=lambda: 0.5)
+    auth_subscriber = FlakyAuthSubscriberMock(callback=ValidAuthCallback())
+    auth_subscriber.failures = 3
+    device = onboarding_device(auth_subscriber, driver)
+    report = driver.run(device)
+    assert isinstance(device.state, ReadyState)
+    assert fake_clock.waits == pytest.approx([0.05, 0.1, 0.2])
+    assert report.attempts["authenticate"] == 4
+    assert report.time_to_ready == pytest.approx(0.35)
+
+
+def test_given_step_past_deadline_then_raises_onboarding_timeout(fake_clock):
+    driver = OnboardingDriver(
+        step_deadlines={"authenticate": 1.0},
+        clock=fake_clock,
+        wait=fake_clock.wait,
+        jitter=lambda: 1.0)
+    device = onboarding_device(InvalidAuthSubscriberMock(callback=ValidAuthCallback()), driver)
+    with pytest.raises(OnboardingTimeoutException):
+        device.start()
+    assert sum(fake_clock.waits) < 1.0 + driver.max_retry_delay
+
+
+def test_given_step_deadline_then_bounds_retry_delays_and_subscriber_timeouts(fake_clock):
+    driver = OnboardingDriver(
+        step_deadlines={"authenticate": 1.0},
+        clock=fake_clock,
+        wait=fake_clock.wait,
+        jitter=lambda: 1.0)
+    auth_subscriber = TimedAuthSubscriberMock(callback=ValidAuthCallback())
+    device = onboarding_device(auth_subscriber, driver)
+    with pytest.raises(OnboardingTimeoutException):
+        device.start()
+    assert fake_clock.waits == pytest.approx([0.1, 0.2, 0.4, 0.3])
+    assert auth_subscriber.timeouts == pytest.approx([1.0, 0.9, 0.7, 0.3])
+    assert auth_subscriber.timeout == 300.0
+
+
+def test_given_acknowledged_config_when_restarted_then_skips_config_round_trip(fake_clock, test_schema, tmp_path):
+    first_update_config_publisher = PublisherMock()
+    device = onboarding_device(
+        ValidAuthSubscriberMock(callback=ValidAuthCallback()),
+        OnboardingDriver(clock=fake_clock, wait=fake_clock.wait),
+        schema=[test_schema],
+        update_config_publisher=first_update_config_publisher)
+    device.start()
+    assert len(first_update_config_publisher.published) == 1
+    assert device.config_hash is not None
+    assert device.last_auth_time is not None
+    repository = DeviceFileRepository(filepath=str(tmp_path / "device.yaml"))
+    repository.save(device=device)
+
+    restarted_device = repository.load()
+    update_config_publisher = PublisherMock()
+    auth_publisher = PublisherMock()
+    DeviceFactory.configure_existing_device(
+        device=restarted_device,
+        amqp_generator=None,
+        register_subscriber=ValidRegisterSubscriberMock(callback=ValidRegisterCallback()),
+        auth_subscriber=ValidAuthSubscriberMock(callback=ValidAuthCallback()),
+        update_config_subscriber=ValidUpdateSchemaSubscriberMock(callback=ValidSchemaCallback()),
+        register_publisher=PublisherMock(),
+        auth_publisher=auth_publisher,
+        update_config_publisher=update_config_publisher,
+        data_publisher=PublisherMock(),
+        unregister_subscriber=None,
+        unregister_publisher=PublisherMock(),
+        unregister_serializer=DeviceUnregistrationRequestDTO(),
+        register_serializer=DeviceRegistrationRequestSchema(),
+        update_config_serializer=UpdateConfigRequestSchema(),
+        device_auth_serializer=DeviceAuthRequestSchema(),
+        publisher_serializer=DataPointsSchema(),
+        onboarding_driver=OnboardingDriver(clock=fake_clock, wait=fake_clock.wait))
+    restarted_device.start()
+    assert isinstance(restarted_device.state, ReadyState)
+    assert restarted_device.config_hash == device.config_hash
+    assert len(auth_publisher.published) == 1
+    assert update_config_publisher.published == []
+
+
+async def async_amqp_generator():
+    yield
+
+
+def async_onboarding_device(index, probe, auth_subscriber=None, onboarding_driver=None):
+    return DeviceFactory.create(
+        device_id=f"{index:016x}",
+        name="thing_test",
+        schema=[],
+        amqp_generator=async_amqp_generator(),
+        register_subscriber=AsyncSubscriberMock(
+            ValidRegisterSubscriberMock(callback=ValidRegisterCallback()), probe),
+        auth_subscriber=AsyncSubscriberMock(
+            auth_subscriber or ValidAuthSubscriberMock(callback=ValidAuthCallback()), probe),
+        update_config_subscriber=AsyncSubscriberMock(
+            ValidUpdateSchemaSubscriberMock(callback=ValidSchemaCallback()), probe),
+        register_publisher=AsyncPublisherMock(),
+        auth_publisher=AsyncPublisherMock(),
+        update_config_publisher=AsyncPublisherMock(),
+        data_publisher=AsyncPublisherMock(),
+        unregister_subscriber=None,
+        unregister_publisher=AsyncPublisherMock(),
+        unregister_serializer=DeviceUnregistrationRequestDTO(),
+        register_serializer=DeviceRegistrationRequestSchema(),
+        update_config_serializer=UpdateConfigRequestSchema(),
+        device_auth_serializer=DeviceAuthRequestSchema(),
+        publisher_serializer=DataPointsSchema(),
+        onboarding_driver=onboarding_driver)
+
+
+def test_given_async_adapters_when_start_async_then_onboards_on_event_loop_thread():
+    probe = ConcurrencyProbe()
+    devices = [async_onboarding_device(index, probe) for index in range(200)]
+
+    async def start():
+        await asyncio.gather(*(device.start_async() for device in devices))
+
+    asyncio.run(start())
+    assert all(isinstance(device.state, ReadyState) for device in devices)
+    assert probe.threads == {get_ident()}
+    assert probe.peak == len(devices)
+
+
+def test_given_failed_step_when_run_async_then_retries_with_jittered_exponential_delay(fake_clock):
+    async def wait_async(delay):
+        fake_clock.wait(delay)
+
+    driver = OnboardingDriver(
+        clock=fake_clock, wait=fake_clock.wait, wait_async=wait_async, base_retry_delay=0.1, jitter=lambda: 0.5)
+    auth_subscriber = FlakyAuthSubscriberMock(callback=ValidAuthCallback())
+    auth_subscriber.failures = 3
+    device = async_onboarding_device(1, ConcurrencyProbe(), auth_subscriber, driver)
+    report = asyncio.run(driver.run_async(device))
+    assert isinstance(device.state, ReadyState)
+    assert fake_clock.waits == pytest.approx([0.05, 0.1, 0.2])
+    assert report.attempts["authenticate"] == 4
+    assert report.time_to_ready == pytest.approx(0.35)
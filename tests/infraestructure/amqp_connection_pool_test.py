@@ -0,0 +1,118 @@
+import pytest
+
+from knot_protocol.domain.exceptions.device_exception import \
+    ConnectionPoolExhaustedException
+from knot_protocol.infrastructure.adapter.input.amqp_connection_pool import (
+    AMQPConnectionPool, AMQPPooledLease, amqp_pooled_setup_generator)
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    AMQPSubscriber, AuthCallback)
+from knot_protocol.infrastructure.adapter.output.publisher import \
+    AMQPPublisher
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import BlockingConnectionMock
+
+
+@pytest.fixture(scope="function")
+def connections():
+    return []
+
+
+@pytest.fixture(scope="function")
+def connection_factory(connections):
+    def create():
+        connection = BlockingConnectionMock()
+        connections.append(connection)
+        return connection
+    return create
+
+
+def test_given_many_devices_then_connections_scale_with_pool_size(connection_factory, connections):
+    pool = AMQPConnectionPool(connection_factory=connection_factory, max_connections=2, max_channels_per_connection=3)
+    generators = [amqp_pooled_setup_generator(pool) for _ in range(6)]
+    for generator in generators:
+        next(generator)
+    assert pool.number_connections == 4
+    assert pool.number_leased_channels == 12
+    assert sorted(len(connection.channels) for connection in connections) == [3, 3, 3, 3]
+
+
+def test_given_leased_channels_then_configured_once(connection_factory, connections):
+    pool = AMQPConnectionPool(connection_factory=connection_factory, prefetch_count=10)
+    subscriber_channel, publisher_channel = next(amqp_pooled_setup_generator(pool))
+    second_subscriber_channel, _ = next(amqp_pooled_setup_generator(pool))
+    assert subscriber_channel.prefetch_count == 10
+    assert publisher_channel.confirmed
+    assert subscriber_channel.exchanges == ["device", "data.sent"]
+    assert second_subscriber_channel.exchanges == []
+
+
+def test_given_stopped_device_then_channels_are_released(connection_factory):
+    pool = AMQPConnectionPool(connection_factory=connection_factory, max_connections=1, max_channels_per_connection=1)
+    generator = amqp_pooled_setup_generator(pool)
+    subscriber_channel, publisher_channel = next(generator)
+    with pytest.raises(StopIteration):
+        next(generator)
+    assert not subscriber_channel.is_open
+    assert not publisher_channel.is_open
+    assert pool.number_leased_channels == 0
+    next(amqp_pooled_setup_generator(pool))
+    assert pool.number_connections == 2
+
+
+def test_given_exhausted_pool_then_raises_exception(connection_factory):
+    pool = AMQPConnectionPool(connection_factory=connection_factory, max_connections=1, max_channels_per_connection=1)
+    next(amqp_pooled_setup_generator(pool))
+    with pytest.raises(ConnectionPoolExhaustedException):
+        next(amqp_pooled_setup_generator(pool))
+
+
+def test_given_closed_pool_then_closes_connections(connection_factory, connections):
+    pool = AMQPConnectionPool(connection_factory=connection_factory)
+    next(amqp_pooled_setup_generator(pool))
+    pool.close()
+    assert all(not connection.is_open for connection in connections)
+    assert pool.number_connections == 0
+
+
+def test_given_dropped_connection_then_pooled_adapters_reconnect_through_pool(connection_factory, connections):
+    pool = AMQPConnectionPool(connection_factory=connection_factory, max_connections=1)
+    lease = AMQPPooledLease(pool)
+    subscriber = AMQPSubscriber(
+        channel=lease.subscriber_channel,
+        queue_name="device_auth_queue",
+        logger=logger_factory(),
+        callback=AuthCallback(),
+        routing_key="device-auth-rpc",
+        timeout=0)
+    publisher = AMQPPublisher(
+        channel=lease.publisher_channel,
+        exchange_name="device",
+        routing_key="device.auth",
+        properties=None,
+        logger=logger_factory())
+    lease.attach_subscriber(subscriber)
+    lease.attach_publisher(publisher)
+    for connection in connections:
+        connection.close()
+    publisher.publish()
+    assert pool.number_connections == 2
+    assert pool.number_leased_channels == 2
+    assert subscriber.channel is lease.subscriber_channel
+    assert publisher.channel is lease.publisher_channel
+    assert subscriber.channel.connection.is_open
+    assert publisher.channel.connection.is_open
+    assert publisher.channel.confirmed
+    assert publisher.channel.published == [publisher.content]
+    assert len(connections) == 4
+
+
+def test_given_released_lease_then_rebound_channels_are_returned(connection_factory, connections):
+    pool = AMQPConnectionPool(connection_factory=connection_factory)
+    lease = AMQPPooledLease(pool)
+    generator = amqp_pooled_setup_generator(pool, lease)
+    next(generator)
+    connections[0].close()
+    lease.reconnect()
+    with pytest.raises(StopIteration):
+        next(generator)
+    assert pool.number_leased_channels == 0
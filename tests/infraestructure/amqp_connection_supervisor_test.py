@@ -0,0 +1,124 @@
+import pytest
+from pika import BasicProperties
+
+from knot_protocol.infrastructure.adapter.input.amqp_connection_supervisor import (
+    AMQPConnectionSupervisor, AMQPSupervisedAttachment,
+    amqp_supervised_setup_generator)
+from knot_protocol.infrastructure.adapter.input.amqp_setup import \
+    amqp_data_management_setup
+from knot_protocol.infrastructure.adapter.input.control_consumer import \
+    AMQPControlConsumer
+from knot_protocol.infrastructure.adapter.input.rpc_client import \
+    AMQPRPCClient
+from knot_protocol.infrastructure.adapter.output.publisher import \
+    AMQPPublisher
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import BlockingConnectionMock
+
+
+class ConnectionFactoryMock:
+    def __init__(self) -> None:
+        self.connections = []
+
+    def __call__(self):
+        connection = BlockingConnectionMock()
+        self.connections.append(connection)
+        return connection
+
+
+@pytest.fixture(scope="function")
+def connection_factory():
+    return ConnectionFactoryMock()
+
+
+@pytest.fixture(scope="function")
+def supervisor(connection_factory):
+    return AMQPConnectionSupervisor(connection_factory=connection_factory, logger=logger_factory())
+
+
+def create_publisher(supervisor):
+    publisher = AMQPPublisher(
+        channel=supervisor.publisher_channel,
+        exchange_name="device",
+        routing_key="device.register",
+        properties=BasicProperties(),
+        logger=logger_factory())
+    supervisor.attach_publisher(publisher)
+    return publisher
+
+
+def test_given_supervisor_then_opens_subscriber_and_confirmed_publisher_channels(supervisor, connection_factory):
+    subscriber_channel = supervisor.subscriber_channel
+    publisher_channel = supervisor.publisher_channel
+    assert len(connection_factory.connections) == 2
+    assert subscriber_channel.prefetch_count == 1
+    assert subscriber_channel.exchanges == ["device", "data.sent"]
+    assert publisher_channel.confirmed
+
+
+def test_given_lost_connection_when_pump_then_reconnects_once_and_rebinds_publishers(supervisor, connection_factory):
+    first_publisher = create_publisher(supervisor)
+    second_publisher = create_publisher(supervisor)
+    old_connections = list(connection_factory.connections)
+    connection_factory.connections[0].is_open = False
+    supervisor.pump()
+    assert supervisor.reconnections == 1
+    assert len(connection_factory.connections) == 4
+    assert all(connection.is_closed for connection in old_connections)
+    assert first_publisher.channel is supervisor.publisher_channel
+    assert second_publisher.channel is supervisor.publisher_channel
+    assert first_publisher.channel.confirmed
+    assert supervisor.subscriber_channel.exchanges == ["device", "data.sent"]
+
+
+def test_given_idle_period_when_sleep_then_pumps_heartbeats(supervisor, connection_factory):
+    supervisor.pump_interval = 0.01
+    supervisor.sleep(0.05)
+    subscriber_connection, publisher_connection = connection_factory.connections
+    assert subscriber_connection.processed_events >= 1
+    assert publisher_connection.processed_events == subscriber_connection.processed_events
+
+
+def test_given_stopped_device_then_adapters_are_detached_and_consumers_stopped(supervisor):
+    attachment = AMQPSupervisedAttachment(supervisor=supervisor, logger=logger_factory())
+    generator = amqp_supervised_setup_generator(supervisor, attachment)
+    subscriber_channel, publisher_channel = next(generator)
+    control_consumer = AMQPControlConsumer(
+        channel=subscriber_channel, queue_name="device_control_1964a231a4d14173", logger=logger_factory())
+    control_consumer.start()
+    publisher = AMQPPublisher(
+        channel=publisher_channel,
+        exchange_name="device",
+        routing_key="device.register",
+        properties=BasicProperties(),
+        logger=logger_factory())
+    attachment.attach_subscriber(control_consumer)
+    attachment.attach_publisher(publisher)
+    with pytest.raises(StopIteration):
+        next(generator)
+    assert control_consumer.supervisor is None
+    assert publisher.supervisor is None
+    assert subscriber_channel.queues == []
+    assert subscriber_channel.consumer_tags == []
+    supervisor.reconnect()
+    assert control_consumer.channel is subscriber_channel
+    assert publisher.channel is publisher_channel
+    assert supervisor.subscriber_channel.queues == []
+
+
+def test_given_rpc_client_and_supervisor_when_reconnect_then_rebinds_rpc_client_once(supervisor, connection_factory):
+    rpc_client = AMQPRPCClient(channel=supervisor.subscriber_channel, logger=logger_factory())
+    rpc_client.start()
+    for device_id in ("1964a231a4d14173", "2964a231a4d14173"):
+        amqp_data_management_setup(
+            logger=logger_factory(),
+            knot_token="token",
+            device_id=device_id,
+            rpc_client=rpc_client,
+            supervisor=supervisor)
+    connection_factory.connections[0].is_open = False
+    supervisor.pump()
+    assert rpc_client.supervisor is supervisor
+    assert rpc_client.channel is supervisor.subscriber_channel
+    assert rpc_client.channel.queues == [rpc_client.reply_to]
+    assert rpc_client.channel.consumer_tags == ["consumer_tag_0"]
@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import pytest
+
+from knot_protocol.infrastructure.adapter.input.async_subscriber import \
+    AsyncAMQPSubscriber
+from knot_protocol.infrastructure.adapter.input.subscriber import \
+    RegisterCallback
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import AsyncChannelMock
+
+TOKEN = "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
+
+
+def registration_response(device_id):
+    return json.dumps({"id": device_id, "name": "device_test", "token": TOKEN, "error": None}).encode("utf-8")
+
+
+def async_subscriber(channel, loop):
+    callback = RegisterCallback(token="")
+    callback.device_id = "1964a231a4d14173"
+    return AsyncAMQPSubscriber(
+        channel=channel,
+        queue_name="device_registered_1964a231a4d14173",
+        logger=logger_factory(),
+        callback=callback,
+        routing_key="device.registered",
+        loop=loop,
+        timeout=1)
+
+
+def test_given_responses_for_other_devices_when_subscribe_async_then_waits_for_own_response():
+    channel = AsyncChannelMock(messages=[
+        registration_response("aaaaaaaaaaaaaaaa"),
+        registration_response("1964a231a4d14173")])
+
+    async def subscribe():
+        subscriber = async_subscriber(channel, asyncio.get_running_loop())
+        await subscriber.subscribe_async()
+        return subscriber
+
+    subscriber = asyncio.run(subscribe())
+    assert subscriber.callback.token == TOKEN
+    assert channel.nacked == [1]
+    assert channel.acked == [2]
+    assert channel.cancelled == ["consumer_tag_0"]
+
+
+def test_given_worker_thread_when_subscribe_then_runs_on_event_loop():
+    channel = AsyncChannelMock(messages=[registration_response("1964a231a4d14173")])
+
+    async def subscribe():
+        subscriber = async_subscriber(channel, asyncio.get_running_loop())
+        await asyncio.to_thread(subscriber.subscribe)
+        return subscriber
+
+    subscriber = asyncio.run(subscribe())
+    assert subscriber.callback.token == TOKEN
+
+
+def test_given_event_loop_thread_when_subscribe_then_raises_runtime_error():
+    channel = AsyncChannelMock(messages=[])
+
+    async def subscribe():
+        async_subscriber(channel, asyncio.get_running_loop()).subscribe()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(subscribe())
+
+
+def test_given_shared_channel_when_unsubscribe_then_cancels_only_own_consumer():
+    channel = AsyncChannelMock(messages=[])
+
+    async def unsubscribe():
+        loop = asyncio.get_running_loop()
+        subscriber = async_subscriber(channel, loop)
+        other_subscriber = async_subscriber(channel, loop)
+        subscription = asyncio.create_task(subscriber.subscribe_async())
+        await asyncio.sleep(0)
+        other_subscriber.unsubscribe()
+        await asyncio.sleep(0)
+        assert channel.cancelled == []
+        subscriber.unsubscribe()
+        await asyncio.sleep(0)
+        subscription.cancel()
+
+    asyncio.run(unsubscribe())
+    assert channel.cancelled == ["consumer_tag_0"]
@@ -0,0 +1,142 @@
+from time import monotonic
+
+from pika.exceptions import AMQPConnectionError
+
+from knot_protocol.infrastructure.adapter.input.amqp_connection_supervisor import \
+    AMQPConnectionSupervisor
+from knot_protocol.infrastructure.adapter.output.background_publisher import (
+    BackgroundPublisher, BoundedPublishingQueue, OverflowPolicy)
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import BlockingConnectionMock
+from tests.mocks.publisher_mock import BlockingPublisherMock, PublisherMock
+
+
+def fill_queue(queue, items):
+    return [queue.put(item) for item in items]
+
+
+def test_given_drop_newest_policy_when_full_then_discards_new_items():
+    queue = BoundedPublishingQueue(maxsize=2, overflow_policy=OverflowPolicy.drop_newest)
+    assert fill_queue(queue, ["a", "b", "c"]) == [True, True, False]
+    assert [queue.get(timeout=0), queue.get(timeout=0)] == ["a", "b"]
+    assert queue.dropped == 1
+
+
+def test_given_drop_oldest_policy_when_full_then_discards_old_items():
+    queue = BoundedPublishingQueue(maxsize=2, overflow_policy=OverflowPolicy.drop_oldest)
+    assert fill_queue(queue, ["a", "b", "c"]) == [True, True, True]
+    assert [queue.get(timeout=0), queue.get(timeout=0)] == ["b", "c"]
+    assert queue.dropped == 1
+
+
+def test_given_block_policy_when_closed_then_rejects_items():
+    queue = BoundedPublishingQueue(maxsize=1, overflow_policy=OverflowPolicy.block)
+    queue.put("a")
+    queue.close()
+    assert not queue.put("b")
+    assert queue.get(timeout=0) == "a"
+    assert queue.get(timeout=0) is None
+
+
+def test_given_started_publisher_when_stopped_then_publishes_pending_items():
+    inner_publisher = PublisherMock()
+    publisher = BackgroundPublisher(
+        publisher=inner_publisher,
+        logger=logger_factory(),
+        channel_factory=lambda: BlockingConnectionMock().channel(),
+        heartbeat_interval=0.01)
+    publisher.start()
+    for content in ["a", "b", "c"]:
+        publisher.content = content
+        publisher.publish()
+    publisher.stop(timeout=5)
+    assert inner_publisher.published == ["a", "b", "c"]
+    assert publisher.published == 3
+    assert not inner_publisher.channel.connection.is_open
+
+
+def test_given_supervised_publisher_when_started_then_worker_owns_its_channel():
+    connections = []
+
+    def connection_factory():
+        connection = BlockingConnectionMock()
+        connections.append(connection)
+        return connection
+    supervisor = AMQPConnectionSupervisor(connection_factory=connection_factory, logger=logger_factory())
+    inner_publisher = PublisherMock()
+    supervisor.attach_publisher(inner_publisher)
+    worker_channels = []
+
+    def channel_factory():
+        worker_channels.append(BlockingConnectionMock().channel())
+        return worker_channels[-1]
+    publisher = BackgroundPublisher(publisher=inner_publisher, logger=logger_factory(), channel_factory=channel_factory)
+    publisher.start()
+    publisher.content = "a"
+    publisher.publish()
+    publisher.stop(timeout=5)
+    supervisor.reconnect()
+    assert inner_publisher.supervisor is publisher
+    assert inner_publisher.channel is worker_channels[0]
+    publisher.reconnect()
+    assert not worker_channels[0].connection.is_open
+    assert inner_publisher.channel is worker_channels[1]
+
+
+def test_given_slow_broker_when_publish_then_returns_without_waiting():
+    inner_publisher = BlockingPublisherMock()
+    publisher = BackgroundPublisher(
+        publisher=inner_publisher,
+        logger=logger_factory(),
+        channel_factory=lambda: BlockingConnectionMock().channel(),
+        maxsize=2,
+        overflow_policy=OverflowPolicy.drop_newest)
+    publisher.start()
+    accepted = []
+    for content in ["a", "b", "c", "d", "e"]:
+        publisher.content = content
+        accepted.append(publisher.publish())
+    assert accepted.count(False) == publisher.dropped
+    assert publisher.dropped >= 2
+    inner_publisher.release.set()
+    publisher.stop(timeout=5)
+    assert len(inner_publisher.published) == 5 - publisher.dropped
+
+
+def test_given_unreachable_broker_when_started_then_retries_channel_until_opened():
+    inner_publisher = PublisherMock()
+    attempts = []
+
+    def channel_factory():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise AMQPConnectionError("broker unavailable")
+        return BlockingConnectionMock().channel()
+    publisher = BackgroundPublisher(
+        publisher=inner_publisher,
+        logger=logger_factory(),
+        channel_factory=channel_factory,
+        maxsize=1,
+        heartbeat_interval=0.01,
+        connection_retry_interval=0.01)
+    publisher.start()
+    for content in ["a", "b", "c"]:
+        publisher.content = content
+        publisher.publish()
+    publisher.stop(timeout=5)
+    assert len(attempts) == 2
+    assert inner_publisher.published == ["a", "b", "c"]
+
+
+def test_given_unreachable_broker_when_stopped_then_worker_exits():
+    def channel_factory():
+        raise AMQPConnectionError("broker unavailable")
+    publisher = BackgroundPublisher(
+        publisher=PublisherMock(),
+        logger=logger_factory(),
+        channel_factory=channel_factory,
+        connection_retry_interval=60.0)
+    publisher.start()
+    start_time = monotonic()
+    publisher.stop(timeout=5)
+    assert monotonic() - start_time < 5
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from knot_protocol.infrastructure.adapter.input.control_consumer import (
+    AMQPControlConsumer, AMQPControlSubscriber)
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    AuthCallback, RegisterCallback, UnregisterCallback, UpdateSchemaCallback)
+from knot_protocol.infrastructure.utils.knot_amqp_options import \
+    KNoTRoutingKey
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import RPCChannelMock
+
+DEVICE_ID = "1964a231a4d14173"
+TOKEN = "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
+AUTH_ROUTING_KEY = "device-auth-rpc"
+
+
+def response(device_id, **fields):
+    return json.dumps({"id": device_id, "error": None, **fields}).encode("utf-8")
+
+
+@pytest.fixture(scope="function")
+def control_channel():
+    return RPCChannelMock()
+
+
+@pytest.fixture(scope="function")
+def control_consumer(control_channel):
+    return AMQPControlConsumer(channel=control_channel, queue_name=f"device_control_{DEVICE_ID}", logger=logger_factory())
+
+
+def control_subscriber(consumer, callback, routing_key):
+    return AMQPControlSubscriber(
+        consumer=consumer,
+        logger=logger_factory(),
+        callback=callback,
+        routing_key=routing_key,
+        timeout=1)
+
+
+@pytest.fixture(scope="function")
+def control_subscribers(control_consumer):
+    return {
+        "register": control_subscriber(
+            control_consumer, RegisterCallback(token=""), KNoTRoutingKey.registered_device.value),
+        "unregister": control_subscriber(
+            control_consumer, UnregisterCallback(), KNoTRoutingKey.unregistered_device.value),
+        "auth": control_subscriber(control_consumer, AuthCallback(), AUTH_ROUTING_KEY),
+        "update": control_subscriber(
+            control_consumer, UpdateSchemaCallback(config=None), KNoTRoutingKey.updated_schema.value)}
+
+
+def receive(subscriber, channel, routing_key, responses):
+    with subscriber:
+        for body in responses:
+            channel.reply(routing_key, body)
+        subscriber.callback.device_id = DEVICE_ID
+        subscriber.subscribe()
+
+
+def test_given_control_subscribers_then_declares_one_queue_bound_to_every_routing_key(
+        control_consumer, control_channel, control_subscribers):
+    control_consumer.start()
+    assert control_channel.declared == [f"device_control_{DEVICE_ID}"]
+    assert sorted(control_channel.bindings) == sorted([
+        KNoTRoutingKey.registered_device.value,
+        KNoTRoutingKey.unregistered_device.value,
+        AUTH_ROUTING_KEY,
+        KNoTRoutingKey.updated_schema.value])
+    assert len(control_channel.consumers) == 1
+
+
+def test_given_responses_then_dispatches_each_to_callback_of_its_routing_key(control_channel, control_subscribers):
+    register_subscriber = control_subscribers["register"]
+    auth_subscriber = control_subscribers["auth"]
+    receive(register_subscriber, control_channel, KNoTRoutingKey.registered_device.value, [
+        response(DEVICE_ID, name="thing", token=TOKEN)])
+    receive(auth_subscriber, control_channel, AUTH_ROUTING_KEY, [
+        response("aaaaaaaaaaaaaaaa"), response(DEVICE_ID)])
+    receive(auth_subscriber, control_channel, AUTH_ROUTING_KEY, [response(DEVICE_ID)])
+    assert register_subscriber.callback.token == TOKEN
+    assert control_channel.acked == [1, 3, 4]
+    assert control_channel.nacked == [2]
+    assert len(control_channel.consumers) == 1
+    assert control_channel.deleted == []
+
+
+def test_given_unexpected_routing_key_then_discards_response(control_consumer, control_channel, control_subscribers):
+    control_channel.reply("device.unknown", response(DEVICE_ID))
+    receive(control_subscribers["auth"], control_channel, AUTH_ROUTING_KEY, [response(DEVICE_ID)])
+    assert control_channel.nacked == [1]
+    assert control_channel.acked == [2]
+
+
+def test_given_every_subscriber_unsubscribed_then_removes_consumer_and_queue(
+        control_consumer, control_channel, control_subscribers):
+    control_consumer.start()
+    for subscriber in control_subscribers.values():
+        subscriber.unsubscribe()
+    assert not control_consumer.is_consuming
+    assert control_channel.consumers == {}
+    assert control_channel.deleted == [f"device_control_{DEVICE_ID}"]
@@ -0,0 +1,70 @@
+from array import array
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import \
+    DataPointColumnsFactory
+from knot_protocol.domain.boundary.output.DTO.publishing_data_dto import \
+    PublishingData
+from knot_protocol.infrastructure.adapter.output.DTO.data_points_encoder import \
+    DataPointsEncoder
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DataPointsSchema
+
+
+@pytest.mark.parametrize("data_points", [
+    [],
+    [DataPointDTO(sensor_id=1, value=42, timestamp="2023-01-21 12:15:00")],
+    [DataPointDTO(sensor_id=1, value="12.57", timestamp="2023-01-21 12:15:00.123456"),
+     DataPointDTO(sensor_id=7, value=-0.1, timestamp='quoted "timestamp"')],
+    [DataPointDTO(sensor_id="2", value=True, timestamp="é"),
+     DataPointDTO(sensor_id=3, value=1e20, timestamp=None),
+     DataPointDTO(sensor_id=4, value=float("nan"), timestamp="t"),
+     DataPointDTO(sensor_id=5, value=float("-inf"), timestamp="t")],
+])
+def test_given_data_points_then_output_matches_marshmallow(test_schema, data_points):
+    data = PublishingData(id="1964a231a4d14173", data=data_points)
+    encoder = DataPointsEncoder(config=[test_schema])
+    assert encoder.dumps(data) == DataPointsSchema().dumps(data).encode("utf-8")
+
+
+def test_given_device_id_change_then_header_is_updated(test_schema, data_point):
+    encoder = DataPointsEncoder(config=[test_schema])
+    encoder.dumps(PublishingData(id="1964a231a4d14173", data=[data_point]))
+    encoded = encoder.dumps(PublishingData(id="a964a231a4d14173", data=[data_point]))
+    assert encoded.startswith(b'{"id": "a964a231a4d14173"')
+
+
+def test_given_validate_mode_when_invalid_data_point_then_raises_validation_error(test_schema):
+    data = PublishingData(
+        id="1964a231a4d14173",
+        data=[DataPointDTO(sensor_id=-1, value=42, timestamp="2023-01-21 12:15:00")])
+    assert DataPointsEncoder(config=[test_schema]).dumps(data)
+    with pytest.raises(ValidationError):
+        DataPointsEncoder(config=[test_schema], validate=True).dumps(data)
+
+
+def test_given_columns_then_output_matches_data_points(test_schema):
+    data_points = [
+        DataPointDTO(sensor_id=1, value=42, timestamp="2023-01-21 12:15:00"),
+        DataPointDTO(sensor_id=7, value=-0.1, timestamp='quoted "timestamp"')]
+    columns = DataPointColumnsFactory.create(
+        sensor_ids=array("i", [1, 7]),
+        values=memoryview(array("d", [42, -0.1])),
+        timestamps=["2023-01-21 12:15:00", 'quoted "timestamp"'])
+    encoder = DataPointsEncoder(config=[test_schema])
+    assert encoder.encode_columns("1964a231a4d14173", columns) ==\
+        encoder.dumps(PublishingData(id="1964a231a4d14173", data=data_points))
+
+
+def test_given_numpy_columns_then_output_matches_data_points(test_schema):
+    numpy = pytest.importorskip("numpy")
+    columns = DataPointColumnsFactory.create(
+        sensor_ids=numpy.array([1, 2], dtype=numpy.int32),
+        values=numpy.array([1.5, 2.25]),
+        timestamps="2023-01-21 12:15:00")
+    data = PublishingData(id="1964a231a4d14173", data=columns.to_data_points())
+    assert DataPointsEncoder(config=[test_schema]).encode_columns("1964a231a4d14173", columns) ==\
+        DataPointsSchema().dumps(data).encode("utf-8")
@@ -0,0 +1,45 @@
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DeviceSchema
+from knot_protocol.infrastructure.adapter.output.repositories.device_codecs import (
+    JSONCodec, YAMLCodec, codec_for, write_file)
+from knot_protocol.infrastructure.adapter.output.repositories.device_file_repository import \
+    DeviceFileRepository
+
+
+@pytest.fixture(scope="function")
+def device(valid_device_schema):
+    return DeviceSchema().load(valid_device_schema)
+
+
+@pytest.mark.parametrize("filename", ["device.yaml", "device.yml", "device.json", "device.conf"])
+def test_given_file_extension_then_save_and_load_device(tmp_path, device, filename):
+    repository = DeviceFileRepository(filepath=str(tmp_path / filename))
+    repository.save(device=device)
+    loaded_device = repository.load()
+    assert loaded_device.device_id == device.device_id
+    assert loaded_device.config == device.config
+
+
+def test_given_file_extension_then_select_codec():
+    assert isinstance(codec_for("device.JSON"), JSONCodec)
+    assert isinstance(codec_for("device.yaml"), YAMLCodec)
+    assert isinstance(codec_for("device"), YAMLCodec)
+
+
+def test_given_msgpack_file_then_save_and_load_device(tmp_path, device):
+    pytest.importorskip("msgpack")
+    repository = DeviceFileRepository(filepath=str(tmp_path / "device.msgpack"))
+    repository.save(device=device)
+    assert repository.load().device_id == device.device_id
+
+
+def test_given_invalid_json_device_then_raise_validation_error(tmp_path, valid_device_schema):
+    valid_device_schema["id"] = "12345"
+    filepath = str(tmp_path / "device.json")
+    write_file(filepath, valid_device_schema)
+    with pytest.raises(ValidationError):
+        DeviceFileRepository(filepath=filepath).load()
+
@@ -0,0 +1,55 @@
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from knot_protocol.infrastructure.adapter.output.DTO.device_validation_cache import (
+    DeviceValidationCache, is_same_device)
+
+
+def test_given_unchanged_content_then_skip_validation(valid_device_schema):
+    validation_cache = DeviceValidationCache()
+    first_device = validation_cache.load(valid_device_schema)
+    second_device = validation_cache.load(valid_device_schema)
+    assert validation_cache.hits == 1
+    assert validation_cache.misses == 1
+    assert second_device is not first_device
+    assert is_same_device(first_device, second_device)
+
+
+def test_given_changed_content_then_validate_again(valid_device_schema):
+    validation_cache = DeviceValidationCache()
+    validation_cache.load(valid_device_schema)
+    valid_device_schema["id"] = "12345"
+    with pytest.raises(ValidationError):
+        validation_cache.load(valid_device_schema)
+    with pytest.raises(ValidationError):
+        validation_cache.load(valid_device_schema)
+    assert validation_cache.hits == 0
+    assert len(validation_cache) == 1
+
+
+def test_given_content_converted_by_schema_then_do_not_cache_it(valid_device_schema):
+    valid_device_schema["config"][0]["schema"]["typeId"] = "65521"
+    validation_cache = DeviceValidationCache()
+    validation_cache.load(valid_device_schema)
+    device = validation_cache.load(valid_device_schema)
+    assert validation_cache.hits == 0
+    assert device.config[0]["schema"].type_id == 65521
+
+
+def test_given_sidecar_then_reuse_validations_across_instances(tmp_path, valid_device_schema):
+    filepath = str(tmp_path / "validation.cache")
+    DeviceValidationCache(filepath=filepath).load(valid_device_schema)
+    validation_cache = DeviceValidationCache(filepath=filepath)
+    validation_cache.load(valid_device_schema)
+    assert validation_cache.hits == 1
+
+
+def test_given_max_size_then_evict_least_recently_used(valid_device_schema):
+    validation_cache = DeviceValidationCache(max_size=2)
+    for device_id in ["0000000000000001", "0000000000000002", "0000000000000003"]:
+        valid_device_schema["id"] = device_id
+        validation_cache.load(valid_device_schema)
+    assert len(validation_cache) == 2
+    valid_device_schema["id"] = "0000000000000001"
+    validation_cache.load(valid_device_schema)
+    assert validation_cache.hits == 0
@@ -0,0 +1,84 @@
+import pytest
+
+from knot_protocol.domain.usecase.states import (AUTHENTICATED_STATE,
+                                                 READY_STATE,
+                                                 REGISTERED_STATE)
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DeviceSchema
+from knot_protocol.infrastructure.adapter.output.repositories.journaled_device_repository import \
+    JournaledDeviceRepository
+
+
+@pytest.fixture(scope="function")
+def device(valid_device_schema):
+    return DeviceSchema().load(valid_device_schema)
+
+
+@pytest.fixture(scope="function")
+def repository(tmp_path):
+    journaled_repository = JournaledDeviceRepository(filepath=str(tmp_path / "device.json"))
+    yield journaled_repository
+    journaled_repository.close()
+
+
+def journal_lines(repository):
+    with open(repository.journal_filepath, "r", encoding="utf-8") as file_reader:
+        return file_reader.readlines()
+
+
+def test_given_transitions_then_load_replays_journal(tmp_path, repository, device):
+    device.repository = repository
+    device.transition_to_state(REGISTERED_STATE)
+    device.token = "00000000-0000-0000-0000-000000000000"
+    device.transition_to_state(AUTHENTICATED_STATE)
+    device.transition_to_state(READY_STATE)
+    repository.close()
+    assert len(journal_lines(repository)) == 2
+
+    loaded_device = JournaledDeviceRepository(filepath=str(tmp_path / "device.json")).load()
+    assert loaded_device.state == "readyToSendData"
+    assert loaded_device.token == "00000000-0000-0000-0000-000000000000"
+    assert loaded_device.config == device.config
+
+
+def test_given_unchanged_device_then_record_nothing(repository, device):
+    repository.save(device)
+    repository.record(device)
+    repository.close()
+    assert journal_lines(repository) == []
+
+
+def test_given_compaction_threshold_then_compact_into_snapshot(tmp_path, device):
+    repository = JournaledDeviceRepository(filepath=str(tmp_path / "device.yaml"), compaction_threshold=2)
+    repository.save(device)
+    for state in [REGISTERED_STATE, AUTHENTICATED_STATE, READY_STATE]:
+        device.state = state
+        repository.record(device)
+    repository.close()
+    assert journal_lines(repository) == []
+    assert repository.records == 0
+    assert repository.load().state == "readyToSendData"
+
+
+def test_given_torn_journal_record_then_ignore_and_truncate_it(repository, device):
+    repository.save(device)
+    device.state = REGISTERED_STATE
+    repository.record(device)
+    repository.close()
+    with open(repository.journal_filepath, "a", encoding="utf-8") as file_writer:
+        file_writer.write('{"state":"authentic')
+    assert repository.load().state == "registered"
+    assert len(journal_lines(repository)) == 1
+
+
+def test_given_records_from_previous_snapshot_then_ignore_them(repository, device):
+    repository.save(device)
+    device.state = REGISTERED_STATE
+    repository.record(device)
+    repository.close()
+    stale_records = journal_lines(repository)
+    device.state = READY_STATE
+    repository.save(device)
+    with open(repository.journal_filepath, "a", encoding="utf-8") as file_writer:
+        file_writer.writelines(stale_records)
+    assert repository.load().state == "readyToSendData"
@@ -0,0 +1,156 @@
+from time import sleep
+
+import pytest
+
+from knot_protocol.infrastructure.adapter.output.outbox_publisher import \
+    OutboxPublisher
+from knot_protocol.infrastructure.adapter.output.publisher import \
+    AMQPPublisher
+from knot_protocol.infrastructure.adapter.output.repositories.sqlite_outbox import \
+    SQLiteOutbox
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import ClosedByBrokerChannelMock
+from tests.mocks.publisher_mock import (BlockingPublisherMock,
+                                        ConnectionPublisherMock)
+
+
+@pytest.fixture(scope="function")
+def outbox(tmp_path):
+    sqlite_outbox = SQLiteOutbox(filepath=str(tmp_path / "outbox.db"))
+    yield sqlite_outbox
+    sqlite_outbox.close()
+
+
+@pytest.fixture(scope="function")
+def connection_publisher_mock():
+    return ConnectionPublisherMock()
+
+
+def test_given_appended_messages_then_peek_in_order(outbox):
+    for message in ["a", "b", "c"]:
+        outbox.append(message)
+    assert [payload for _, payload in outbox.peek(2)] == [b"a", b"b"]
+    message_id, _ = outbox.peek(1)[0]
+    outbox.remove(message_id)
+    assert [payload for _, payload in outbox.peek(10)] == [b"b", b"c"]
+
+
+def test_given_reopened_outbox_then_messages_are_kept(tmp_path):
+    filepath = str(tmp_path / "outbox.db")
+    first_outbox = SQLiteOutbox(filepath=filepath)
+    first_outbox.append("a")
+    first_outbox.close()
+    second_outbox = SQLiteOutbox(filepath=filepath)
+    assert len(second_outbox) == 1
+    assert second_outbox.size == 1
+    second_outbox.close()
+
+
+def test_given_size_retention_then_drops_oldest_messages(tmp_path):
+    outbox = SQLiteOutbox(filepath=str(tmp_path / "outbox.db"), max_bytes=4)
+    for message in ["aa", "bb", "cc"]:
+        outbox.append(message)
+    assert [payload for _, payload in outbox.peek(10)] == [b"bb", b"cc"]
+    outbox.close()
+
+
+def test_given_age_retention_then_drops_expired_messages(tmp_path):
+    outbox = SQLiteOutbox(filepath=str(tmp_path / "outbox.db"), max_age_seconds=-1)
+    outbox.append("a")
+    assert len(outbox) == 0
+    outbox.close()
+
+
+def test_given_disconnected_broker_when_publish_then_keeps_messages_and_replays_in_order(
+    outbox,
+    connection_publisher_mock):
+    publisher = OutboxPublisher(publisher=connection_publisher_mock, outbox=outbox, logger=logger_factory())
+    publisher.start()
+    connection_publisher_mock.is_connected = False
+    for content in ["a", "b"]:
+        publisher.content = content
+        publisher.publish()
+    assert connection_publisher_mock.published == []
+    assert len(outbox) == 2
+    connection_publisher_mock.is_connected = True
+    publisher.content = "c"
+    publisher.publish()
+    publisher.stop(timeout=5)
+    assert connection_publisher_mock.published == [b"a", b"b", b"c"]
+    assert len(outbox) == 0
+
+
+def test_given_failing_broker_when_replay_then_keeps_messages(outbox, connection_publisher_mock):
+    publisher = OutboxPublisher(publisher=connection_publisher_mock, outbox=outbox, logger=logger_factory())
+    connection_publisher_mock.fail = True
+    publisher.content = "a"
+    publisher.publish()
+    assert len(outbox) == 1
+    connection_publisher_mock.fail = False
+    assert publisher.replay()
+    assert connection_publisher_mock.published == [b"a"]
+
+
+def test_given_returned_message_then_sets_it_aside_after_max_attempts(outbox, connection_publisher_mock):
+    publisher = OutboxPublisher(
+        publisher=connection_publisher_mock, outbox=outbox, logger=logger_factory(), max_returned_attempts=2)
+    connection_publisher_mock.returned = {b"a"}
+    publisher.content = "a"
+    publisher.publish()
+    publisher.replay()
+    assert len(outbox) == 1
+    publisher.content = "b"
+    publisher.publish()
+    publisher.replay()
+    assert connection_publisher_mock.published == [b"b"]
+    assert len(outbox) == 0
+    assert outbox.set_aside_messages(10) == [(1, b"a")]
+    assert outbox.size == 0
+
+
+def test_given_disconnected_broker_when_retry_interval_elapsed_then_attempts_replay(
+    outbox,
+    connection_publisher_mock):
+    publisher = OutboxPublisher(
+        publisher=connection_publisher_mock, outbox=outbox, logger=logger_factory(), retry_interval=0.01)
+    connection_publisher_mock.is_connected = False
+    publisher.start()
+    publisher.content = "a"
+    publisher.publish()
+    sleep(0.05)
+    publisher.stop(timeout=5)
+    assert connection_publisher_mock.published == [b"a"]
+    assert OutboxPublisher(
+        publisher=connection_publisher_mock, outbox=outbox, logger=logger_factory()).retry_interval is not None
+
+
+def test_given_connection_closed_by_broker_when_replay_then_does_not_retry_indefinitely(outbox):
+    channel = ClosedByBrokerChannelMock()
+    amqp_publisher = AMQPPublisher(
+        channel=channel,
+        exchange_name="data.sent",
+        routing_key="",
+        properties=None,
+        logger=logger_factory())
+    publisher = OutboxPublisher(publisher=amqp_publisher, outbox=outbox, logger=logger_factory())
+    publisher.content = "a"
+    publisher.publish()
+    assert not publisher.replay()
+    assert channel.attempts == 1
+    assert len(outbox) == 1
+
+
+def test_given_slow_broker_when_publish_then_returns_without_waiting(outbox):
+    blocking_publisher_mock = BlockingPublisherMock()
+    publisher = OutboxPublisher(
+        publisher=blocking_publisher_mock, outbox=outbox, logger=logger_factory(), retry_interval=0.01)
+    publisher.start()
+    for content in ["a", "b"]:
+        publisher.content = content
+        publisher.publish()
+    assert blocking_publisher_mock.published == []
+    blocking_publisher_mock.release.set()
+    sleep(0.05)
+    publisher.stop(timeout=5)
+    assert blocking_publisher_mock.published == [b"a", b"b"]
+    assert len(outbox) == 0
@@ -0,0 +1,177 @@
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+
+from knot_protocol.domain.exceptions.device_exception import (
+    MessageNackedException, PublisherBacklogFullException,
+    UnroutableMessageException)
+from knot_protocol.infrastructure.adapter.output.async_publisher import \
+    AsyncAMQPPublisher
+from knot_protocol.infrastructure.adapter.output.pipelined_publisher import (
+    AMQPConfirmTracker, AMQPPipelinedPublisher)
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import ConfirmChannelMock
+
+
+@pytest.fixture(scope="function")
+def confirm_channel():
+    return ConfirmChannelMock()
+
+
+def pipelined_publisher(tracker, routing_key=""):
+    return AMQPPipelinedPublisher(
+        tracker=tracker,
+        exchange_name="data.sent",
+        routing_key=routing_key,
+        properties=None,
+        logger=logger_factory())
+
+
+def test_given_full_window_then_holds_messages_until_acked(confirm_channel):
+    tracker = AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory(), max_in_flight=2)
+    publisher = pipelined_publisher(tracker)
+    futures = []
+    for content in ["a", "b", "c"]:
+        publisher.content = content
+        futures.append(publisher.publish())
+    assert confirm_channel.published == ["a", "b"]
+    assert tracker.in_flight == 2
+    assert tracker.backlog == 1
+    confirm_channel.ack(delivery_tag=1)
+    assert futures[0].result() is True
+    assert not futures[1].done()
+    assert confirm_channel.published == ["a", "b", "c"]
+
+
+def test_given_multiple_ack_then_confirms_all_previous_messages(confirm_channel):
+    tracker = AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory(), max_in_flight=10)
+    publisher = pipelined_publisher(tracker)
+    futures = []
+    for content in ["a", "b", "c"]:
+        publisher.content = content
+        futures.append(publisher.publish())
+    confirm_channel.ack(delivery_tag=2, multiple=True)
+    assert futures[0].done() and futures[1].done()
+    assert not futures[2].done()
+    assert tracker.in_flight == 1
+
+
+def test_given_nack_then_republishes_message(confirm_channel):
+    nacked = []
+    tracker = AMQPConfirmTracker(
+        channel=confirm_channel,
+        logger=logger_factory(),
+        max_in_flight=10,
+        on_nack=nacked.append)
+    publisher = pipelined_publisher(tracker)
+    publisher.content = "a"
+    future = publisher.publish()
+    confirm_channel.nack(delivery_tag=1)
+    assert [message.body for message in nacked] == ["a"]
+    assert confirm_channel.published == ["a", "a"]
+    confirm_channel.ack(delivery_tag=2)
+    assert future.result() is True
+
+
+def test_given_returned_message_then_future_raises_unroutable(confirm_channel):
+    tracker = AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory(), max_in_flight=10)
+    publisher = pipelined_publisher(tracker, routing_key="device.register")
+    publisher.content = "a"
+    future = publisher.publish()
+    confirm_channel.return_message(
+        exchange="data.sent", routing_key="device.register", body=b"a",
+        properties=confirm_channel.published_properties[0])
+    confirm_channel.ack(delivery_tag=1)
+    with pytest.raises(UnroutableMessageException):
+        future.result()
+
+
+def test_given_returned_message_with_repeated_body_then_matches_it_by_message_id(confirm_channel):
+    tracker = AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory(), max_in_flight=10)
+    publisher = pipelined_publisher(tracker, routing_key="device.register")
+    publisher.content = "a"
+    first_future = publisher.publish()
+    second_future = publisher.publish()
+    confirm_channel.return_message(
+        exchange="data.sent", routing_key="device.register", body=b"a",
+        properties=confirm_channel.published_properties[1])
+    confirm_channel.ack(delivery_tag=2, multiple=True)
+    assert first_future.result() is True
+    with pytest.raises(UnroutableMessageException):
+        second_future.result()
+
+
+def test_given_message_nacked_max_publish_attempts_times_then_drops_it(confirm_channel):
+    nacked = []
+    tracker = AMQPConfirmTracker(
+        channel=confirm_channel,
+        logger=logger_factory(),
+        max_in_flight=10,
+        max_publish_attempts=2,
+        on_nack=nacked.append)
+    publisher = pipelined_publisher(tracker)
+    publisher.content = "a"
+    future = publisher.publish()
+    confirm_channel.nack(delivery_tag=1)
+    confirm_channel.nack(delivery_tag=2)
+    assert confirm_channel.published == ["a", "a"]
+    assert len(nacked) == 2
+    assert tracker.in_flight == 0
+    assert tracker.backlog == 0
+    with pytest.raises(MessageNackedException):
+        future.result()
+
+
+def test_given_rebind_then_republishes_unconfirmed_messages(confirm_channel):
+    tracker = AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory(), max_in_flight=10)
+    publisher = pipelined_publisher(tracker)
+    publisher.content = "a"
+    future = publisher.publish()
+    new_channel = ConfirmChannelMock()
+    tracker.rebind(new_channel)
+    assert new_channel.published == ["a"]
+    new_channel.ack(delivery_tag=1)
+    assert future.result() is True
+
+
+def test_given_max_in_flight_environment_variable_then_read_when_tracker_is_created(confirm_channel, monkeypatch):
+    monkeypatch.setenv("AMQP_MAX_IN_FLIGHT", "3")
+    assert AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory()).max_in_flight == 3
+
+
+def test_given_full_backlog_then_rejects_message_until_window_has_capacity(confirm_channel):
+    tracker = AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory(), max_in_flight=1, max_backlog=1)
+    first_future = tracker.publish("data.sent", "", "first", None)
+    tracker.publish("data.sent", "", "second", None)
+    rejected_future = tracker.publish("data.sent", "", "third", None)
+    capacity = tracker.wait_for_capacity()
+    assert isinstance(rejected_future.exception(), PublisherBacklogFullException)
+    assert not capacity.done()
+    confirm_channel.ack(delivery_tag=1)
+    assert first_future.result() is True
+    assert capacity.result() is True
+    assert confirm_channel.published == ["first", "second"]
+
+
+def test_given_async_publisher_then_publish_returns_future_on_and_off_event_loop(confirm_channel):
+    async def publish():
+        loop = asyncio.get_running_loop()
+        tracker = AMQPConfirmTracker(channel=confirm_channel, logger=logger_factory())
+        publisher = AsyncAMQPPublisher(
+            tracker=tracker, exchange_name="data.sent", routing_key="", properties=None,
+            logger=logger_factory(), loop=loop)
+        publisher.content = "on loop"
+        on_loop_future = publisher.publish()
+        publisher.content = "off loop"
+        off_loop_future = await asyncio.to_thread(publisher.publish)
+        await asyncio.sleep(0)
+        confirm_channel.ack(delivery_tag=2, multiple=True)
+        assert await publisher.wait_for_confirms()
+        return on_loop_future, await asyncio.wrap_future(off_loop_future)
+
+    on_loop_future, off_loop_result = asyncio.run(publish())
+    assert isinstance(on_loop_future, Future)
+    assert on_loop_future.result() is True
+    assert off_loop_result is True
+    assert confirm_channel.published == ["on loop", "off loop"]
@@ -0,0 +1,148 @@
+import json
+
+import pytest
+from pika import BasicProperties
+
+from knot_protocol.infrastructure.adapter.input.rpc_client import (
+    AMQPRPCClient, AMQPRPCSubscriber)
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    AuthCallback, RegisterCallback)
+from knot_protocol.infrastructure.adapter.output.rpc_publisher import \
+    AMQPRPCPublisher
+from knot_protocol.infrastructure.utils.knot_amqp_options import \
+    KNoTRoutingKey
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import ReplyingChannelMock, RPCChannelMock
+
+TOKEN = "5b67ce6b-ef21-7013-3115-2d6297e1bd2b"
+DEVICE_IDS = ["1964a231a4d14173", "aaaaaaaaaaaaaaaa", "bbbbbbbbbbbbbbbb"]
+
+
+def registration_response(device_id):
+    return json.dumps({"id": device_id, "name": "thing", "token": TOKEN, "error": None}).encode("utf-8")
+
+
+@pytest.fixture(scope="function")
+def rpc_channel():
+    return RPCChannelMock()
+
+
+@pytest.fixture(scope="function")
+def rpc_client(rpc_channel):
+    client = AMQPRPCClient(channel=rpc_channel, logger=logger_factory())
+    client.start()
+    return client
+
+
+def register_subscriber(rpc_client, device_id):
+    callback = RegisterCallback(token="")
+    callback.device_id = device_id
+    return AMQPRPCSubscriber(
+        client=rpc_client,
+        logger=logger_factory(),
+        callback=callback,
+        routing_key=KNoTRoutingKey.registered_device.value,
+        timeout=1)
+
+
+def test_given_rpc_client_then_declares_one_reply_queue_and_consumer(rpc_client, rpc_channel):
+    register_subscriber(rpc_client, "1964a231a4d14173")
+    register_subscriber(rpc_client, "aaaaaaaaaaaaaaaa")
+    assert rpc_channel.declared == [rpc_client.reply_to]
+    assert rpc_channel.bindings == [rpc_client.reply_to, KNoTRoutingKey.registered_device.value]
+    assert len(rpc_channel.consumers) == 1
+
+
+def test_given_responses_for_many_devices_then_dispatches_each_without_nack(rpc_client, rpc_channel):
+    first_subscriber = register_subscriber(rpc_client, "1964a231a4d14173")
+    second_subscriber = register_subscriber(rpc_client, "aaaaaaaaaaaaaaaa")
+    rpc_channel.reply(KNoTRoutingKey.registered_device.value, registration_response("aaaaaaaaaaaaaaaa"))
+    rpc_channel.reply(KNoTRoutingKey.registered_device.value, registration_response("bbbbbbbbbbbbbbbb"))
+    rpc_channel.reply(KNoTRoutingKey.registered_device.value, registration_response("1964a231a4d14173"))
+    with first_subscriber:
+        first_subscriber.subscribe()
+    with second_subscriber:
+        second_subscriber.subscribe()
+    assert first_subscriber.callback.token == TOKEN
+    assert second_subscriber.callback.token == TOKEN
+    assert rpc_channel.acked == [1, 2, 3]
+    assert rpc_channel.nacked == []
+    assert rpc_client.pending == 0
+
+
+def test_given_no_response_when_deadline_expires_then_request_is_discarded(rpc_client):
+    subscriber = register_subscriber(rpc_client, "1964a231a4d14173")
+    subscriber.timeout = 0.01
+    with subscriber:
+        subscriber.subscribe()
+    assert subscriber.callback.token == ""
+    assert rpc_client.pending == 0
+
+
+def test_given_client_stopped_while_waiting_then_subscribe_returns(rpc_client, rpc_channel):
+    subscriber = register_subscriber(rpc_client, "1964a231a4d14173")
+    rpc_channel.connection.process_data_events = lambda time_limit=0: rpc_client.stop()
+    with subscriber:
+        subscriber.subscribe()
+    assert subscriber.callback.token == ""
+    assert rpc_client.pending == 0
+
+
+def test_given_rpc_publisher_then_each_request_has_unique_correlation_id(rpc_client, rpc_channel):
+    callback = AuthCallback()
+    auth_subscriber = AMQPRPCSubscriber(
+        client=rpc_client,
+        logger=logger_factory(),
+        callback=callback,
+        routing_key=rpc_client.reply_to,
+        timeout=1)
+    response = json.dumps({"id": "1964a231a4d14173", "error": None}).encode("utf-8")
+    publisher_channel = ReplyingChannelMock(reply_channel=rpc_channel, response=response)
+    auth_publisher = AMQPRPCPublisher(
+        channel=publisher_channel,
+        exchange_name="device",
+        routing_key="device.auth",
+        properties=BasicProperties(headers={"Authorization": TOKEN}, delivery_mode=2),
+        logger=logger_factory(),
+        reply_subscriber=auth_subscriber)
+    for _ in range(2):
+        with auth_subscriber:
+            auth_publisher.publish()
+            auth_subscriber.callback.device_id = "1964a231a4d14173"
+            auth_subscriber.subscribe()
+    first_request, second_request = publisher_channel.published
+    assert first_request.reply_to == rpc_client.reply_to
+    assert first_request.correlation_id != second_request.correlation_id
+    assert rpc_channel.acked == [1, 2]
+    assert rpc_client.pending == 0
+
+
+def test_given_ack_batch_size_then_acknowledges_batch_with_one_multiple_ack(rpc_channel):
+    client = AMQPRPCClient(channel=rpc_channel, logger=logger_factory(), ack_batch_size=3)
+    client.start()
+    subscribers = [register_subscriber(client, device_id) for device_id in DEVICE_IDS]
+    for device_id in DEVICE_IDS:
+        rpc_channel.reply(KNoTRoutingKey.registered_device.value, registration_response(device_id))
+    for subscriber in subscribers:
+        with subscriber:
+            subscriber.subscribe()
+    assert all(subscriber.callback.token == TOKEN for subscriber in subscribers)
+    assert rpc_channel.acked == [3]
+    assert rpc_channel.multiple_acks == [True]
+
+
+def test_given_partial_ack_batch_when_stop_then_flushes_pending_ack(rpc_channel):
+    client = AMQPRPCClient(channel=rpc_channel, logger=logger_factory(), ack_batch_size=8)
+    client.start()
+    register_subscriber(client, DEVICE_IDS[0])
+    rpc_channel.reply(KNoTRoutingKey.registered_device.value, registration_response(DEVICE_IDS[0]))
+    rpc_channel.process_data_events()
+    assert rpc_channel.acked == []
+    client.stop()
+    assert rpc_channel.acked == [1]
+    assert rpc_channel.multiple_acks == [False]
+
+
+def test_given_invalid_ack_batch_size_then_raises(rpc_channel):
+    with pytest.raises(ValueError):
+        AMQPRPCClient(channel=rpc_channel, logger=logger_factory(), ack_batch_size=0)
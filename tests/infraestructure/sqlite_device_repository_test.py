@@ -0,0 +1,67 @@
+import pytest
+
+from knot_protocol.domain.exceptions.device_exception import \
+    DeviceNotFoundException
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import \
+    DeviceSchema
+from knot_protocol.infrastructure.adapter.output.repositories.sqlite_device_repository import \
+    SQLiteDeviceRepository
+
+
+@pytest.fixture(scope="function")
+def repository(tmp_path):
+    sqlite_repository = SQLiteDeviceRepository(filepath=str(tmp_path / "devices.db"))
+    yield sqlite_repository
+    sqlite_repository.close()
+
+
+@pytest.fixture(scope="function")
+def devices(valid_device_schema):
+    loaded_devices = []
+    for index in range(5):
+        valid_device_schema["id"] = f"{index:016x}"
+        loaded_devices.append(DeviceSchema().load(valid_device_schema))
+    return loaded_devices
+
+
+def test_given_saved_devices_then_load_all_in_device_id_order(repository, devices):
+    repository.save_many(reversed(devices))
+    assert len(repository) == len(devices)
+    assert [device.device_id for device in repository.load_all()] == [device.device_id for device in devices]
+
+
+def test_given_saved_devices_then_load_by_id(repository, devices):
+    repository.save_many(devices)
+    device = repository.load_by_id(devices[3].device_id)
+    assert device.device_id == devices[3].device_id
+    assert device.config == devices[3].config
+
+
+def test_given_unknown_device_id_then_raise_exception(repository, devices):
+    repository.save_many(devices)
+    with pytest.raises(DeviceNotFoundException):
+        repository.load_by_id("ffffffffffffffff")
+
+
+def test_given_saved_device_then_save_updates_it(repository, devices):
+    repository.save_many(devices)
+    devices[0].token = "00000000-0000-0000-0000-000000000000"
+    repository.save(device=devices[0])
+    assert len(repository) == len(devices)
+    assert repository.load_by_id(devices[0].device_id).token == devices[0].token
+
+
+def test_given_batch_size_then_iterate_streams_every_device(repository, devices):
+    repository.save_many(devices)
+    assert [device.device_id for device in repository.iterate(batch_size=2)] ==\
+        [device.device_id for device in devices]
+
+
+def test_given_repository_device_id_then_load_that_device(tmp_path, devices):
+    filepath = str(tmp_path / "devices.db")
+    writer = SQLiteDeviceRepository(filepath=filepath)
+    writer.save_many(devices)
+    writer.close()
+    reader = SQLiteDeviceRepository(filepath=filepath, device_id=devices[2].device_id)
+    assert reader.load().device_id == devices[2].device_id
+    reader.close()
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from knot_protocol.infrastructure.adapter.input.subscriber import (
+    AMQPSubscriber, AuthCallback)
+from knot_protocol.infrastructure.utils.logger import logger_factory
+from tests.mocks.channel_mock import ConsumerChannelMock
+
+DEVICE_ID = "1964a231a4d14173"
+
+
+def auth_response(device_id):
+    return json.dumps({"id": device_id, "error": None}).encode("utf-8")
+
+
+@pytest.fixture(scope="function")
+def consumer_channel():
+    return ConsumerChannelMock()
+
+
+def auth_subscriber(channel, persistent):
+    callback = AuthCallback()
+    callback.device_id = DEVICE_ID
+    return AMQPSubscriber(
+        channel=channel,
+        queue_name=f"device_auth_queue_{DEVICE_ID}",
+        logger=logger_factory(),
+        callback=callback,
+        routing_key="device-auth-rpc",
+        timeout=1,
+        persistent=persistent)
+
+
+def authenticate(subscriber, channel, responses):
+    with subscriber:
+        channel.messages.extend(responses)
+        subscriber.subscribe()
+
+
+def test_given_persistent_subscriber_then_declares_queue_and_consumer_once(consumer_channel):
+    subscriber = auth_subscriber(consumer_channel, persistent=True)
+    authenticate(subscriber, consumer_channel, [auth_response(DEVICE_ID)])
+    authenticate(subscriber, consumer_channel, [auth_response("aaaaaaaaaaaaaaaa"), auth_response(DEVICE_ID)])
+    assert consumer_channel.declared == [f"device_auth_queue_{DEVICE_ID}"]
+    assert consumer_channel.deleted == []
+    assert len(consumer_channel.consumers) == 1
+    assert consumer_channel.acked == [1, 3]
+    assert consumer_channel.nacked == [2]
+    assert consumer_channel.cancelled == 0
+
+
+def test_given_persistent_subscriber_when_unsubscribe_then_removes_consumer_and_queue(consumer_channel):
+    subscriber = auth_subscriber(consumer_channel, persistent=True)
+    authenticate(subscriber, consumer_channel, [auth_response(DEVICE_ID)])
+    subscriber.unsubscribe()
+    assert consumer_channel.consumers == {}
+    assert consumer_channel.deleted == [f"device_auth_queue_{DEVICE_ID}"]
+
+
+def test_given_default_subscriber_then_declares_and_deletes_queue_per_operation(consumer_channel):
+    subscriber = auth_subscriber(consumer_channel, persistent=False)
+    authenticate(subscriber, consumer_channel, [auth_response(DEVICE_ID)])
+    authenticate(subscriber, consumer_channel, [auth_response(DEVICE_ID)])
+    assert len(consumer_channel.declared) == 2
+    assert len(consumer_channel.deleted) == 2
+    assert consumer_channel.cancelled == 2
+
+
+def test_given_long_lived_consumer_then_reuses_queue_and_consumer_across_operations(consumer_channel):
+    subscriber = auth_subscriber(consumer_channel, persistent=False)
+    subscriber.start_consuming()
+    authenticate(subscriber, consumer_channel, [auth_response(DEVICE_ID)])
+    authenticate(subscriber, consumer_channel, [auth_response(DEVICE_ID)])
+    assert subscriber.is_consuming
+    assert consumer_channel.declared == [f"device_auth_queue_{DEVICE_ID}"]
+    assert consumer_channel.deleted == []
+    assert len(consumer_channel.consumers) == 1
+    assert consumer_channel.cancelled == 0
+
+
+def test_given_long_lived_consumer_when_stop_consuming_then_removes_consumer_and_queue(consumer_channel):
+    subscriber = auth_subscriber(consumer_channel, persistent=False)
+    subscriber.start_consuming()
+    authenticate(subscriber, consumer_channel, [auth_response(DEVICE_ID)])
+    subscriber.stop_consuming()
+    assert not subscriber.is_consuming
+    assert consumer_channel.consumers == {}
+    assert consumer_channel.deleted == [f"device_auth_queue_{DEVICE_ID}"]
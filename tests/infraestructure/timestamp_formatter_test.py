@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from knot_protocol.domain.boundary.output.DTO.data_point import DataPointDTO
+from knot_protocol.domain.boundary.output.DTO.data_point_columns import \
+    DataPointColumnsFactory
+from knot_protocol.domain.boundary.output.DTO.publishing_data_dto import \
+    PublishingData
+from knot_protocol.infrastructure.adapter.output.DTO.data_points_encoder import \
+    DataPointsEncoder
+from knot_protocol.infrastructure.adapter.output.DTO.device_schema import (
+    DataPointSchema, DataPointsSchema)
+from knot_protocol.infrastructure.adapter.output.DTO.timestamp_formatter import \
+    TimestampFormatter
+
+
+@pytest.mark.parametrize("timestamp", [0, 1674303300, 1674303300.0, 1674303300.123456, 1674303300.5, 1674303300.9999999])
+def test_given_epoch_timestamp_then_format_like_utc_datetime(timestamp):
+    expected = str(datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None))
+    assert TimestampFormatter().format(timestamp) == expected
+
+
+def test_given_string_timestamp_then_keep_it():
+    assert TimestampFormatter().format("2023-01-21 12:15:00") == "2023-01-21 12:15:00"
+
+
+def test_given_cache_size_then_prefix_cache_is_bounded():
+    formatter = TimestampFormatter(cache_size=2)
+    formatted = [formatter.format(1674303300 + seconds + 0.25) for seconds in range(5)]
+    assert formatted[-1] == "2023-01-21 12:15:04.250000"
+    assert formatter.format(1674303300.25) == formatted[0]
+
+
+def test_given_numeric_timestamps_then_encoder_matches_marshmallow(test_schema):
+    data = PublishingData(
+        id="1964a231a4d14173",
+        data=[
+            DataPointDTO(sensor_id=1, value=42, timestamp=1674303300.123456),
+            DataPointDTO(sensor_id=1, value=43, timestamp=1674303301)])
+    encoded = DataPointsEncoder(config=[test_schema]).dumps(data)
+    assert encoded == DataPointsSchema().dumps(data).encode("utf-8")
+    assert b'"timestamp": "2023-01-21 12:15:00.123456"' in encoded
+
+
+def test_given_numeric_timestamp_column_then_encode_formatted_timestamps(test_schema):
+    columns = DataPointColumnsFactory.create(sensor_ids=[1, 1], values=[1.5, 2.5], timestamps=1674303300)
+    encoded = DataPointsEncoder(config=[test_schema]).encode_columns("1964a231a4d14173", columns)
+    assert encoded.count(b'"timestamp": "2023-01-21 12:15:00"') == 2
+
+
+@pytest.mark.parametrize("timestamp", [1674303300, 1674303300.5, "2023-01-21 12:15:00"])
+def test_given_numeric_or_string_timestamp_then_data_point_schema_loads_it(timestamp):
+    data_point = DataPointSchema().load({"sensorId": 1, "value": 1.5, "timestamp": timestamp})
+    assert data_point.timestamp == timestamp
+
+
+@pytest.mark.parametrize("timestamp", [True, None, []])
+def test_given_invalid_timestamp_then_data_point_schema_raises(timestamp):
+    with pytest.raises(ValidationError):
+        DataPointSchema().load({"sensorId": 1, "value": 1.5, "timestamp": timestamp})
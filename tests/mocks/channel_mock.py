@@ -0,0 +1,244 @@
+import asyncio
+
+from pika.exceptions import ConnectionClosedByBroker, StreamLostError
+from pika.frame import Method
+from pika.spec import Basic, BasicProperties
+
+
+class ConfirmChannelMock:
+    def __init__(self) -> None:
+        self.is_open = True
+        self.published = []
+        self.published_properties = []
+        self.ack_nack_callback = None
+        self.return_callback = None
+
+    def confirm_delivery(self, ack_nack_callback, callback=None):
+        self.ack_nack_callback = ack_nack_callback
+
+    def add_on_return_callback(self, callback):
+        self.return_callback = callback
+
+    def basic_publish(self, exchange, routing_key, body, properties=None, mandatory=False):
+        self.published.append(body)
+        self.published_properties.append(properties)
+
+    def ack(self, delivery_tag, multiple=False):
+        self.ack_nack_callback(Method(1, Basic.Ack(delivery_tag=delivery_tag, multiple=multiple)))
+
+    def nack(self, delivery_tag, multiple=False):
+        self.ack_nack_callback(Method(1, Basic.Nack(delivery_tag=delivery_tag, multiple=multiple)))
+
+    def return_message(self, exchange, routing_key, body, properties=None):
+        method = Basic.Return(reply_code=312, reply_text="NO_ROUTE", exchange=exchange, routing_key=routing_key)
+        self.return_callback(self, method, properties, body)
+
+
+class AsyncChannelMock:
+    def __init__(self, messages) -> None:
+        self.is_open = True
+        self.messages = messages
+        self.acked = []
+        self.nacked = []
+        self.cancelled = []
+        self.consumer_tags = []
+
+    def basic_consume(self, queue, on_message_callback):
+        loop = asyncio.get_running_loop()
+        for delivery_tag, body in enumerate(self.messages, start=1):
+            loop.call_soon(on_message_callback, self, Basic.Deliver(delivery_tag=delivery_tag), None, body)
+        consumer_tag = f"consumer_tag_{len(self.consumer_tags)}"
+        self.consumer_tags.append(consumer_tag)
+        return consumer_tag
+
+    def basic_ack(self, delivery_tag=0, multiple=False):
+        self.acked.append(delivery_tag)
+
+    def basic_nack(self, delivery_tag=0, multiple=False, requeue=True):
+        self.nacked.append(delivery_tag)
+
+    def basic_cancel(self, consumer_tag="", callback=None):
+        self.cancelled.append(consumer_tag)
+        if callback:
+            callback(None)
+
+
+class BlockingChannelMock:
+    def __init__(self) -> None:
+        self.is_open = True
+        self.prefetch_count = None
+        self.confirmed = False
+        self.exchanges = []
+        self.published = []
+        self.queues = []
+        self.consumer_tags = []
+
+    def basic_qos(self, prefetch_count=0):
+        self.prefetch_count = prefetch_count
+
+    def confirm_delivery(self):
+        self.confirmed = True
+
+    def exchange_declare(self, exchange, exchange_type, durable=False, auto_delete=False):
+        self.exchanges.append(exchange)
+
+    def basic_publish(self, exchange, routing_key, body, properties=None, mandatory=False):
+        self.published.append(body)
+
+    def queue_declare(self, queue, auto_delete=False):
+        self.queues.append(queue)
+
+    def queue_bind(self, queue, exchange, routing_key=None):
+        ...
+
+    def queue_delete(self, queue, if_unused=False, if_empty=False):
+        self.queues.remove(queue)
+
+    def basic_consume(self, queue, on_message_callback):
+        consumer_tag = f"consumer_tag_{len(self.consumer_tags)}"
+        self.consumer_tags.append(consumer_tag)
+        return consumer_tag
+
+    def basic_cancel(self, consumer_tag):
+        self.consumer_tags.remove(consumer_tag)
+
+    def close(self):
+        self.is_open = False
+
+
+class BlockingConnectionMock:
+    def __init__(self) -> None:
+        self.is_open = True
+        self.channels = []
+        self.processed_events = 0
+
+    @property
+    def is_closed(self) -> bool:
+        return not self.is_open
+
+    def channel(self):
+        channel = BlockingChannelMock()
+        channel.connection = self
+        self.channels.append(channel)
+        return channel
+
+    def process_data_events(self, time_limit=0):
+        if not self.is_open:
+            raise StreamLostError("connection lost")
+        self.processed_events += 1
+
+    def close(self):
+        self.is_open = False
+
+
+class ConsumerConnectionMock:
+    def __init__(self, channel) -> None:
+        self.channel = channel
+        self.is_open = True
+        self.is_closed = False
+
+    def process_data_events(self, time_limit=0):
+        self.channel.deliver()
+
+
+class ConsumerChannelMock:
+    def __init__(self) -> None:
+        self.is_open = True
+        self.connection = ConsumerConnectionMock(self)
+        self.messages = []
+        self.declared = []
+        self.deleted = []
+        self.acked = []
+        self.multiple_acks = []
+        self.nacked = []
+        self.consumers = {}
+        self.cancelled = 0
+        self.__delivery_tag = 0
+
+    def queue_declare(self, queue, auto_delete=False):
+        self.declared.append(queue)
+
+    def queue_bind(self, queue, exchange, routing_key=None):
+        return
+
+    def queue_delete(self, queue, if_unused=False, if_empty=False):
+        self.deleted.append(queue)
+
+    def basic_consume(self, queue, on_message_callback):
+        consumer_tag = f"consumer_{len(self.consumers)}"
+        self.consumers[consumer_tag] = on_message_callback
+        return consumer_tag
+
+    def basic_cancel(self, consumer_tag):
+        self.consumers.pop(consumer_tag)
+
+    def consume(self, queue, inactivity_timeout=None):
+        while self.messages:
+            yield self.__next_message()
+        yield None, None, None
+
+    def cancel(self):
+        self.cancelled += 1
+
+    def deliver(self):
+        while self.messages:
+            method, properties, body = self.__next_message()
+            for callback in self.consumers.values():
+                callback(self, method, properties, body)
+
+    def basic_ack(self, delivery_tag=0, multiple=False):
+        self.acked.append(delivery_tag)
+        self.multiple_acks.append(multiple)
+
+    def basic_nack(self, delivery_tag=0, multiple=False, requeue=True):
+        self.nacked.append(delivery_tag)
+
+    def __next_message(self):
+        self.__delivery_tag += 1
+        return Basic.Deliver(delivery_tag=self.__delivery_tag), None, self.messages.pop(0)
+
+
+class RPCChannelMock(ConsumerChannelMock):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bindings = []
+        self.delivered = 0
+        self.connection.process_data_events = self.process_data_events
+
+    def queue_bind(self, queue, exchange, routing_key=None):
+        self.bindings.append(routing_key)
+
+    def reply(self, routing_key, body, correlation_id=None):
+        self.messages.append((routing_key, BasicProperties(correlation_id=correlation_id), body))
+
+    def process_data_events(self, time_limit=0):
+        while self.messages:
+            routing_key, properties, body = self.messages.pop(0)
+            self.delivered += 1
+            method = Basic.Deliver(delivery_tag=self.delivered, routing_key=routing_key)
+            for callback in list(self.consumers.values()):
+                callback(self, method, properties, body)
+
+
+class ReplyingChannelMock:
+    def __init__(self, reply_channel, response) -> None:
+        self.is_open = True
+        self.connection = ConsumerConnectionMock(self)
+        self.reply_channel = reply_channel
+        self.response = response
+        self.published = []
+
+    def basic_publish(self, exchange, routing_key, body, properties=None, mandatory=False):
+        self.published.append(properties)
+        self.reply_channel.reply(properties.reply_to, self.response, properties.correlation_id)
+
+
+class ClosedByBrokerChannelMock:
+    def __init__(self) -> None:
+        self.is_open = True
+        self.connection = BlockingConnectionMock()
+        self.attempts = 0
+
+    def basic_publish(self, exchange, routing_key, body, properties=None, mandatory=False):
+        self.attempts += 1
+        raise ConnectionClosedByBroker(320, "CONNECTION_FORCED")
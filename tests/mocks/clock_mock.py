@@ -0,0 +1,11 @@
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.waits = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def wait(self, seconds: float) -> None:
+        self.waits.append(seconds)
+        self.now += seconds
@@ -0,0 +1,59 @@
+from dataclasses import dataclass, field
+from threading import Lock, get_ident
+from time import sleep
+from typing import Any, List
+
+PROBE_LOCK = Lock()
+
+
+@dataclass
+class DeviceMock:
+    device_id: str
+    fail: bool = False
+    data: List[Any] = None
+    time_to_ready: float = None
+    published: List[Any] = field(default_factory=list)
+    stopped: bool = False
+    publishing_buffer: Any = None
+    adapters: Any = None
+    registered_id: str = None
+    onboarding_thread: int = None
+    probe: Any = None
+    published_messages: int = 0
+    published_data_points: int = 0
+
+    def start(self) -> None:
+        self.onboarding_thread = get_ident()
+        if self.probe is not None:
+            self.__probe_onboarding()
+        if self.registered_id is not None:
+            self.device_id = self.registered_id
+        if self.fail:
+            raise TimeoutError("broker did not answer")
+        self.time_to_ready = 0.01
+
+    def publish_data(self) -> None:
+        if self.publishing_buffer is None:
+            self.__publish(self.data)
+            return
+        self.publishing_buffer.append(self.data)
+
+    def flush_expired(self) -> None:
+        if self.publishing_buffer.is_full():
+            self.__publish(self.publishing_buffer.drain())
+
+    def __publish(self, data) -> None:
+        self.published.append(data)
+        self.published_messages += 1
+        self.published_data_points += len(data)
+
+    def __probe_onboarding(self) -> None:
+        with PROBE_LOCK:
+            self.probe.current += 1
+            self.probe.peak = max(self.probe.peak, self.probe.current)
+        sleep(0.01)
+        with PROBE_LOCK:
+            self.probe.current -= 1
+
+    def stop(self) -> None:
+        self.stopped = True
@@ -1,6 +1,56 @@
+from threading import Event
+
+from pika.exceptions import AMQPConnectionError
+
 from knot_protocol.domain.boundary.output.publisher import Publisher
 
 
 class PublisherMock(Publisher):
+    def __init__(self) -> None:
+        self.content = ""
+        self.published = []
+        self.channel = None
+
+    def rebind(self, channel):
+        self.channel = channel
+
+    def publish(self):
+        self.published.append(self.content)
+
+
+class ConnectionPublisherMock(Publisher):
+    def __init__(self) -> None:
+        self.content = ""
+        self.published = []
+        self.is_connected = True
+        self.fail = False
+        self.returned = set()
+
     def publish(self):
-        return
+        if self.fail:
+            raise AMQPConnectionError("broker unavailable")
+        if self.content in self.returned:
+            return False
+        self.published.append(self.content)
+        return True
+
+
+class BlockingPublisherMock(Publisher):
+    def __init__(self) -> None:
+        self.content = ""
+        self.published = []
+        self.release = Event()
+        self.channel = None
+
+    def rebind(self, channel):
+        self.channel = channel
+
+    def publish(self):
+        self.release.wait()
+        self.published.append(self.content)
+
+
+class AsyncPublisherMock(PublisherMock):
+    async def publish_async(self):
+        self.publish()
+        return True
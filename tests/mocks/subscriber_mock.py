@@ -1,4 +1,6 @@
+import asyncio
 from dataclasses import dataclass
+from threading import get_ident
 from typing import Any
 
 from knot_protocol.infrastructure.adapter.input.subscriber import AMQPCallback
@@ -12,27 +14,28 @@ from knot_protocol.domain.exceptions.device_exception import (
 @dataclass
 class ValidSchemaCallback(AMQPCallback):
     config: Any = None
+    acknowledged: bool = False
 
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         return
 
 
 class InvalidSchemaCallback(AMQPCallback):
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         raise UpdateConfigurationException()
 
 
 @dataclass
 class ValidRegisterCallback(AMQPCallback):
     token: str = ""
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         return ""
 
 
 @dataclass
 class ValidAuthCallback(AMQPCallback):
     device_id: str = ""
-    def execute(self, channel, method, properties, body, queue_name):
+    def handle(self, body):
         return ""
 
 
@@ -130,6 +133,7 @@ class ValidUpdateSchemaSubscriberMock(Subscriber):
 
     def subscribe(self):
         self.callback.config = None
+        self.callback.acknowledged = True
         return "XPTO"
 
     def unsubscribe(self):
@@ -152,3 +156,41 @@ class InvalidUpdateSchemaSubscriberMock(Subscriber):
 
     def unsubscribe(self):
         ...
+
+
+class ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self.threads = set()
+
+
+@dataclass
+class AsyncSubscriberMock(Subscriber):
+    subscriber: Subscriber
+    probe: ConcurrencyProbe
+    delay: float = 0.01
+
+    @property
+    def callback(self) -> AMQPCallback:
+        return self.subscriber.callback
+
+    async def __aenter__(self) -> None:
+        ...
+
+    async def __aexit__(self, exception_type, exception_value, exception_traceback) -> None:
+        ...
+
+    async def subscribe_async(self):
+        self.probe.threads.add(get_ident())
+        self.probe.current += 1
+        self.probe.peak = max(self.probe.peak, self.probe.current)
+        await asyncio.sleep(self.delay)
+        self.probe.current -= 1
+        self.subscriber.subscribe()
+
+    def subscribe(self):
+        raise RuntimeError("Blocking call on the event loop thread, await the coroutine instead.")
+
+    def unsubscribe(self):
+        ...